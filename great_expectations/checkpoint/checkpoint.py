@@ -3,20 +3,33 @@ import datetime
 import json
 import logging
 import os
+import queue
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Dict, List, Optional, Union
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.configurator import SimpleCheckpointConfigurator
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
-from great_expectations.checkpoint.util import get_substituted_validation_dict
+from great_expectations.checkpoint.util import (
+    get_substituted_validation_dict,
+    run_validations_concurrently,
+)
 from great_expectations.core import RunIdentifier
 from great_expectations.core.batch import Batch, BatchRequest
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.core.util import get_datetime_string_from_strftime_format
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_context.types.base import CheckpointConfig
 from great_expectations.data_context.util import substitute_all_config_variables
+from great_expectations.datasource import BaseDatasource
 from great_expectations.exceptions import CheckpointError
+from great_expectations.execution_engine.execution_engine import (
+    validate_concurrency_config,
+)
 from great_expectations.validation_operators import ActionListValidationOperator
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
@@ -26,6 +39,56 @@ from great_expectations.validator.validator import Validator
 logger = logging.getLogger(__name__)
 
 
+class _DatasourcePool:
+    """Lends the datasource of a data context, or a replica of it built from its config, to one validation at a time.
+
+    The datasource of the data context (lent as None, since it is used through the data context) is lent first, and up
+    to max_size - 1 replicas are built as concurrent validations need them, so that concurrent validations each load
+    and validate their batch on an execution engine (and database connection) of their own.
+    """
+
+    def __init__(self, data_context, datasource_name: str, max_size: int):
+        self._data_context = data_context
+        self._datasource_name = datasource_name
+        datasource = data_context.datasources.get(datasource_name)
+        execution_engine = getattr(datasource, "execution_engine", None)
+        if (
+            execution_engine is None
+            or not execution_engine.is_replicable
+            or datasource_name
+            not in data_context.project_config_with_variables_substituted.datasources
+        ):
+            max_size = 1
+        self._max_size = max_size
+        self._idle_datasources: queue.LifoQueue = queue.LifoQueue()
+        self._idle_datasources.put(None)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @contextmanager
+    def lend(self):
+        try:
+            datasource: Optional[BaseDatasource] = self._idle_datasources.get_nowait()
+        except queue.Empty:
+            datasource = self._build_replica()
+        try:
+            yield datasource
+        finally:
+            self._idle_datasources.put(datasource)
+
+    def _build_replica(self) -> BaseDatasource:
+        return self._data_context._build_datasource_from_config(
+            name=self._datasource_name,
+            config=copy.deepcopy(
+                self._data_context.project_config_with_variables_substituted.datasources[
+                    self._datasource_name
+                ]
+            ),
+        )
+
+
 class Checkpoint:
     """
     --ge-feature-maturity-info--
@@ -246,28 +309,321 @@ class Checkpoint:
 
         run_id = run_id or RunIdentifier(run_name=run_name, run_time=run_time)
 
+        substituted_validation_dicts: List[dict] = []
         for idx, validation_dict in enumerate(validations):
             try:
-                substituted_validation_dict: dict = get_substituted_validation_dict(
-                    substituted_runtime_config=substituted_runtime_config,
-                    validation_dict=validation_dict,
+                substituted_validation_dicts.append(
+                    get_substituted_validation_dict(
+                        substituted_runtime_config=substituted_runtime_config,
+                        validation_dict=validation_dict,
+                    )
+                )
+            except CheckpointError as e:
+                raise CheckpointError(
+                    f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}"
                 )
-                batch_request: BatchRequest = substituted_validation_dict.get(
+
+        has_evaluation_parameter_dependencies: List[bool] = [
+            bool(
+                self.data_context.get_expectation_suite(
+                    substituted_validation_dict["expectation_suite_name"]
+                ).get_evaluation_parameter_dependencies()
+            )
+            for substituted_validation_dict in substituted_validation_dicts
+        ]
+        # Validations sharing a batch_request are run on a single batch, and validated together when possible
+        grouped_validation_indexes: List[
+            List[int]
+        ] = self._group_validations_by_batch_request(
+            substituted_validation_dicts=substituted_validation_dicts,
+            has_evaluation_parameter_dependencies=has_evaluation_parameter_dependencies,
+        )
+        concurrency_config: Optional[dict] = None
+        if len(grouped_validation_indexes) > 0:
+            concurrency_config = validate_concurrency_config(
+                substituted_runtime_config.runtime_configuration.get(
+                    "concurrency_config"
+                )
+            )
+        run_results_by_validation: Dict[int, dict] = {}
+        # With a "concurrency_config" (e.g. {"max_workers": 8}) in the runtime_configuration, batches are validated in
+        # a thread pool while actions are run in order on the validation results, unless some suite depends on
+        # evaluation parameters stored by the actions of earlier validations. Up to "max_workers_per_datasource"
+        # (by default max_workers) batches of the same datasource are validated at a time.
+        if concurrency_config is not None and not any(
+            has_evaluation_parameter_dependencies
+        ):
+            datasource_names: List[str] = [
+                substituted_validation_dicts[validation_indexes[0]][
                     "batch_request"
+                ].datasource_name
+                for validation_indexes in grouped_validation_indexes
+            ]
+            # Batches of the same datasource are validated concurrently on replicas of that datasource, each with an
+            # execution engine (and database connection) of its own
+            datasource_pools: Dict[str, _DatasourcePool] = {
+                datasource_name: _DatasourcePool(
+                    data_context=self.data_context,
+                    datasource_name=datasource_name,
+                    max_size=concurrency_config.get(
+                        "max_workers_per_datasource", concurrency_config["max_workers"]
+                    ),
                 )
-                expectation_suite_name: str = substituted_validation_dict.get(
-                    "expectation_suite_name"
+                for datasource_name in datasource_names
+            }
+            for group_run_results_by_validation in run_validations_concurrently(
+                validations=[
+                    (
+                        datasource_name,
+                        partial(
+                            self._validate_on_pooled_datasource,
+                            datasource_pool=datasource_pools[datasource_name],
+                            validation_indexes=validation_indexes,
+                            substituted_validation_dicts=substituted_validation_dicts,
+                            run_id=run_id,
+                            result_format=result_format,
+                        ),
+                    )
+                    for datasource_name, validation_indexes in zip(
+                        datasource_names, grouped_validation_indexes
+                    )
+                ],
+                run_actions=lambda group_idx, validators_and_results: self._run_validation_actions(
+                    validation_indexes=grouped_validation_indexes[group_idx],
+                    substituted_validation_dicts=substituted_validation_dicts,
+                    validators=validators_and_results[0],
+                    validation_results=validators_and_results[1],
+                    run_id=run_id,
+                    result_format=result_format,
+                ),
+                concurrency_config=concurrency_config,
+                max_workers_by_key={
+                    datasource_name: datasource_pool.max_size
+                    for datasource_name, datasource_pool in datasource_pools.items()
+                },
+            ):
+                run_results_by_validation.update(group_run_results_by_validation)
+        else:
+            for validation_indexes in grouped_validation_indexes:
+                validators, validation_results = self._validate_on_batch(
+                    validation_indexes=validation_indexes,
+                    substituted_validation_dicts=substituted_validation_dicts,
+                    run_id=run_id,
+                    result_format=result_format,
                 )
-                action_list: list = substituted_validation_dict.get("action_list")
+                run_results_by_validation.update(
+                    self._run_validation_actions(
+                        validation_indexes=validation_indexes,
+                        substituted_validation_dicts=substituted_validation_dicts,
+                        validators=validators,
+                        validation_results=validation_results,
+                        run_id=run_id,
+                        result_format=result_format,
+                    )
+                )
+        for idx in sorted(run_results_by_validation):
+            run_results.update(run_results_by_validation[idx])
 
-                validator: Validator = self.data_context.get_validator(
-                    batch_request=batch_request,
-                    expectation_suite_name=expectation_suite_name,
+        return CheckpointResult(
+            run_id=run_id, run_results=run_results, checkpoint_config=self.config
+        )
+
+    @staticmethod
+    def _group_validations_by_batch_request(
+        substituted_validation_dicts: List[dict],
+        has_evaluation_parameter_dependencies: Optional[List[bool]] = None,
+    ) -> List[List[int]]:
+        """Return the indexes of the validations, grouped by batch_request, in the order of their first validation.
+
+        A validation whose suite has evaluation parameter dependencies is a group of its own, and ends the groups of
+        the validations before it: groups are run in order, so that it is only validated once every validation before
+        it (in the order of the checkpoint) was validated and had its actions, which may store the parameters it
+        depends on, run.
+        """
+        if has_evaluation_parameter_dependencies is None:
+            has_evaluation_parameter_dependencies = [False] * len(
+                substituted_validation_dicts
+            )
+        grouped_validation_indexes: List[List[int]] = []
+        validation_indexes_by_batch_request: Dict[tuple, List[int]] = {}
+        for idx, substituted_validation_dict in enumerate(substituted_validation_dicts):
+            if has_evaluation_parameter_dependencies[idx]:
+                grouped_validation_indexes.extend(
+                    validation_indexes_by_batch_request.values()
+                )
+                grouped_validation_indexes.append([idx])
+                validation_indexes_by_batch_request = {}
+                continue
+            batch_request: BatchRequest = substituted_validation_dict["batch_request"]
+            # The id of a batch_request only describes the type of in-memory batch_data, not the data itself
+            batch_data_id: Optional[int] = (
+                None
+                if batch_request.batch_data is None
+                else id(batch_request.batch_data)
+            )
+            validation_indexes_by_batch_request.setdefault(
+                (batch_request.id, batch_data_id), []
+            ).append(idx)
+        grouped_validation_indexes.extend(validation_indexes_by_batch_request.values())
+        return grouped_validation_indexes
+
+    def _validate_on_pooled_datasource(
+        self, datasource_pool: "_DatasourcePool", **kwargs
+    ) -> Tuple[List[Validator], List[Optional[ExpectationSuiteValidationResult]]]:
+        """Validate the validations with the given indexes (see _validate_on_batch) on a datasource lent by the pool."""
+        with datasource_pool.lend() as datasource:
+            return self._validate_on_batch(datasource=datasource, **kwargs)
+
+    def _validate_on_batch(
+        self,
+        validation_indexes: List[int],
+        substituted_validation_dicts: List[dict],
+        run_id: RunIdentifier,
+        result_format: dict,
+        datasource: Optional[BaseDatasource] = None,
+    ) -> Tuple[List[Validator], List[Optional[ExpectationSuiteValidationResult]]]:
+        """Validate the validations with the given indexes, which share a batch_request, loading their batch only once.
+
+        The suites of these validations are validated together in a single pass, so that metrics needed by more than
+        one suite are computed once. Suites with evaluation parameter dependencies (which are grouped on their own, see
+        _group_validations_by_batch_request) are left to be validated when the actions are run (their validation result
+        is None), since they may depend on the results stored by the actions of the validations before them.
+
+        The batch is loaded through the given datasource (a replica of the datasource of the batch_request), or through
+        the data context if no datasource is given.
+
+        Returns:
+            The validator of each validation, and its validation result.
+        """
+        validators: List[Validator] = []
+        for idx in validation_indexes:
+            substituted_validation_dict: dict = substituted_validation_dicts[idx]
+            try:
+                if len(validators) == 0 and datasource is None:
+                    validator: Validator = self.data_context.get_validator(
+                        batch_request=substituted_validation_dict["batch_request"],
+                        expectation_suite_name=substituted_validation_dict[
+                            "expectation_suite_name"
+                        ],
+                    )
+                elif len(validators) == 0:
+                    batch_list: List[
+                        Batch
+                    ] = datasource.get_batch_list_from_batch_request(
+                        batch_request=substituted_validation_dict["batch_request"]
+                    )
+                    if len(batch_list) != 1:
+                        raise ValueError(
+                            f"Got {len(batch_list)} batches instead of a single batch."
+                        )
+                    validator: Validator = Validator(
+                        execution_engine=datasource.execution_engine,
+                        interactive_evaluation=True,
+                        expectation_suite=self.data_context.get_expectation_suite(
+                            substituted_validation_dict["expectation_suite_name"]
+                        ),
+                        data_context=self.data_context,
+                        batches=batch_list,
+                    )
+                else:
+                    validator: Validator = Validator(
+                        execution_engine=validators[0].execution_engine,
+                        interactive_evaluation=True,
+                        expectation_suite=self.data_context.get_expectation_suite(
+                            substituted_validation_dict["expectation_suite_name"]
+                        ),
+                        data_context=self.data_context,
+                        batches=list(validators[0].batches.values()),
+                    )
+            except CheckpointError as e:
+                raise CheckpointError(
+                    f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}"
                 )
+            validators.append(validator)
+
+        validation_results: List[Optional[ExpectationSuiteValidationResult]] = [
+            None
+        ] * len(validators)
+        jointly_validated: List[int] = [
+            validator_idx
+            for validator_idx, validator in enumerate(validators)
+            if not validator._expectation_suite.get_evaluation_parameter_dependencies()
+        ]
+        if len(jointly_validated) > 0:
+            suite_validation_results: List[
+                ExpectationSuiteValidationResult
+            ] = validators[jointly_validated[0]].validate_expectation_suites(
+                expectation_suites=[
+                    validators[validator_idx].get_expectation_suite(
+                        discard_failed_expectations=False,
+                        discard_result_format_kwargs=False,
+                        discard_include_config_kwargs=False,
+                        discard_catch_exceptions_kwargs=False,
+                    )
+                    for validator_idx in jointly_validated
+                ],
+                evaluation_parameters=[
+                    substituted_validation_dicts[validation_indexes[validator_idx]].get(
+                        "evaluation_parameters"
+                    )
+                    for validator_idx in jointly_validated
+                ],
+                run_id=run_id,
+                result_format=result_format,
+            )
+            for validator_idx, suite_validation_result in zip(
+                jointly_validated, suite_validation_results
+            ):
+                validation_results[validator_idx] = suite_validation_result
+
+        return validators, validation_results
+
+    def _run_validation_actions(
+        self,
+        validation_indexes: List[int],
+        substituted_validation_dicts: List[dict],
+        validators: List[Validator],
+        validation_results: List[Optional[ExpectationSuiteValidationResult]],
+        run_id: RunIdentifier,
+        result_format: dict,
+    ) -> Dict[int, dict]:
+        """Run the actions of the validations with the given indexes on their validation results, then unload their
+        batch from its execution engine.
+
+        Returns:
+            The run_results of each validation, by validation index.
+        """
+        try:
+            return self._run_actions_on_validation_results(
+                validation_indexes=validation_indexes,
+                substituted_validation_dicts=substituted_validation_dicts,
+                validators=validators,
+                validation_results=validation_results,
+                run_id=run_id,
+                result_format=result_format,
+            )
+        finally:
+            self._unload_batches(validators=validators)
+
+    def _run_actions_on_validation_results(
+        self,
+        validation_indexes: List[int],
+        substituted_validation_dicts: List[dict],
+        validators: List[Validator],
+        validation_results: List[Optional[ExpectationSuiteValidationResult]],
+        run_id: RunIdentifier,
+        result_format: dict,
+    ) -> Dict[int, dict]:
+        run_results_by_validation: Dict[int, dict] = {}
+        for idx, validator, validation_result in zip(
+            validation_indexes, validators, validation_results
+        ):
+            substituted_validation_dict: dict = substituted_validation_dicts[idx]
+            try:
                 action_list_validation_operator: ActionListValidationOperator = (
                     ActionListValidationOperator(
                         data_context=self.data_context,
-                        action_list=action_list,
+                        action_list=substituted_validation_dict.get("action_list"),
                         result_format=result_format,
                         name=f"{self.name}-checkpoint-validation[{idx}]",
                     )
@@ -280,16 +636,28 @@ class Checkpoint:
                             "evaluation_parameters"
                         ),
                         result_format=result_format,
+                        validation_results=None
+                        if validation_result is None
+                        else [validation_result],
                     )
                 )
-                run_results.update(val_op_run_result.run_results)
+                run_results_by_validation[idx] = val_op_run_result.run_results
             except CheckpointError as e:
                 raise CheckpointError(
                     f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}"
                 )
-        return CheckpointResult(
-            run_id=run_id, run_results=run_results, checkpoint_config=self.config
-        )
+        return run_results_by_validation
+
+    @staticmethod
+    def _unload_batches(validators: List[Validator]) -> None:
+        """Unload the batches of the validators from their execution engine, releasing the resources held for them
+        (such as persisted Spark DataFrames)."""
+        for validator in validators:
+            for batch_id, batch in validator.batches.items():
+                # The batch may have been loaded again since, for a later (possibly concurrent) validation
+                validator.execution_engine.unload_batch_data_if_loaded(
+                    batch_id=batch_id, batch_data=batch.data
+                )
 
     def self_check(self, pretty_print=True) -> dict:
         # Provide visibility into parameters that Checkpoint was instantiated with.
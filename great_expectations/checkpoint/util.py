@@ -2,9 +2,12 @@ import copy
 import logging
 import smtplib
 import ssl
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import requests
 
@@ -256,3 +259,74 @@ def validate_validation_dict(validation_dict: dict):
         )
     if not validation_dict.get("action_list"):
         raise ge_exceptions.CheckpointError("validation action_list cannot be empty")
+
+
+def run_validations_concurrently(
+    validations: List[Tuple[Hashable, Callable[[], Any]]],
+    run_actions: Callable[[int, Any], Any],
+    concurrency_config: dict,
+    max_workers_by_key: Optional[Dict[Hashable, int]] = None,
+) -> List[Any]:
+    """Run validations in a thread pool, and run the actions on their results in the calling thread.
+
+    Each validation is a (key, validate) pair, where key identifies the resource the validation runs on (e.g. the
+    execution engine of its datasource). Validations with the same key are started in order, and at most
+    max_workers_by_key[key] of them (by default one, since they share the state of that resource) run at a time;
+    validations with different keys run concurrently. In all, up to the max_workers of concurrency_config validations
+    run at a time.
+
+    The actions are queued in the order of the validations: run_actions(idx, validation_result) is called for each
+    validation as soon as it and all the validations before it are done, while the remaining validations keep running,
+    so that actions are run in a deterministic order without holding up validation.
+
+    Returns:
+        The results of run_actions, in the order of the validations.
+    """
+    if max_workers_by_key is None:
+        max_workers_by_key = {}
+    validation_futures: List[Future] = [Future() for _ in validations]
+    pending_validation_indexes_by_key: OrderedDict = OrderedDict()
+    for idx, (key, _) in enumerate(validations):
+        pending_validation_indexes_by_key.setdefault(key, deque()).append(idx)
+    stopped = threading.Event()
+
+    def run_validations_for_key(pending_validation_indexes: deque):
+        while True:
+            try:
+                idx = pending_validation_indexes.popleft()
+            except IndexError:
+                return
+            if stopped.is_set():
+                validation_futures[idx].cancel()
+                continue
+            try:
+                validation_futures[idx].set_result(validations[idx][1]())
+            except Exception as e:
+                validation_futures[idx].set_exception(e)
+
+    workers_by_key: Dict[Hashable, int] = {
+        key: min(max(max_workers_by_key.get(key, 1), 1), len(validation_indexes))
+        for key, validation_indexes in pending_validation_indexes_by_key.items()
+    }
+    action_results: List[Any] = []
+    with ThreadPoolExecutor(
+        max_workers=concurrency_config["max_workers"],
+        thread_name_prefix="ge_validations",
+    ) as executor:
+        # Workers are submitted one key at a time, so that every key gets a worker before any key gets a second one
+        for worker_idx in range(max(workers_by_key.values(), default=0)):
+            for (
+                key,
+                pending_validation_indexes,
+            ) in pending_validation_indexes_by_key.items():
+                if worker_idx < workers_by_key[key]:
+                    executor.submit(run_validations_for_key, pending_validation_indexes)
+        try:
+            for idx, validation_future in enumerate(validation_futures):
+                action_results.append(run_actions(idx, validation_future.result()))
+        except BaseException:
+            # Validations that have not started yet are skipped, as they would have been if run serially
+            stopped.set()
+            raise
+
+    return action_results
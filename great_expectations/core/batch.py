@@ -246,7 +246,7 @@ class BatchRequestBase(DictDot):
             "data_asset_name": self.data_asset_name,
             "partition_request": partition_request,
         }
-        if self.batch_data:
+        if self.batch_data is not None:
             json_dict["batch_data"] = str(type(self.batch_data))
         if self.batch_spec_passthrough is not None:
             json_dict["batch_spec_passthrough"] = self.batch_spec_passthrough
@@ -2,8 +2,10 @@ import copy
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from functools import lru_cache
 
 from pyparsing import (
     CaselessKeyword,
@@ -26,6 +28,9 @@ from great_expectations.exceptions import EvaluationParameterError
 logger = logging.getLogger(__name__)
 _epsilon = 1e-12
 
+# The number of distinct parameter expressions whose parse results are kept
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 1024
+
 
 class EvaluationParameterParser:
     """
@@ -208,37 +213,68 @@ def build_evaluation_parameters(
 
 
 expr = EvaluationParameterParser()
+# The parse actions of the shared parser push onto its stack, so that parsing must not be interleaved between threads
+_expr_lock = threading.Lock()
 
+# The result of parsing a parameter expression: its parsed tokens and expression stack, or the message, line and column
+# of the parse error
+ParsedEvaluationParameterExpression = namedtuple(
+    "ParsedEvaluationParameterExpression", ["tokens", "expr_stack", "error"]
+)
 
-def find_evaluation_parameter_dependencies(parameter_expression):
-    """Parse a parameter expression to identify dependencies including GE URNs.
 
-    Args:
-        parameter_expression: the parameter to parse
+def _parse_evaluation_parameter_expression_uncached(
+    parameter_expression,
+) -> ParsedEvaluationParameterExpression:
+    with _expr_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        try:
+            tokens = parser.parseString(parameter_expression, parseAll=True)
+        except ParseException as err:
+            return ParsedEvaluationParameterExpression(
+                tokens=None, expr_stack=None, error=(str(err), err.line, err.column)
+            )
+        return ParsedEvaluationParameterExpression(
+            tokens=tuple(tokens), expr_stack=tuple(expr.exprStack), error=None
+        )
 
-    Returns:
-        a dictionary including:
-          - "urns": set of strings that are valid GE URN objects
-          - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
+_parse_evaluation_parameter_expression_cached = lru_cache(
+    maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE
+)(_parse_evaluation_parameter_expression_uncached)
+
+
+def parse_evaluation_parameter_expression(
+    parameter_expression,
+) -> ParsedEvaluationParameterExpression:
+    """Parse a parameter expression into its tokens and expression stack.
+
+    Parse results are cached by expression, so that each distinct expression is only parsed once; the expression stack
+    is a tuple, and is copied by evaluation before values are substituted into it.
     """
-    expr = EvaluationParameterParser()
+    if not isinstance(parameter_expression, str):
+        # Raises the same errors as parsing always has, without requiring the expression to be hashable
+        return _parse_evaluation_parameter_expression_uncached(parameter_expression)
+    return _parse_evaluation_parameter_expression_cached(parameter_expression)
 
-    dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
+
+def _find_evaluation_parameter_dependencies_uncached(parameter_expression):
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
-        )
+        parsed_expression = parse_evaluation_parameter_expression(parameter_expression)
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
+    if parsed_expression.error is not None:
+        err_str, err_line, err_col = parsed_expression.error
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
 
-    for word in expr.exprStack:
+    urns = set()
+    other = set()
+    for word in parsed_expression.expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -259,16 +295,44 @@ def find_evaluation_parameter_dependencies(parameter_expression):
 
         try:
             _ = ge_urn.parseString(word)
-            dependencies["urns"].add(word)
+            urns.add(word)
             continue
         except ParseException:
             # This particular evaluation_parameter or operator is not a valid URN
             pass
 
         # If we got this far, it's a legitimate "other" evaluation parameter
-        dependencies["other"].add(word)
+        other.add(word)
 
-    return dependencies
+    return frozenset(urns), frozenset(other)
+
+
+_find_evaluation_parameter_dependencies_cached = lru_cache(
+    maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE
+)(_find_evaluation_parameter_dependencies_uncached)
+
+
+def find_evaluation_parameter_dependencies(parameter_expression):
+    """Parse a parameter expression to identify dependencies including GE URNs.
+
+    Args:
+        parameter_expression: the parameter to parse
+
+    Returns:
+        a dictionary including:
+          - "urns": set of strings that are valid GE URN objects
+          - "other": set of non-GE URN strings that are required to evaluate the parameter expression
+
+    """
+    if isinstance(parameter_expression, str):
+        urns, other = _find_evaluation_parameter_dependencies_cached(
+            parameter_expression
+        )
+    else:
+        urns, other = _find_evaluation_parameter_dependencies_uncached(
+            parameter_expression
+        )
+    return {"urns": set(urns), "other": set(other)}
 
 
 def parse_evaluation_parameter(
@@ -292,12 +356,11 @@ def parse_evaluation_parameter(
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+    parsed_expression = parse_evaluation_parameter_expression(parameter_expression)
+    if parsed_expression.error is None:
+        L = parsed_expression.tokens
+    else:
+        L = ["Parse Failure", parameter_expression, parsed_expression.error]
 
     if len(L) == 1 and L[0] not in evaluation_parameters:
         # In this special case there were no operations to find, so only one value, but we don't have something to
@@ -333,9 +396,13 @@ def parse_evaluation_parameter(
         return evaluation_parameters[L[0]]
 
     elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
-            if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+        # Evaluate a copy of the cached stack, with the values of the evaluation parameters substituted
+        expr_stack = [
+            str(evaluation_parameters[ob])
+            if isinstance(ob, str) and ob in evaluation_parameters
+            else ob
+            for ob in parsed_expression.expr_stack
+        ]
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -344,7 +411,7 @@ def parse_evaluation_parameter(
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(expr_stack)
     except Exception as e:
         exception_traceback = traceback.format_exc()
         exception_message = (
@@ -880,6 +880,10 @@ class ExpectationConfiguration(SerializableDictDot):
 
     runtime_kwargs = ["result_format", "include_config", "catch_exceptions"]
 
+    # The number of modifications of the kwargs of any configuration (by patch or by evaluation parameters), so that
+    # expectation suites can tell whether their index of the expectations is still up to date
+    kwargs_modification_count = 0
+
     def __init__(self, expectation_type, kwargs, meta=None, success_on_last_run=None):
         if not isinstance(expectation_type, str):
             raise InvalidExpectationConfigurationError(
@@ -918,6 +922,7 @@ class ExpectationConfiguration(SerializableDictDot):
         self._kwargs = evaluation_args
         if len(substituted_parameters) > 0:
             self.meta["substituted_parameters"] = substituted_parameters
+            ExpectationConfiguration.kwargs_modification_count += 1
 
     def get_raw_configuration(self):
         # return configuration without substituted evaluation parameters
@@ -957,6 +962,7 @@ class ExpectationConfiguration(SerializableDictDot):
         patch = jsonpatch.JsonPatch([{"op": op, "path": path, "value": value}])
 
         patch.apply(self.kwargs, in_place=True)
+        ExpectationConfiguration.kwargs_modification_count += 1
         return self
 
     @property
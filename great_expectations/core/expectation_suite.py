@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 from copy import deepcopy
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.evaluation_parameters import (
@@ -19,6 +19,7 @@ from great_expectations.core.util import (
 )
 from great_expectations.exceptions import (
     DataContextError,
+    EvaluationParameterError,
     InvalidExpectationConfigurationError,
 )
 from great_expectations.marshmallow__shade import (
@@ -33,6 +34,73 @@ from great_expectations.types import SerializableDictDot
 logger = logging.getLogger(__name__)
 
 
+class _ExpectationList(list):
+    """A list of expectation configurations that counts its modifications, so that the ExpectationSuite owning it can
+    tell whether its index of the expectations is still up to date."""
+
+    modification_count = 0
+
+
+def _count_modifications(method):
+    def counting_method(self, *args, **kwargs):
+        self.modification_count += 1
+        return method(self, *args, **kwargs)
+
+    counting_method.__name__ = method.__name__
+    counting_method.__doc__ = method.__doc__
+    return counting_method
+
+
+for _method_name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(
+        _ExpectationList,
+        _method_name,
+        _count_modifications(getattr(list, _method_name)),
+    )
+
+
+def _make_hashable(value):
+    """Convert value to a hashable value that compares equal to the conversion of any value equal to it."""
+    if isinstance(value, dict):
+        return frozenset((key, _make_hashable(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(val) for val in value)
+    if isinstance(value, set):
+        return frozenset(_make_hashable(val) for val in value)
+    hash(value)
+    return value
+
+
+def _get_expectation_index_key(
+    expectation_configuration: ExpectationConfiguration,
+) -> Optional[Tuple[str, Any]]:
+    """Return the key of expectation_configuration in the index of an ExpectationSuite, or None if its domain kwargs
+    cannot be indexed.
+
+    Configurations matching each other for any match_type have the same expectation_type and domain kwargs, hence the
+    same key."""
+    try:
+        return (
+            expectation_configuration.expectation_type,
+            _make_hashable(expectation_configuration.get_domain_kwargs()),
+        )
+    except TypeError:
+        return None
+
+
 class ExpectationSuite(SerializableDictDot):
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -40,8 +108,21 @@ class ExpectationSuite(SerializableDictDot):
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    Expectations are indexed by expectation_type and domain kwargs, so that matching expectations are found without
+    comparing against every expectation of the suite. The index is kept up to date by the methods above, and is rebuilt
+    when the expectations list is otherwise modified, or when the kwargs of any expectation are modified with
+    ExpectationConfiguration.patch. The kwargs dict of an expectation in a suite must not be modified in place
+    otherwise, since such modifications cannot be tracked.
     """
 
+    _expectation_index: Optional[Dict[Tuple[str, Any], List[int]]] = None
+    _unindexed_expectation_indexes: Optional[List[int]] = None
+    _indexed_modification_count: int = 0
+    _indexed_kwargs_modification_count: int = 0
+    # The evaluation parameter expressions of the suite, with the dependencies computed from them
+    _evaluation_parameter_dependencies: Optional[Tuple[Tuple[Any, ...], Dict]] = None
+
     def __init__(
         self,
         expectation_suite_name,
@@ -75,6 +156,56 @@ class ExpectationSuite(SerializableDictDot):
         # We require meta information to be serializable, but do not convert until necessary
         ensure_json_serializable(meta)
         self.meta = meta
+        self._precompute_evaluation_parameter_dependencies()
+
+    @property
+    def expectations(self) -> List[ExpectationConfiguration]:
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations: List[ExpectationConfiguration]):
+        self._expectations = _ExpectationList(expectations)
+        self._expectation_index = None
+
+    def __getstate__(self):
+        # The index is rebuilt when needed, rather than copied along with the suite
+        state = self.__dict__.copy()
+        state.pop("_expectation_index", None)
+        state.pop("_unindexed_expectation_indexes", None)
+        state.pop("_evaluation_parameter_dependencies", None)
+        return state
+
+    def _is_expectation_index_current(self) -> bool:
+        return (
+            self._expectation_index is not None
+            and self._indexed_modification_count
+            == self._expectations.modification_count
+            and self._indexed_kwargs_modification_count
+            == ExpectationConfiguration.kwargs_modification_count
+        )
+
+    def _get_expectation_index(
+        self,
+    ) -> Tuple[Dict[Tuple[str, Any], List[int]], List[int]]:
+        if not self._is_expectation_index_current():
+            self._expectation_index = {}
+            self._unindexed_expectation_indexes = []
+            for idx, expectation in enumerate(self._expectations):
+                self._add_to_expectation_index(idx, expectation)
+            self._indexed_modification_count = self._expectations.modification_count
+            self._indexed_kwargs_modification_count = (
+                ExpectationConfiguration.kwargs_modification_count
+            )
+        return self._expectation_index, self._unindexed_expectation_indexes
+
+    def _add_to_expectation_index(
+        self, idx: int, expectation_configuration: ExpectationConfiguration
+    ):
+        key = _get_expectation_index_key(expectation_configuration)
+        if key is None:
+            self._unindexed_expectation_indexes.append(idx)
+        else:
+            self._expectation_index.setdefault(key, []).append(idx)
 
     def add_citation(
         self,
@@ -167,14 +298,43 @@ class ExpectationSuite(SerializableDictDot):
         myself["meta"] = convert_to_json_serializable(myself["meta"])
         return myself
 
+    def _get_evaluation_parameter_expressions(self) -> Tuple[Any, ...]:
+        return tuple(
+            value["$PARAMETER"]
+            for expectation in self._expectations
+            for value in expectation.kwargs.values()
+            if isinstance(value, dict) and "$PARAMETER" in value
+        )
+
+    def _precompute_evaluation_parameter_dependencies(self):
+        """Compute the evaluation parameter dependencies of a loaded suite, so that validating it and storing its
+        metrics do not parse its expressions again. A suite with invalid expressions still loads, and raises when its
+        dependencies are requested."""
+        if len(self._get_evaluation_parameter_expressions()) == 0:
+            return
+        try:
+            self.get_evaluation_parameter_dependencies()
+        except EvaluationParameterError as e:
+            logger.debug(
+                f"Unable to compute the evaluation parameter dependencies of suite {self.expectation_suite_name}: {e}"
+            )
+
     def get_evaluation_parameter_dependencies(self):
-        dependencies = {}
-        for expectation in self.expectations:
-            t = expectation.get_evaluation_parameter_dependencies()
-            nested_update(dependencies, t)
+        # Dependencies only depend on the evaluation parameter expressions of the suite, which are compared rather
+        # than tracked, since the kwargs of its expectations may be modified in place
+        expressions = self._get_evaluation_parameter_expressions()
+        if (
+            self._evaluation_parameter_dependencies is None
+            or self._evaluation_parameter_dependencies[0] != expressions
+        ):
+            dependencies = {}
+            for expectation in self.expectations:
+                t = expectation.get_evaluation_parameter_dependencies()
+                nested_update(dependencies, t)
 
-        dependencies = _deduplicate_evaluation_parameter_dependencies(dependencies)
-        return dependencies
+            dependencies = _deduplicate_evaluation_parameter_dependencies(dependencies)
+            self._evaluation_parameter_dependencies = (expressions, dependencies)
+        return deepcopy(self._evaluation_parameter_dependencies[1])
 
     def get_citations(self, sort=True, require_batch_kwargs=False):
         citations = self.meta.get("citations", [])
@@ -196,6 +356,33 @@ class ExpectationSuite(SerializableDictDot):
         """Return a list of column map expectations."""
         return [e for e in self.expectations if "column" in e.kwargs]
 
+    def get_referenced_columns(self) -> Optional[Set[str]]:
+        """Return the names of the columns whose data the expectations of this suite are evaluated on, from the column,
+        column_A, column_B and column_list kwargs of each expectation.
+
+        Returns None if the expectations may read other columns, which is the case when they use a row_condition or
+        specify their columns with evaluation parameters.
+        """
+        referenced_columns = set()
+        for expectation in self.expectations:
+            kwargs = expectation.kwargs
+            if kwargs.get("row_condition"):
+                return None
+            columns = [
+                kwargs[key]
+                for key in ["column", "column_A", "column_B"]
+                if key in kwargs
+            ]
+            if "column_list" in kwargs:
+                if not isinstance(kwargs["column_list"], list):
+                    return None
+                columns.extend(kwargs["column_list"])
+            for column in columns:
+                if not isinstance(column, str):
+                    return None
+                referenced_columns.add(column)
+        return referenced_columns
+
     @staticmethod
     def _filter_citations(citations, filter_key):
         citations_with_bk = []
@@ -220,7 +407,13 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
+        is_expectation_index_current = self._is_expectation_index_current()
         self.expectations.append(expectation_config)
+        if is_expectation_index_current:
+            self._add_to_expectation_index(
+                len(self.expectations) - 1, expectation_config
+            )
+            self._indexed_modification_count = self._expectations.modification_count
 
     def remove_expectation(
         self,
@@ -308,9 +501,23 @@ class ExpectationSuite(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
+        key = _get_expectation_index_key(expectation_configuration)
+        if key is None:
+            candidate_indexes = range(len(self.expectations))
+        else:
+            (
+                expectation_index,
+                unindexed_expectation_indexes,
+            ) = self._get_expectation_index()
+            candidate_indexes = sorted(
+                expectation_index.get(key, []) + unindexed_expectation_indexes
+            )
+
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
+        for idx in candidate_indexes:
+            if self.expectations[idx].isEquivalentTo(
+                expectation_configuration, match_type
+            ):
                 match_indexes.append(idx)
 
         return match_indexes
@@ -323,14 +530,7 @@ class ExpectationSuite(SerializableDictDot):
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -370,6 +570,8 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        # The patch may have changed the domain of the expectation
+        self._expectation_index = None
         return self.expectations[found_expectation_indexes[0]]
 
     def add_expectation(
@@ -408,9 +610,21 @@ class ExpectationSuite(SerializableDictDot):
             #   .kwargs, expectation_configuration.kwargs)
             # patch_expectation.apply(self.expectations[found_expectation_index].kwargs, in_place=True)
             if overwrite_existing:
+                is_expectation_index_current = (
+                    self._is_expectation_index_current()
+                    and _get_expectation_index_key(expectation_configuration)
+                    == _get_expectation_index_key(
+                        self.expectations[found_expectation_indexes[0]]
+                    )
+                )
                 self.expectations[
                     found_expectation_indexes[0]
                 ] = expectation_configuration
+                if is_expectation_index_current:
+                    # The replaced expectation has the same key, so the index is still up to date
+                    self._indexed_modification_count = (
+                        self._expectations.modification_count
+                    )
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
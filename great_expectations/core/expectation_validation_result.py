@@ -1,6 +1,6 @@
 import json
 import logging
-from copy import deepcopy
+from copy import copy
 
 from great_expectations.core.expectation_configuration import (
     ExpectationConfigurationSchema,
@@ -234,7 +234,8 @@ class ExpectationValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def convert_result_to_serializable(self, data, **kwargs):
-        data = deepcopy(data)
+        # convert_to_json_serializable returns new objects, so a shallow copy leaves the result being dumped untouched
+        data = copy(data)
         data.result = convert_to_json_serializable(data.result)
         return data
 
@@ -280,6 +281,8 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         )  # We require meta information to be serializable.
         self.meta = meta
         self._metrics = {}
+        self._results_index = None
+        self._indexed_results_count = 0
 
     def __eq__(self, other):
         """ExpectationSuiteValidationResult equality ignores instance identity, relying only on properties."""
@@ -303,7 +306,7 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         return json.dumps(self.to_json_dict(), indent=2)
 
     def to_json_dict(self):
-        myself = deepcopy(self)
+        myself = copy(self)
         # NOTE - JPC - 20191031: migrate to expectation-specific schemas that subclass result with properly-typed
         # schemas to get serialization all-the-way down via dump
         myself["evaluation_parameters"] = convert_to_json_serializable(
@@ -334,14 +337,12 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
             if (metric_name, metric_kwargs_id) in self._metrics:
                 return self._metrics[(metric_name, metric_kwargs_id)]
             else:
-                for result in self.results:
+                for result in self._get_results_index().get(
+                    (metric_name_parts[0], metric_kwargs_id), []
+                ):
                     try:
-                        if (
-                            metric_name_parts[0]
-                            == result.expectation_config.expectation_type
-                        ):
-                            metric_value = result.get_metric(metric_name, **kwargs)
-                            break
+                        metric_value = result.get_metric(metric_name, **kwargs)
+                        break
                     except UnavailableMetricError:
                         pass
                 if metric_value is not None:
@@ -354,6 +355,34 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
             )
         )
 
+    def _get_results_index(self):
+        """Map (expectation_type, metric_kwargs_id) to the results that can provide metrics for it.
+
+        The index is built on first use and rebuilt if results have been added or removed since.
+        """
+        if self._results_index is None or self._indexed_results_count != len(
+            self.results
+        ):
+            results_index = {}
+            for result in self.results:
+                if not result.expectation_config:
+                    continue
+                try:
+                    metric_kwargs_id = get_metric_kwargs_id(
+                        None, result.expectation_config.kwargs
+                    )
+                except TypeError:
+                    # e.g. a column kwarg that is not a string cannot identify a metric
+                    continue
+                index_key = (
+                    result.expectation_config.expectation_type,
+                    metric_kwargs_id,
+                )
+                results_index.setdefault(index_key, []).append(result)
+            self._results_index = results_index
+            self._indexed_results_count = len(self.results)
+        return self._results_index
+
 
 class ExpectationSuiteValidationResultSchema(Schema):
     success = fields.Bool()
@@ -365,7 +394,7 @@ class ExpectationSuiteValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def prepare_dump(self, data, **kwargs):
-        data = deepcopy(data)
+        data = copy(data)
         data.meta = convert_to_json_serializable(data.meta)
         return data
 
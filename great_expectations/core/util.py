@@ -1,9 +1,11 @@
 import datetime
 import decimal
+import io
 import logging
 import sys
 from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union
 from urllib.parse import urlparse
 
@@ -75,6 +77,11 @@ def convert_to_json_serializable(data):
     Warning:
         test_obj may also be converted in place.
     """
+    # The most common types are converted through a lookup on their exact type, before falling back to the checks
+    # below, which handle subclasses as well
+    converter = _JSON_SERIALIZABLE_CONVERTERS.get(type(data))
+    if converter is not None:
+        return converter(data)
 
     # If it's one of our types, we use our own conversion; this can move to full schema
     # once nesting goes all the way down
@@ -111,10 +118,7 @@ def convert_to_json_serializable(data):
         return new_list
 
     elif isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round
-        # to the number of digits for which the string representation will equal the float representation
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+        return _convert_array_to_json_serializable(data)
 
     # Note: This clause has to come after checking for np.ndarray or we get:
     #      `ValueError: The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()`
@@ -138,17 +142,7 @@ def convert_to_json_serializable(data):
         return float(round(data, sys.float_info.dig))
 
     elif isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),
-                value_name: convert_to_json_serializable(val),
-            }
-            for idx, val in data.iteritems()
-        ]
+        return _convert_series_to_json_serializable(data)
 
     elif isinstance(data, pd.DataFrame):
         return convert_to_json_serializable(data.to_dict(orient="records"))
@@ -177,6 +171,80 @@ def convert_to_json_serializable(data):
         )
 
 
+def _convert_array_to_json_serializable(data: Union[np.ndarray, pd.Index]) -> list:
+    """Convert a numpy array or pandas Index to a list, converting its values in bulk when they are numbers."""
+    if isinstance(data, pd.Index):
+        if not isinstance(data.dtype, np.dtype) or data.dtype.kind not in "biuf":
+            return [convert_to_json_serializable(x) for x in data.tolist()]
+        data = data.to_numpy()
+    if data.ndim == 1 and data.dtype.kind in "biu":
+        return data.tolist()
+    if data.ndim == 1 and data.dtype.kind == "f":
+        values = data.tolist()
+        if np.isnan(data).any():
+            return [None if value != value else value for value in values]
+        return values
+    # If we have an array or index, convert it first to a list--causing coercion to float--and then round
+    # to the number of digits for which the string representation will equal the float representation
+    return [convert_to_json_serializable(x) for x in data.tolist()]
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> list:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    if isinstance(data.dtype, np.dtype) and data.dtype.kind in "biuf":
+        values = _convert_array_to_json_serializable(data.to_numpy())
+    else:
+        values = [convert_to_json_serializable(value) for value in data]
+    return [
+        {index_name: idx, value_name: val}
+        for idx, val in zip(_convert_array_to_json_serializable(data.index), values)
+    ]
+
+
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    return None if data != data else data
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {
+        str(key): convert_to_json_serializable(value) for key, value in data.items()
+    }
+
+
+def _convert_collection_to_json_serializable(data: Union[list, tuple, set]) -> list:
+    return [convert_to_json_serializable(value) for value in data]
+
+
+def _return_unchanged(data):
+    return data
+
+
+_JSON_SERIALIZABLE_CONVERTERS = {
+    str: _return_unchanged,
+    int: _return_unchanged,
+    bool: _return_unchanged,
+    type(None): _return_unchanged,
+    float: _convert_float_to_json_serializable,
+    np.float64: _convert_float_to_json_serializable,
+    np.int64: int,
+    np.int32: int,
+    np.bool_: bool,
+    dict: _convert_dict_to_json_serializable,
+    OrderedDict: _convert_dict_to_json_serializable,
+    list: _convert_collection_to_json_serializable,
+    tuple: _convert_collection_to_json_serializable,
+    set: _convert_collection_to_json_serializable,
+    np.ndarray: _convert_array_to_json_serializable,
+    pd.Series: _convert_series_to_json_serializable,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+}
+
+
 def ensure_json_serializable(data):
     """
     Helper function to convert an object to one that is json serializable
@@ -403,3 +471,104 @@ class S3Url:
 def sniff_s3_compression(s3_url: S3Url) -> str:
     """Attempts to get read_csv compression from s3_url"""
     return _SUFFIX_TO_PD_KWARG.get(s3_url.suffix, "infer")
+
+
+# Size of the byte ranges requested by S3ObjectReader; larger reads are split into parts of this size fetched in parallel
+DEFAULT_S3_READ_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_S3_READ_MAX_WORKERS = 8
+
+
+class S3ObjectReader(io.RawIOBase):
+    """A read-only, seekable file object over an S3 object, which fetches the bytes it is asked for with ranged GETs.
+
+    Readers that seek (such as Parquet readers, which read the footer and then only the column chunks they need) never
+    download the rest of the object. Reads larger than part_size are split into ranges fetched in parallel by up to
+    max_workers threads and written directly into the caller's buffer. Wrap the reader in an io.BufferedReader when the
+    consumer makes many small reads.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        s3_url: S3Url,
+        part_size: int = DEFAULT_S3_READ_PART_SIZE,
+        max_workers: int = DEFAULT_S3_READ_MAX_WORKERS,
+    ):
+        super().__init__()
+        self._s3_client = s3_client
+        self._bucket = s3_url.bucket
+        self._key = s3_url.key
+        self._part_size = part_size
+        self._max_workers = max_workers
+        self._size = s3_client.head_object(Bucket=self._bucket, Key=self._key)[
+            "ContentLength"
+        ]
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        self._fetch_into(memoryview(buffer).cast("B"), self._position, end)
+        read = end - self._position
+        self._position = end
+        return read
+
+    def readall(self) -> bytes:
+        buffer = bytearray(max(self._size - self._position, 0))
+        read = self.readinto(buffer)
+        return bytes(buffer[:read])
+
+    def _fetch_into(self, buffer: memoryview, start: int, end: int) -> None:
+        ranges = [
+            (range_start, min(range_start + self._part_size, end))
+            for range_start in range(start, end, self._part_size)
+        ]
+
+        def fetch_range(byte_range):
+            range_start, range_end = byte_range
+            body = self._s3_client.get_object(
+                Bucket=self._bucket,
+                Key=self._key,
+                Range=f"bytes={range_start}-{range_end - 1}",
+            )["Body"]
+            buffer[range_start - start : range_end - start] = body.read()
+
+        if len(ranges) == 1:
+            fetch_range(ranges[0])
+            return
+        logger.debug(
+            f"Fetching {end - start} bytes of s3 object {self._bucket}/{self._key} in {len(ranges)} ranges"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(ranges))
+        ) as executor:
+            # Consuming the results re-raises any error from fetching a range
+            list(executor.map(fetch_range, ranges))
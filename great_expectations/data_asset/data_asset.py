@@ -908,6 +908,10 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            self._prepare_expectations_for_validation(
+                expectations_to_evaluate, runtime_evaluation_parameters
+            )
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -1020,6 +1024,11 @@ class DataAsset:
             )
         return result
 
+    def _prepare_expectations_for_validation(self, expectations, evaluation_parameters):
+        """Called by validate before the given expectations are evaluated, so that subclasses can prepare for them
+        (for example by computing what they need in fewer queries)."""
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
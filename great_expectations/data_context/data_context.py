@@ -1519,21 +1519,12 @@ class BaseDataContext:
                 partition_request = PartitionRequest(partition_request)
 
             if batch_spec_passthrough is None:
-                batch_spec_passthrough = {}
-                if sampling_method is not None:
-                    sampling_params: dict = {
-                        "sampling_method": sampling_method,
-                    }
-                    if sampling_kwargs is not None:
-                        sampling_params["sampling_kwargs"] = sampling_kwargs
-                    batch_spec_passthrough.update(sampling_params)
-                if splitter_method is not None:
-                    splitter_params: dict = {
-                        "splitter_method": splitter_method,
-                    }
-                    if splitter_kwargs is not None:
-                        splitter_params["splitter_kwargs"] = splitter_kwargs
-                    batch_spec_passthrough.update(splitter_params)
+                batch_spec_passthrough = self._get_batch_spec_passthrough(
+                    sampling_method=sampling_method,
+                    sampling_kwargs=sampling_kwargs,
+                    splitter_method=splitter_method,
+                    splitter_kwargs=splitter_kwargs,
+                )
 
             batch_request: BatchRequest = BatchRequest(
                 datasource_name=datasource_name,
@@ -1547,6 +1538,30 @@ class BaseDataContext:
                 batch_request=batch_request
             )
 
+    @staticmethod
+    def _get_batch_spec_passthrough(
+        sampling_method: Optional[str] = None,
+        sampling_kwargs: Optional[dict] = None,
+        splitter_method: Optional[str] = None,
+        splitter_kwargs: Optional[dict] = None,
+    ) -> dict:
+        batch_spec_passthrough = {}
+        if sampling_method is not None:
+            sampling_params: dict = {
+                "sampling_method": sampling_method,
+            }
+            if sampling_kwargs is not None:
+                sampling_params["sampling_kwargs"] = sampling_kwargs
+            batch_spec_passthrough.update(sampling_params)
+        if splitter_method is not None:
+            splitter_params: dict = {
+                "splitter_method": splitter_method,
+            }
+            if splitter_kwargs is not None:
+                splitter_params["splitter_kwargs"] = splitter_kwargs
+            batch_spec_passthrough.update(splitter_params)
+        return batch_spec_passthrough
+
     def get_validator(
         self,
         datasource_name: Optional[str] = None,
@@ -1568,10 +1583,15 @@ class BaseDataContext:
         sampling_kwargs: Optional[dict] = None,
         splitter_method: Optional[str] = None,
         splitter_kwargs: Optional[dict] = None,
+        project_columns: bool = False,
         **kwargs,
     ) -> Validator:
         """
         This method applies only to the new (V3) Datasource schema.
+
+        If project_columns is True, only the columns referenced by the expectations of the suite are loaded into the
+        batch, when its execution engine and reader support it; table metrics still describe every column of the data.
+        Expectations on other columns cannot then be validated with the returned validator.
         """
 
         if (
@@ -1597,6 +1617,32 @@ class BaseDataContext:
                 expectation_suite_name=create_expectation_suite_with_name
             )
 
+        if project_columns:
+            projected_columns = expectation_suite.get_referenced_columns()
+            if projected_columns:
+                projection: dict = {"projected_columns": sorted(projected_columns)}
+                if batch_request is not None:
+                    batch_request = BatchRequest(
+                        datasource_name=batch_request.datasource_name,
+                        data_connector_name=batch_request.data_connector_name,
+                        data_asset_name=batch_request.data_asset_name,
+                        partition_request=batch_request.partition_request,
+                        batch_data=batch_request.batch_data,
+                        limit=batch_request.limit,
+                        batch_spec_passthrough=dict(
+                            batch_request.batch_spec_passthrough or {}, **projection
+                        ),
+                    )
+                else:
+                    if batch_spec_passthrough is None:
+                        batch_spec_passthrough = self._get_batch_spec_passthrough(
+                            sampling_method=sampling_method,
+                            sampling_kwargs=sampling_kwargs,
+                            splitter_method=splitter_method,
+                            splitter_kwargs=splitter_kwargs,
+                        )
+                    batch_spec_passthrough = dict(batch_spec_passthrough, **projection)
+
         batch: Batch = cast(
             Batch,
             self.get_batch(
@@ -2052,6 +2098,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics_to_store = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -2073,19 +2120,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
+                        metrics_to_store.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -2094,6 +2143,10 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        if len(metrics_to_store) > 0:
+            # Write all metrics at once, so that database-backed stores need a single round trip
+            self.stores[target_store_name].set_many(metrics_to_store)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
@@ -3675,7 +3728,7 @@ def _get_metric_configuration_tuples(metric_configuration, base_kwargs=None):
                 ]
         else:
             for kwarg_value in metric_configuration[kwarg_name].keys():
-                base_kwargs.update({kwarg_name: kwarg_value})
+                metric_kwargs = dict(base_kwargs, **{kwarg_name: kwarg_value})
                 if not isinstance(metric_configuration[kwarg_name][kwarg_value], list):
                     raise ge_exceptions.DataContextError(
                         "Invalid metric_configuration: each value must contain a "
@@ -3685,7 +3738,7 @@ def _get_metric_configuration_tuples(metric_configuration, base_kwargs=None):
                     kwarg_value
                 ]:
                     metric_configurations_list += _get_metric_configuration_tuples(
-                        nested_configuration, base_kwargs=base_kwargs
+                        nested_configuration, base_kwargs=metric_kwargs
                     )
 
     return metric_configurations_list
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
 import great_expectations.exceptions as ge_exceptions
@@ -18,6 +18,7 @@ try:
         and_,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -29,8 +30,18 @@ except ImportError:
     create_engine = None
 
 
+try:
+    from sqlalchemy.dialects import mysql, postgresql
+except ImportError:
+    mysql = None
+    postgresql = None
+
+
 logger = logging.getLogger(__name__)
 
+# Bound on the number of bind parameters used by a single bulk query (sqlite allows at most 999 by default)
+MAX_BIND_PARAMETERS_PER_QUERY = 900
+
 
 class DatabaseStoreBackend(StoreBackend):
     def __init__(
@@ -255,18 +266,52 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug("Error fetching value: " + str(e))
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
+    def _get_many(self, keys):
+        values_by_key = dict()
+        for keys_chunk in self._chunk_keys(keys):
+            sel = select(
+                [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+                + [self._table.columns.value]
+            ).where(or_(*[self._key_condition(key) for key in keys_chunk]))
+            try:
+                rows = self.engine.execute(sel).fetchall()
+            except SQLAlchemyError as e:
+                logger.debug("Error fetching values: " + str(e))
+                raise ge_exceptions.StoreError("Unable to fetch values for keys.")
+            for row in rows:
+                values_by_key[tuple(row[:-1])] = row[-1]
+
+        values = []
+        for key in keys:
+            if tuple(key) not in values_by_key:
+                raise ge_exceptions.StoreError(
+                    "Unable to fetch value for key: " + str(key)
+                )
+            values.append(values_by_key[tuple(key)])
+        return values
+
     def _set(self, key, value, allow_update=True):
         cols = {k: v for (k, v) in zip(self.key_columns, key)}
         cols["value"] = value
 
         if allow_update:
-            if self.has_key(key):
-                ins = (
+            upsert = self._build_upsert()
+            if upsert is not None:
+                ins = upsert.values(**cols)
+            else:
+                # Without a native upsert, update the row and only insert it if it did not exist
+                update = (
                     self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+                    .where(self._key_condition(key))
+                    .values(value=value)
                 )
-            else:
+                try:
+                    if self.engine.execute(update).rowcount > 0:
+                        return
+                except SQLAlchemyError as e:
+                    raise ge_exceptions.StoreBackendError(
+                        f"Unable to update key: got sqlalchemy error {str(e)}"
+                    )
                 ins = self._table.insert().values(**cols)
         else:
             ins = self._table.insert().values(**cols)
@@ -281,6 +326,58 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _set_many(self, key_value_pairs, allow_update=True):
+        rows = []
+        for key, value in key_value_pairs:
+            row = {k: v for (k, v) in zip(self.key_columns, key)}
+            row["value"] = value
+            rows.append(row)
+        if len(rows) == 0:
+            return
+
+        ins = self._build_upsert() if allow_update else self._table.insert()
+        if ins is None:
+            # Without a native upsert, fall back to updating or inserting each key
+            for key, value in key_value_pairs:
+                self._set(key, value, allow_update=allow_update)
+            return
+
+        try:
+            # A single executemany round trip for all rows
+            self.engine.execute(ins, rows)
+        except IntegrityError:
+            # Some keys already exist; store them one at a time to report conflicting values
+            for key, value in key_value_pairs:
+                self._set(key, value, allow_update=allow_update)
+
+    def _build_upsert(self):
+        """Build an INSERT statement that updates the value of existing keys, if the dialect supports one."""
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name == "postgresql" and postgresql is not None:
+            ins = postgresql.insert(self._table)
+            return ins.on_conflict_do_update(
+                index_elements=self.key_columns, set_={"value": ins.excluded.value}
+            )
+        elif dialect_name == "mysql" and mysql is not None:
+            ins = mysql.insert(self._table)
+            return ins.on_duplicate_key_update(value=ins.inserted.value)
+        elif dialect_name == "sqlite":
+            return self._table.insert().prefix_with("OR REPLACE")
+        return None
+
+    def _key_condition(self, key):
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            ]
+        )
+
+    def _chunk_keys(self, keys):
+        chunk_size = max(1, MAX_BIND_PARAMETERS_PER_QUERY // len(self.key_columns))
+        for i in range(0, len(keys), chunk_size):
+            yield keys[i : i + chunk_size]
+
     def _move(self):
         raise NotImplementedError
 
@@ -336,6 +433,27 @@ class DatabaseStoreBackend(StoreBackend):
         )
         return [tuple(row) for row in self.engine.execute(sel).fetchall()]
 
+    def list_items(self, prefix=()) -> List[Tuple[Tuple, Any]]:
+        """List the (key, value) pairs of all keys starting with prefix, in a single query."""
+        sel = (
+            select(
+                [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+                + [self._table.columns.value]
+            )
+            .select_from(self._table)
+            .where(
+                and_(
+                    *[
+                        getattr(self._table.columns, key_col) == val
+                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
+                    ]
+                )
+            )
+        )
+        return [
+            (tuple(row[:-1]), row[-1]) for row in self.engine.execute(sel).fetchall()
+        ]
+
     def remove_key(self, key):
         delete_statement = self._table.delete().where(
             and_(
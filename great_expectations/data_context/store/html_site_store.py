@@ -96,6 +96,8 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    SITE_MANIFEST_KEY = ("ge_site_manifest.json",)
+
     def __init__(self, store_backend=None, runtime_environment=None):
         store_backend_module_name = store_backend.get(
             "module_name", "great_expectations.data_context.store"
@@ -340,6 +342,24 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_site_manifest(self):
+        """Return the serialized manifest of an incrementally built site, or None if the site does not have one.
+
+        The manifest is kept with the static assets, so that cleaning the site also removes it.
+        """
+        static_assets_store_backend = self.store_backends["static_assets"]
+        if not static_assets_store_backend.has_key(self.SITE_MANIFEST_KEY):
+            return None
+        return static_assets_store_backend.get(self.SITE_MANIFEST_KEY)
+
+    def write_site_manifest(self, manifest):
+        return self.store_backends["static_assets"].set(
+            self.SITE_MANIFEST_KEY,
+            manifest,
+            content_encoding="utf-8",
+            content_type="application/json; charset=utf-8",
+        )
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
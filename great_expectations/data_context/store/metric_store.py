@@ -101,9 +101,12 @@ class EvaluationParameterStore(MetricStore):
 
     def get_bind_params(self, run_id):
         params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
+        # Keys and values are listed together, in a single query for backends supporting it
+        for k, value in self._store_backend.list_items(run_id.to_tuple()):
             key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
+            params[key.to_evaluation_parameter_urn()] = (
+                self.deserialize(key, value) if value else None
+            )
         return params
 
     @property
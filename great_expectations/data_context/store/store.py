@@ -133,6 +133,19 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value)
             )
 
+    def set_many(self, key_value_pairs):
+        """Set the values of several keys through a single call to the store backend."""
+        tuple_value_pairs = []
+        for key, value in key_value_pairs:
+            if key == StoreBackend.STORE_BACKEND_ID_KEY:
+                tuple_value_pairs.append((key, value))
+            else:
+                self._validate_key(key)
+                tuple_value_pairs.append(
+                    (self.key_to_tuple(key), self.serialize(key, value))
+                )
+        return self._store_backend.set_many(tuple_value_pairs)
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError, StoreError
 from great_expectations.util import filter_properties_dict
@@ -18,6 +18,9 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Implementations may also override _get_many, _set_many and list_items to provide bulk access to the persistence
+    layer; by default these loop over the single-key methods.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -122,6 +125,32 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: Iterable[Tuple], **kwargs) -> List[Any]:
+        """Get the values of several keys, in the order of the keys, using as few trips to the backend as it allows."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs: Iterable[Tuple[Tuple, Any]], **kwargs) -> None:
+        """Set the values of several keys, using as few trips to the backend as it allows."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def list_items(self, prefix=()) -> List[Tuple[Tuple, Any]]:
+        """List the (key, value) pairs of all keys starting with prefix."""
+        keys = self.list_keys(prefix)
+        return list(zip(keys, self.get_many(keys)))
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -169,6 +198,13 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_many(self, keys, **kwargs):
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        for key, value in key_value_pairs:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
@@ -5,6 +5,7 @@ import random
 import re
 import shutil
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -194,6 +195,35 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = tuple(filepath.split(os.sep))
         return new_key
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix=()):
+        """Convert a key prefix into a filepath prefix shared by the filepaths of all keys starting with it, so that
+        object store backends can list only the objects under it.
+
+        With a filepath_template, the template is used up to the first element of the key not given by the prefix.
+        The filepath prefix may match filepaths of other keys, so listed keys still need to be checked against the
+        key prefix.
+        """
+        if prefix[:1] == self.STORE_BACKEND_ID_KEY:
+            return self._convert_key_to_filepath(self.STORE_BACKEND_ID_KEY)
+        if not prefix:
+            converted_string = ""
+        elif self.filepath_template:
+            end = len(self.filepath_template)
+            for match in re.finditer(r"{(\d+)[^}]*}", self.filepath_template):
+                if int(match.group(1)) >= len(prefix):
+                    end = match.start()
+                    break
+            converted_string = self.filepath_template[:end].format(*prefix)
+        else:
+            converted_string = "/".join(prefix)
+
+        if self.filepath_prefix:
+            converted_string = self.filepath_prefix + "/" + converted_string
+        if self.platform_specific_separator:
+            converted_string = converted_string.replace("/", os.sep)
+
+        return converted_string
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -455,6 +485,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        list_keys_max_workers=None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -481,6 +512,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             boto3_options = {}
         self._boto3_options = boto3_options
         self.endpoint_url = endpoint_url
+        # If set, list_keys fans the listing out over the "subdirectories" of the listed prefix in a thread pool
+        self.list_keys_max_workers = list_keys_max_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -502,6 +535,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "list_keys_max_workers": list_keys_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -581,58 +615,107 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
-    def list_keys(self):
+    def list_keys(self, prefix=()):
+        return list(self.iter_keys(prefix=prefix))
+
+    def iter_keys(self, prefix=()):
+        """Yield the keys starting with prefix, page by page, listing only the objects under the path of the prefix."""
+        listing_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if self.prefix:
+            listing_prefix = (
+                "/".join((self.prefix, listing_prefix))
+                if listing_prefix
+                else self.prefix
+            )
+
+        if self.list_keys_max_workers:
+            s3_object_keys = self._iter_s3_object_keys_concurrently(listing_prefix)
+        else:
+            s3_object_keys = self._iter_s3_object_keys(listing_prefix)
+
+        for s3_object_key in s3_object_keys:
+            key = self._convert_s3_object_key_to_key(s3_object_key)
+            if key and key[: len(prefix)] == prefix:
+                yield key
+
+    def _iter_s3_object_keys(self, listing_prefix):
         s3 = self._create_client()
         paginator = s3.get_paginator("list_objects_v2")
 
-        if self.prefix:
-            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=self.prefix)
+        if listing_prefix:
+            page_iterator = paginator.paginate(
+                Bucket=self.bucket, Prefix=listing_prefix
+            )
         else:
             page_iterator = paginator.paginate(Bucket=self.bucket)
 
-        objects = []
-
+        is_first_page = True
         for page in page_iterator:
             current_page_contents = page.get("Contents")
             # On first iteration check for "CommonPrefixes"
             if (
                 current_page_contents is None
-                and objects == []
+                and is_first_page
                 and "CommonPrefixes" in page
             ):
                 logger.warning(
                     "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
                 )
-                objects = []
-                break
+                return
+            is_first_page = False
             if current_page_contents is not None:
-                objects.extend(current_page_contents)
+                for s3_object_info in current_page_contents:
+                    yield s3_object_info["Key"]
 
-        key_list = []
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
-            if self.platform_specific_separator:
-                s3_object_key = os.path.relpath(s3_object_key, self.prefix)
-            else:
-                if self.prefix is None:
-                    if s3_object_key.startswith("/"):
-                        s3_object_key = s3_object_key[1:]
-                else:
-                    if s3_object_key.startswith(self.prefix + "/"):
-                        s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
+    def _iter_s3_object_keys_concurrently(self, listing_prefix, max_shard_depth=3):
+        """List objects under listing_prefix by listing each of its "subdirectories" (shards) in a thread pool.
+
+        Objects found directly under a listed level are yielded as they are found; levels with a single subdirectory
+        are descended (up to max_shard_depth) so that the listing is spread over several shards.
+        """
+        s3 = self._create_client()
+        paginator = s3.get_paginator("list_objects_v2")
+
+        shard_prefixes = [listing_prefix]
+        for _ in range(max_shard_depth):
+            if len(shard_prefixes) != 1:
+                break
+            paginate_kwargs = {"Bucket": self.bucket, "Delimiter": "/"}
+            if shard_prefixes[0]:
+                paginate_kwargs["Prefix"] = shard_prefixes[0]
+            shard_prefixes = []
+            for page in paginator.paginate(**paginate_kwargs):
+                for s3_object_info in page.get("Contents", []):
+                    yield s3_object_info["Key"]
+                shard_prefixes.extend(
+                    common_prefix["Prefix"]
+                    for common_prefix in page.get("CommonPrefixes", [])
+                )
+
+        if len(shard_prefixes) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=self.list_keys_max_workers) as executor:
+            for shard_s3_object_keys in executor.map(
+                lambda shard_prefix: list(self._iter_s3_object_keys(shard_prefix)),
+                shard_prefixes,
             ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+                yield from shard_s3_object_keys
 
-        return key_list
+    def _convert_s3_object_key_to_key(self, s3_object_key):
+        if self.platform_specific_separator:
+            s3_object_key = os.path.relpath(s3_object_key, self.prefix)
+        else:
+            if self.prefix is None:
+                if s3_object_key.startswith("/"):
+                    s3_object_key = s3_object_key[1:]
+            else:
+                if s3_object_key.startswith(self.prefix + "/"):
+                    s3_object_key = s3_object_key[len(self.prefix) + 1 :]
+        if self.filepath_prefix and not s3_object_key.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not s3_object_key.endswith(self.filepath_suffix):
+            return None
+        return self._convert_filepath_to_key(s3_object_key)
 
     def get_url_for_key(self, key, protocol=None):
         location = self._create_client().get_bucket_location(Bucket=self.bucket)[
@@ -698,8 +781,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
     @property
     def boto3_options(self):
@@ -868,14 +950,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
-    def list_keys(self):
-        key_list = []
+    def list_keys(self, prefix=()):
+        return list(self.iter_keys(prefix=prefix))
 
+    def iter_keys(self, prefix=()):
+        """Yield the keys starting with prefix, page by page, listing only the blobs under the path of the prefix."""
         from google.cloud import storage
 
         gcs = storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        listing_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if self.prefix:
+            listing_prefix = (
+                "/".join((self.prefix, listing_prefix))
+                if listing_prefix
+                else self.prefix
+            )
+
+        for blob in gcs.list_blobs(self.bucket, prefix=listing_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -890,9 +982,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
-                key_list.append(key)
-        return key_list
+            if key and key[: len(prefix)] == prefix:
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -944,8 +1035,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -1023,11 +1113,21 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             )
         return az_blob_key
 
-    def list_keys(self):
-        key_list = []
+    def list_keys(self, prefix=()):
+        return list(self.iter_keys(prefix=prefix))
+
+    def iter_keys(self, prefix=()):
+        """Yield the keys starting with prefix, page by page, listing only the blobs under the path of the prefix."""
+        listing_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if self.prefix:
+            listing_prefix = (
+                "/".join((self.prefix, listing_prefix))
+                if listing_prefix
+                else self.prefix
+            )
 
         for obj in self._get_container_client().list_blobs(
-            name_starts_with=self.prefix
+            name_starts_with=listing_prefix
         ):
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(self.prefix + "/"):
@@ -1041,9 +1141,10 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
+            if prefix and (key is None or key[: len(prefix)] != prefix):
+                continue
 
-            key_list.append(key)
-        return key_list
+            yield key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1055,8 +1156,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         )
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
     def _move(self, source_key, dest_key, **kwargs):
         source_blob_path = self._convert_key_to_filepath(source_key)
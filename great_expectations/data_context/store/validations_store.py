@@ -1,3 +1,5 @@
+import base64
+import gzip
 import random
 
 from great_expectations.core.expectation_validation_result import (
@@ -19,6 +21,12 @@ from great_expectations.util import (
     verify_dynamic_loading_support,
 )
 
+# Compressions supported for serialized validation results; compressed results are base64-encoded, so that every store
+# backend can keep them as text
+VALIDATIONS_STORE_COMPRESSIONS = ("gzip",)
+# Prefix of the base64 encoding of gzip data, which no serialized JSON object starts with
+_GZIP_BASE64_PREFIX = "H4sI"
+
 
 class ValidationsStore(Store):
     """
@@ -91,7 +99,28 @@ class ValidationsStore(Store):
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        compression=None,
+    ):
+        """
+        Args:
+            compression: "gzip" to store validation results compressed, or None (the default) to store them as JSON.
+                Results are read whether they were stored compressed or not, so the compression of an existing store
+                can be changed.
+        """
+        if (
+            compression is not None
+            and compression not in VALIDATIONS_STORE_COMPRESSIONS
+        ):
+            raise ValueError(
+                f"Unsupported compression {compression} for a ValidationsStore; supported compressions are "
+                f"{', '.join(VALIDATIONS_STORE_COMPRESSIONS)}."
+            )
+        self._compression = compression
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
@@ -140,15 +169,23 @@ class ValidationsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "compression": compression,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, inplace=True)
 
     def serialize(self, key, value):
-        return self._expectationSuiteValidationResultSchema.dumps(value)
+        serialized_value = self._expectationSuiteValidationResultSchema.dumps(value)
+        if self._compression == "gzip":
+            return base64.b64encode(
+                gzip.compress(serialized_value.encode("utf-8"))
+            ).decode("ascii")
+        return serialized_value
 
     def deserialize(self, key, value):
+        if value.startswith(_GZIP_BASE64_PREFIX):
+            value = gzip.decompress(base64.b64decode(value)).decode("utf-8")
         return self._expectationSuiteValidationResultSchema.loads(value)
 
     def self_check(self, pretty_print):
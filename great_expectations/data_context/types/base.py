@@ -477,6 +477,9 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache_config = fields.Dict(required=False, allow_none=True)
+    concurrency_config = fields.Dict(required=False, allow_none=True)
+    domain_cache_max_bytes = fields.Integer(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
 
     @validates_schema
@@ -1,7 +1,9 @@
 import inspect
 import logging
+import uuid
+from collections import namedtuple
 from datetime import datetime
-from functools import lru_cache, wraps
+from functools import wraps
 from itertools import zip_longest
 from numbers import Number
 from typing import Any, List, Optional, Set, Union
@@ -19,9 +21,17 @@ from great_expectations.dataset.util import (
     is_valid_categorical_partition_object,
     is_valid_partition_object,
 )
+from great_expectations.execution_engine.metric_cache import MetricCache
 
 logger = logging.getLogger(__name__)
 
+_CACHE_MISS = object()
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# The bound on the memory held by the metric cache shared by datasets, which lives as long as the process
+DEFAULT_SHARED_METRIC_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 try:
     from sqlalchemy.sql import quoted_name
 
@@ -231,17 +241,104 @@ class Dataset(MetaDataset):
         "get_column_count_in_range",
     ]
 
+    # The metric cache shared by datasets keying their cached values on their batch, unless given their own
+    _shared_metric_cache = None
+
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance, or, when cached values are keyed on the
+        # batch, over the lifetime of the cached values.
         self.caching = kwargs.pop("caching", True)
+        # The values of hashable_getters are cached in a bounded MetricCache, either given as metric_cache or built
+        # from metric_cache_config (e.g. {"max_size": 1000, "max_bytes": 100000000}). With a metric_cache_batch_key
+        # of "batch_id" or "batch_fingerprint", cached values are keyed on the batch instead of on this dataset, so
+        # that datasets over the same batch sharing a metric cache reuse each other's values.
+        metric_cache = kwargs.pop("metric_cache", None)
+        metric_cache_config = kwargs.pop("metric_cache_config", None)
+        metric_cache_batch_key = kwargs.pop("metric_cache_batch_key", None)
+        if metric_cache_batch_key not in [None, "batch_id", "batch_fingerprint"]:
+            raise ValueError(
+                'metric_cache_batch_key must be one of None, "batch_id" or "batch_fingerprint".'
+            )
 
         super().__init__(*args, **kwargs)
 
+        self._metric_cache = None
+        self._metric_cache_batch_key = None
         if self.caching:
+            if metric_cache is None:
+                if metric_cache_config is None and metric_cache_batch_key is not None:
+                    if Dataset._shared_metric_cache is None:
+                        Dataset._shared_metric_cache = MetricCache(
+                            max_bytes=DEFAULT_SHARED_METRIC_CACHE_MAX_BYTES
+                        )
+                    metric_cache = Dataset._shared_metric_cache
+                else:
+                    metric_cache = MetricCache.from_config(metric_cache_config)
+            self._metric_cache = metric_cache
+            self._metric_cache_batch_key = self._get_metric_cache_batch_key(
+                metric_cache_batch_key
+            )
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
-                setattr(self, func, caching_func)
+                setattr(self, func, self._get_caching_getter(func))
+
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """The cache of the values of hashable_getters, or None if caching is disabled."""
+        return self._metric_cache
+
+    def invalidate_metric_cache(self) -> None:
+        """Discard the cached values of hashable_getters for this dataset."""
+        if self._metric_cache is not None:
+            self._metric_cache.invalidate(self._metric_cache_batch_key)
+
+    def _get_metric_cache_batch_key(self, metric_cache_batch_key: Optional[str]):
+        if metric_cache_batch_key == "batch_id":
+            return "batch_id", self.batch_id
+        if metric_cache_batch_key == "batch_fingerprint":
+            batch_fingerprint = self._get_batch_fingerprint()
+            if batch_fingerprint is not None:
+                return "batch_fingerprint", batch_fingerprint
+            logger.warning(
+                "Unable to fingerprint the data of this dataset; its cached values will not be shared."
+            )
+        return "dataset", str(uuid.uuid4())
+
+    def _get_batch_fingerprint(self) -> Optional[str]:
+        """Return a fingerprint of the data of this dataset, or None if it cannot be computed."""
+        return self.batch_markers.get("pandas_data_fingerprint")
+
+    def _get_caching_getter(self, func_name: str):
+        getter = getattr(self, func_name)
+        counts = {"hits": 0, "misses": 0}
+
+        @wraps(getter)
+        def caching_getter(*args, **kwargs):
+            try:
+                key = (
+                    self._metric_cache_batch_key,
+                    (func_name, args, tuple(sorted(kwargs.items()))),
+                )
+                hash(key)
+            except TypeError:
+                return getter(*args, **kwargs)
+            value = self._metric_cache.get(key, _CACHE_MISS)
+            if value is _CACHE_MISS:
+                counts["misses"] += 1
+                value = getter(*args, **kwargs)
+                self._metric_cache.set(key, value)
+            else:
+                counts["hits"] += 1
+            return value
+
+        # Mirror the statistics interface of functools.lru_cache, which was used to cache these getters before
+        caching_getter.cache_info = lambda: CacheInfo(
+            hits=counts["hits"],
+            misses=counts["misses"],
+            maxsize=self._metric_cache.max_size,
+            currsize=len(self._metric_cache),
+        )
+        return caching_getter
 
     @classmethod
     def from_dataset(cls, dataset=None):
@@ -20,6 +20,9 @@ from great_expectations.dataset.util import (
     is_valid_continuous_partition_object,
     validate_distribution_parameters,
 )
+from great_expectations.execution_engine.pandas_execution_engine import (
+    hash_pandas_dataframe,
+)
 
 from .dataset import Dataset
 
@@ -384,6 +387,8 @@ Notes:
         "_expectation_suite",
         "_config",
         "caching",
+        "_metric_cache",
+        "_metric_cache_batch_key",
         "default_expectation_args",
         "discard_subset_failing_expectations",
     ]
@@ -403,6 +408,12 @@ Notes:
     def _constructor(self):
         return self.__class__
 
+    def _get_batch_fingerprint(self):
+        batch_fingerprint = super()._get_batch_fingerprint()
+        if batch_fingerprint is None:
+            batch_fingerprint = hash_pandas_dataframe(self)
+        return batch_fingerprint
+
     def __finalize__(self, other, method=None, **kwargs):
         if isinstance(other, PandasDataset):
             self._initialize_expectations(other._expectation_suite)
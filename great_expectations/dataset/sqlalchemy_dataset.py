@@ -5,12 +5,13 @@ import uuid
 import warnings
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
@@ -19,6 +20,10 @@ from great_expectations.dataset.util import (
     get_approximate_percentile_disc_sql,
     get_sql_dialect_floating_point_infinity_value,
 )
+from great_expectations.execution_engine.sqlalchemy_metadata_catalog import (
+    DEFAULT_METADATA_CATALOG_TTL,
+    SqlAlchemyMetadataCatalog,
+)
 from great_expectations.util import import_library_module
 
 from .dataset import Dataset
@@ -26,6 +31,9 @@ from .pandas_dataset import PandasDataset
 
 logger = logging.getLogger(__name__)
 
+# The number of column map conditions whose counts are computed together in a single fused query
+MAX_FUSED_COLUMN_MAP_CONDITIONS = 50
+
 try:
     import sqlalchemy as sa
     from sqlalchemy.dialects import registry
@@ -120,7 +128,14 @@ except ImportError:
 
 
 class SqlAlchemyBatchReference:
-    def __init__(self, engine, table_name=None, schema=None, query=None):
+    def __init__(
+        self,
+        engine,
+        table_name=None,
+        schema=None,
+        query=None,
+        metadata_catalog_ttl=None,
+    ):
         self._engine = engine
         if table_name is None and query is None:
             raise ValueError("Table_name or query must be specified")
@@ -128,6 +143,7 @@ class SqlAlchemyBatchReference:
         self._table_name = table_name
         self._schema = schema
         self._query = query
+        self._metadata_catalog_ttl = metadata_catalog_ttl
 
     def get_init_kwargs(self):
         if self._table_name and self._query:
@@ -144,11 +160,18 @@ class SqlAlchemyBatchReference:
             kwargs = {"engine": self._engine, "custom_sql": self._query}
         if self._schema:
             kwargs["schema"] = self._schema
+        if self._metadata_catalog_ttl is not None:
+            kwargs["metadata_catalog_ttl"] = self._metadata_catalog_ttl
 
         return kwargs
 
 
 class MetaSqlAlchemyDataset(Dataset):
+    # While column map queries are fused during validate, the conditions of the column map expectations about to be
+    # validated are collected in _column_map_conditions, and their fused counts are kept in _column_map_counts.
+    _column_map_conditions = None
+    _column_map_counts = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -223,19 +246,39 @@ class MetaSqlAlchemyDataset(Dataset):
                     sa.literal(False), sa.literal(True), custom_op("=")
                 )
 
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
+            if self._column_map_conditions is not None:
+                # Only collect the conditions, so that their counts can be computed in fused queries
+                self._column_map_conditions.append(
+                    (expected_condition, ignore_values_condition)
                 )
-            else:
-                count_query = self._get_count_query_generic_sqlalchemy(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
+                return {"success": True}
+
+            fused_count_results: Optional[dict] = None
+            if self._column_map_counts is not None:
+                fused_count_results = self._column_map_counts.get(
+                    self._get_column_map_condition_key(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
                 )
 
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+            count_results: dict
+            if fused_count_results is not None:
+                count_results = dict(fused_count_results)
+            else:
+                count_query: Select
+                if self.sql_engine_dialect.name.lower() == "mssql":
+                    count_query = self._get_count_query_mssql(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
+                else:
+                    count_query = self._get_count_query_generic_sqlalchemy(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
+
+                count_results = dict(self.engine.execute(count_query).fetchone())
 
             # Handle case of empty table gracefully:
             if (
@@ -257,17 +300,20 @@ class MetaSqlAlchemyDataset(Dataset):
             count_results["null_count"] = int(count_results["null_count"])
             count_results["unexpected_count"] = int(count_results["unexpected_count"])
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)])
-                .select_from(self._table)
-                .where(
-                    sa.and_(
-                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
+            # Retrieve unexpected values, which are only queried for when there are some
+            unexpected_rows: list = []
+            if count_results["unexpected_count"] > 0:
+                unexpected_rows = self.engine.execute(
+                    sa.select([sa.column(column)])
+                    .select_from(self._table)
+                    .where(
+                        sa.and_(
+                            sa.not_(expected_condition),
+                            sa.not_(ignore_values_condition),
+                        )
                     )
-                )
-                .limit(unexpected_count_limit)
-            )
+                    .limit(unexpected_count_limit)
+                ).fetchall()
 
             nonnull_count: int = (
                 count_results["element_count"] - count_results["null_count"]
@@ -276,7 +322,7 @@ class MetaSqlAlchemyDataset(Dataset):
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_rows:
                     if isinstance(x[column], str):
                         col = parse(x[column])
                     else:
@@ -285,9 +331,7 @@ class MetaSqlAlchemyDataset(Dataset):
                         datetime.strftime(col, output_strftime_format)
                     )
             else:
-                maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
-                ]
+                maybe_limited_unexpected_list = [x[column] for x in unexpected_rows]
 
             success_count = nonnull_count - count_results["unexpected_count"]
             success, percent_success = self._calc_map_expectation_success(
@@ -322,9 +366,148 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._is_column_map_expectation = True
 
         return inner_wrapper
 
+    def validate(self, *args, **kwargs):
+        """Validate the data against an expectation suite; see DataAsset.validate.
+
+        If the batch_kwargs of this dataset include "fuse_column_map_queries": True, the element, null and unexpected
+        counts of all column map expectations are computed in a few fused queries before the expectations are
+        evaluated, and unexpected values are then only queried for the expectations that have some.
+        """
+        try:
+            return super().validate(*args, **kwargs)
+        finally:
+            # Fused counts are only valid for the validation they were computed for
+            self._column_map_counts = None
+
+    def _prepare_expectations_for_validation(self, expectations, evaluation_parameters):
+        self._column_map_counts = None
+        # mssql computes column map counts through a temporary table, which cannot be fused
+        if (
+            not self.batch_kwargs.get("fuse_column_map_queries")
+            or self.sql_engine_dialect.name.lower() == "mssql"
+        ):
+            return
+
+        self._column_map_conditions = []
+        try:
+            for expectation in expectations:
+                expectation_method = getattr(self, expectation.expectation_type, None)
+                if not getattr(expectation_method, "_is_column_map_expectation", False):
+                    continue
+                try:
+                    evaluation_args, _ = build_evaluation_parameters(
+                        expectation.kwargs,
+                        evaluation_parameters,
+                        self._config.get("interactive_evaluation", True),
+                        self._data_context,
+                    )
+                    evaluation_args.update(
+                        {"catch_exceptions": False, "include_config": False}
+                    )
+                    expectation_method(**evaluation_args)
+                except Exception as e:
+                    # The expectation will be evaluated on its own, and report this error then
+                    logger.debug(
+                        f"Unable to fuse the count query of {expectation.expectation_type}: {str(e)}"
+                    )
+            conditions_by_key: Dict[tuple, tuple] = {}
+            for (
+                expected_condition,
+                ignore_values_condition,
+            ) in self._column_map_conditions:
+                key: Optional[tuple] = self._get_column_map_condition_key(
+                    expected_condition=expected_condition,
+                    ignore_values_condition=ignore_values_condition,
+                )
+                if key is not None:
+                    conditions_by_key[key] = (
+                        expected_condition,
+                        ignore_values_condition,
+                    )
+        finally:
+            self._column_map_conditions = None
+
+        column_map_counts: Dict[tuple, dict] = {}
+        keys: List[tuple] = list(conditions_by_key.keys())
+        for start in range(0, len(keys), MAX_FUSED_COLUMN_MAP_CONDITIONS):
+            chunk_keys: List[tuple] = keys[
+                start : start + MAX_FUSED_COLUMN_MAP_CONDITIONS
+            ]
+            try:
+                count_results: dict = dict(
+                    self.engine.execute(
+                        self._get_fused_count_query(
+                            conditions=[conditions_by_key[key] for key in chunk_keys]
+                        )
+                    ).fetchone()
+                )
+            except Exception as e:
+                # These expectations will fall back to running their own count queries
+                logger.debug(f"Unable to run a fused column map count query: {str(e)}")
+                continue
+            for idx, key in enumerate(chunk_keys):
+                column_map_counts[key] = {
+                    "element_count": count_results["element_count"],
+                    "null_count": count_results[f"null_count_{idx}"],
+                    "unexpected_count": count_results[f"unexpected_count_{idx}"],
+                }
+        self._column_map_counts = column_map_counts
+
+    def _get_column_map_condition_key(
+        self,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> Optional[tuple]:
+        """Identify a column map condition by its compiled SQL and bound parameters.
+
+        Returns None for conditions that cannot be compiled on their own, whose counts are then never fused.
+        """
+        key = []
+        try:
+            for condition in (expected_condition, ignore_values_condition):
+                compiled = condition.compile(dialect=self.sql_engine_dialect)
+                key.append(
+                    (
+                        str(compiled),
+                        repr(sorted(compiled.params.items(), key=lambda item: item[0])),
+                    )
+                )
+        except Exception as e:
+            logger.debug(f"Unable to compile a column map condition: {str(e)}")
+            return None
+        return tuple(key)
+
+    def _get_fused_count_query(
+        self, conditions: List[Tuple[BinaryExpression, BinaryExpression]]
+    ) -> Select:
+        """Count elements once, and the null and unexpected values of each (expected, ignore_values) condition."""
+        count_columns: list = [sa.func.count().label("element_count")]
+        for idx, (expected_condition, ignore_values_condition) in enumerate(conditions):
+            count_columns += [
+                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
+                    f"null_count_{idx}"
+                ),
+                sa.func.sum(
+                    sa.case(
+                        [
+                            (
+                                sa.and_(
+                                    sa.not_(expected_condition),
+                                    sa.not_(ignore_values_condition),
+                                ),
+                                1,
+                            )
+                        ],
+                        else_=0,
+                    )
+                ).label(f"unexpected_count_{idx}"),
+            ]
+        return sa.select(count_columns).select_from(self._table)
+
     def _get_count_query_mssql(
         self,
         expected_condition: BinaryExpression,
@@ -464,6 +647,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         *args,
         **kwargs,
     ):
+        # The number of seconds the columns of tables are cached for (see SqlAlchemyMetadataCatalog)
+        metadata_catalog_ttl = kwargs.pop("metadata_catalog_ttl", None)
+        if metadata_catalog_ttl is None:
+            metadata_catalog_ttl = DEFAULT_METADATA_CATALOG_TTL
+
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
             # was used for a temp table and raising an error
@@ -583,17 +771,17 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                         )
                     )
 
-        try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
-        except KeyError:
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            self.columns = self.column_reflection_fallback()
-
-        # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
-        if len(self.columns) == 0:
-            self.columns = self.column_reflection_fallback()
+        # we will get a KeyError for temporary tables, since reflection will not find the temporary schema, and for
+        # mssql reflection doesn't throw an error but returns an empty list, so both use the fallback. The columns of
+        # the tables created for custom_sql are not cached, since each such table is only read once.
+        self.columns = SqlAlchemyMetadataCatalog(
+            self.engine, ttl=0 if custom_sql else metadata_catalog_ttl
+        ).get_columns(
+            table_name,
+            schema=schema,
+            fallback=self.column_reflection_fallback,
+            fallback_exceptions=(KeyError,),
+        )
 
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super().__init__(*args, **kwargs)
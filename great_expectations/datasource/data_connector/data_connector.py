@@ -94,7 +94,9 @@ class DataConnector:
         batch_data, batch_markers = self._execution_engine.get_batch_data_and_markers(
             batch_spec=batch_spec
         )
-        self._execution_engine.load_batch_data(batch_definition.id, batch_data)
+        self._execution_engine.load_batch_data(
+            batch_definition.id, batch_data, batch_markers=batch_markers
+        )
         return (
             batch_data,
             batch_spec,
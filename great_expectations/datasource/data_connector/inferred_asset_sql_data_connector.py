@@ -203,13 +203,12 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         system_tables: List[str] = ["sqlite_master"],  # sqlite
         include_views=True,
     ):
-        engine = self._execution_engine.engine
-        inspector = sa.inspect(engine)
+        metadata_catalog = self._execution_engine.metadata_catalog
 
         selected_schema_name = schema_name
 
         tables = []
-        for schema_name in inspector.get_schema_names():
+        for schema_name in metadata_catalog.get_schema_names():
             if (
                 ignore_information_schemas_and_system_tables
                 and schema_name in information_schemas
@@ -219,7 +218,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if selected_schema_name is not None and schema_name != selected_schema_name:
                 continue
 
-            for table_name in inspector.get_table_names(schema=schema_name):
+            for table_name in metadata_catalog.get_table_names(schema=schema_name):
 
                 if (ignore_information_schemas_and_system_tables) and (
                     table_name in system_tables
@@ -238,7 +237,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if include_views:
                 # Note: this is not implemented for bigquery
 
-                for view_name in inspector.get_view_names(schema=schema_name):
+                for view_name in metadata_catalog.get_view_names(schema=schema_name):
 
                     if (ignore_information_schemas_and_system_tables) and (
                         table_name in system_tables
@@ -226,7 +226,7 @@ class SqlAlchemyDatasource(LegacyDatasource):
             data_context=data_context,
             data_asset_type=data_asset_type,
             batch_kwargs_generators=batch_kwargs_generators,
-            **configuration_with_defaults
+            **configuration_with_defaults,
         )
 
         if credentials is not None:
@@ -234,6 +234,9 @@ class SqlAlchemyDatasource(LegacyDatasource):
         else:
             credentials = {}
 
+        # The number of seconds datasets cache the columns of tables for (see SqlAlchemyMetadataCatalog)
+        self._metadata_catalog_ttl = kwargs.pop("metadata_catalog_ttl", None)
+
         try:
             # if an engine was provided, use that
             if "engine" in kwargs:
@@ -381,6 +384,10 @@ class SqlAlchemyDatasource(LegacyDatasource):
         else:
             query_support_table_name = None
 
+        batch_reference_kwargs = {}
+        if self._metadata_catalog_ttl is not None:
+            batch_reference_kwargs["metadata_catalog_ttl"] = self._metadata_catalog_ttl
+
         if "query" in batch_kwargs:
             if "limit" in batch_kwargs or "offset" in batch_kwargs:
                 logger.warning(
@@ -398,6 +405,7 @@ class SqlAlchemyDatasource(LegacyDatasource):
                 query=query,
                 table_name=query_support_table_name,
                 schema=batch_kwargs.get("schema"),
+                **batch_reference_kwargs,
             )
         elif "table" in batch_kwargs:
             table = batch_kwargs["table"]
@@ -443,12 +451,14 @@ class SqlAlchemyDatasource(LegacyDatasource):
                     query=query,
                     table_name=query_support_table_name,
                     schema=batch_kwargs.get("schema"),
+                    **batch_reference_kwargs,
                 )
             else:
                 batch_reference = SqlAlchemyBatchReference(
                     engine=self.engine,
                     table_name=table,
                     schema=batch_kwargs.get("schema"),
+                    **batch_reference_kwargs,
                 )
         else:
             raise ValueError(
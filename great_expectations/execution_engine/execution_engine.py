@@ -1,13 +1,16 @@
 import copy
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
-from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions import GreatExpectationsError, InvalidConfigError
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -28,6 +31,49 @@ class NoOpDict:
     def update(self, value):
         return None
 
+    def get(self, key, default=None):
+        return default
+
+    def set(self, key, value):
+        return None
+
+    def invalidate(self, batch_key=None):
+        return None
+
+
+_CACHE_MISS = object()
+
+
+def validate_concurrency_config(concurrency_config: Optional[dict]) -> Optional[dict]:
+    """Check a concurrency_config (e.g. {"max_workers": 8}), as given to execution engines, validation operators and
+    checkpoints, and return a copy of it; None if no concurrency_config was given."""
+    if concurrency_config is None:
+        return None
+    concurrency_config = dict(concurrency_config)
+    pool_type = concurrency_config.get("pool_type", "thread")
+    if pool_type != "thread":
+        # Metric functions close over the execution engine and its batch data, which cannot be shared with worker
+        # processes.
+        raise InvalidConfigError(
+            f'Unsupported concurrency pool_type "{pool_type}"; only "thread" pools can share batch data with '
+            f"metric functions."
+        )
+    max_workers = concurrency_config.get("max_workers")
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise InvalidConfigError(
+            "concurrency_config requires max_workers to be a positive integer."
+        )
+    # Only used by checkpoints, which by default validate up to max_workers batches of the same datasource at a time
+    max_workers_per_datasource = concurrency_config.get("max_workers_per_datasource")
+    if max_workers_per_datasource is not None and (
+        not isinstance(max_workers_per_datasource, int)
+        or max_workers_per_datasource < 1
+    ):
+        raise InvalidConfigError(
+            "concurrency_config requires max_workers_per_datasource to be a positive integer."
+        )
+    return concurrency_config
+
 
 class BatchData:
     def __init__(self, execution_engine):
@@ -52,18 +98,25 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache_config=None,
+        concurrency_config=None,
     ):
         self.name = name
         self._validator = validator
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance, or, for batches identified by a stable
+        # batch cache key (e.g. a pandas data fingerprint), over the lifetime of the metric cache entries.
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache = {}
+            self._metric_cache = MetricCache.from_config(metric_cache_config)
         else:
             self._metric_cache = NoOpDict()
+        self._batch_cache_keys = {}
+
+        # Metrics are resolved serially unless a concurrency_config (e.g. {"max_workers": 8, "pool_type": "thread"})
+        # is provided, in which case independent value metrics ready in the same round are resolved concurrently.
+        self._concurrency_config = validate_concurrency_config(concurrency_config)
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -81,6 +134,8 @@ class ExecutionEngine(ABC):
         }
 
         self._batch_data_dict = {}
+        # Held while batches are loaded or unloaded (including by subclasses), so that they can be unloaded atomically
+        self._batch_data_lock = threading.RLock()
         if batch_data_dict is None:
             batch_data_dict = {}
         self._load_batch_data_from_dict(batch_data_dict)
@@ -94,6 +149,8 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_config": metric_cache_config,
+            "concurrency_config": concurrency_config,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -135,6 +192,33 @@ class ExecutionEngine(ABC):
     def config(self) -> dict:
         return self._config
 
+    @property
+    def concurrency_config(self) -> Optional[dict]:
+        return self._concurrency_config
+
+    @property
+    def is_replicable(self) -> bool:
+        """Whether another execution engine built from the config of this one reads the same data, so that batches may
+        be loaded and validated concurrently on replicas of it."""
+        return True
+
+    def _get_metric_executor(
+        self, batch_ids: Iterable[Optional[str]] = ()
+    ) -> Optional[Executor]:
+        """Return a new executor to resolve independent metrics of the given batches (None standing for the active
+        batch) concurrently, or None to resolve them serially. The caller shuts the executor down once done with it."""
+        if self._concurrency_config is None:
+            return None
+        return ThreadPoolExecutor(
+            max_workers=self._concurrency_config["max_workers"],
+            thread_name_prefix=f"{self.__class__.__name__}_metrics",
+        )
+
+    @property
+    def metric_cache(self):
+        """The cache of resolved metric values shared across validation runs on this execution engine."""
+        return self._metric_cache
+
     @property
     def dialect(self):
         return None
@@ -159,12 +243,95 @@ class ExecutionEngine(ABC):
     def get_batch_data_and_markers(self, batch_spec) -> Tuple[BatchData, BatchMarkers]:
         raise NotImplementedError
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
         """
         Loads the specified batch_data into the execution engine
         """
-        self._batch_data_dict[batch_id] = batch_data
-        self._active_batch_data_id = batch_id
+        with self._batch_data_lock:
+            self._batch_data_dict[batch_id] = batch_data
+            self._active_batch_data_id = batch_id
+
+            batch_cache_key = self._get_batch_cache_key(
+                batch_id=batch_id, batch_data=batch_data, batch_markers=batch_markers
+            )
+            if batch_cache_key is None:
+                # Without a stable identity for the data, metrics cached under a previous load of this batch_id may be
+                # stale, so they are discarded and metrics for this load are cached under the batch_id itself.
+                self._metric_cache.invalidate(batch_id)
+                batch_cache_key = batch_id
+            self._batch_cache_keys[batch_id] = batch_cache_key
+
+    def unload_batch_data(self, batch_id: Optional[str] = None) -> None:
+        """
+        Removes the specified batch_data, or all batch_data if batch_id is None, from the execution engine, releasing
+        the resources held for it
+        """
+        with self._batch_data_lock:
+            batch_ids = list(self._batch_data_dict) if batch_id is None else [batch_id]
+            for batch_id in batch_ids:
+                self._batch_data_dict.pop(batch_id, None)
+                self._batch_cache_keys.pop(batch_id, None)
+                if self._active_batch_data_id == batch_id:
+                    self._active_batch_data_id = None
+
+    def unload_batch_data_if_loaded(self, batch_id: str, batch_data: Any) -> bool:
+        """
+        Removes the batch_data of batch_id from the execution engine, only if batch_data is the data currently loaded
+        for it (and not the data of a later load of the same batch_id, e.g. by a concurrent validation)
+
+        Returns:
+            Whether the batch_data was unloaded
+        """
+        with self._batch_data_lock:
+            if self._batch_data_dict.get(batch_id) is not batch_data:
+                return False
+            self.unload_batch_data(batch_id)
+            return True
+
+    def _get_batch_cache_key(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> Optional[Hashable]:
+        """Return a key identifying the contents of a batch, used to share cached metrics across loads of unchanged
+        data; None if the engine cannot identify the contents of the batch beyond its batch_id."""
+        return None
+
+    @staticmethod
+    def _get_projected_columns(batch_spec: BatchSpec) -> Optional[set]:
+        """Return the columns to load for a batch_spec with "projected_columns", including the columns used by its
+        splitter and sampling methods, or None if every column is to be loaded."""
+        projected_columns = batch_spec.get("projected_columns")
+        if not projected_columns:
+            return None
+        projected_columns = set(projected_columns)
+        for method_kwargs in [
+            batch_spec.get("splitter_kwargs") or {},
+            batch_spec.get("sampling_kwargs") or {},
+        ]:
+            if method_kwargs.get("column_name") is not None:
+                projected_columns.add(method_kwargs["column_name"])
+            projected_columns.update(method_kwargs.get("column_names") or [])
+        return projected_columns
+
+    def _get_metric_cache_key(
+        self, metric: MetricConfiguration
+    ) -> Optional[Tuple[Hashable, Tuple]]:
+        batch_id = metric.metric_domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+        batch_cache_key = self._batch_cache_keys.get(batch_id)
+        if batch_cache_key is None:
+            return None
+        # batch_id is part of the batch cache key, so it is ignored here to share metrics across equivalent batches
+        return (
+            batch_cache_key,
+            (
+                metric.metric_name,
+                metric.metric_domain_kwargs.to_id(id_ignore_keys=["batch_id"]),
+                metric.metric_value_kwargs_id,
+            ),
+        )
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -194,9 +361,17 @@ class ExecutionEngine(ABC):
             metrics = dict()
 
         resolved_metrics = dict()
+        metric_cache_keys = dict()
 
         metric_fn_bundle = []
+        value_metric_fns = []
         for metric_to_resolve in metrics_to_resolve:
+            metric_cache_key = self._get_metric_cache_key(metric_to_resolve)
+            if metric_cache_key is not None:
+                cached_value = self._metric_cache.get(metric_cache_key, _CACHE_MISS)
+                if cached_value is not _CACHE_MISS:
+                    resolved_metrics[metric_to_resolve.id] = cached_value
+                    continue
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
             )
@@ -235,6 +410,7 @@ class ExecutionEngine(ABC):
                         metric_provider_kwargs,
                     )
                 )
+                metric_cache_keys[metric_to_resolve.id] = metric_cache_key
                 continue
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
@@ -254,9 +430,17 @@ class ExecutionEngine(ABC):
                     **metric_provider_kwargs
                 )
             elif metric_fn_type == MetricFunctionTypes.VALUE:
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
+                metric_bundle_entry = self._get_value_metric_bundle_entry(
+                    metric_to_resolve, metric_fn, metric_provider_kwargs
                 )
+                if metric_bundle_entry is None:
+                    value_metric_fns.append(
+                        (metric_to_resolve, metric_fn, metric_provider_kwargs)
+                    )
+                else:
+                    metric_fn_bundle.append(metric_bundle_entry)
+                # Only values are cached; partial functions are cheap to build and are bound to the current engine
+                metric_cache_keys[metric_to_resolve.id] = metric_cache_key
             else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
@@ -264,15 +448,66 @@ class ExecutionEngine(ABC):
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
+
+        executor = (
+            self._get_metric_executor(
+                batch_ids=[
+                    metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                    for metric_to_resolve, _, _ in value_metric_fns
+                ]
+            )
+            if len(value_metric_fns) > 1
+            else None
+        )
+        if executor is None:
+            for (
+                metric_to_resolve,
+                metric_fn,
+                metric_provider_kwargs,
+            ) in value_metric_fns:
+                resolved_metrics[metric_to_resolve.id] = metric_fn(
+                    **metric_provider_kwargs
+                )
+        else:
+            with executor:
+                futures = [
+                    (
+                        metric_to_resolve.id,
+                        executor.submit(metric_fn, **metric_provider_kwargs),
+                    )
+                    for metric_to_resolve, metric_fn, metric_provider_kwargs in value_metric_fns
+                ]
+                for metric_id, future in futures:
+                    resolved_metrics[metric_id] = future.result()
+
         if len(metric_fn_bundle) > 0:
             resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
 
+        for metric_id, metric_cache_key in metric_cache_keys.items():
+            if metric_cache_key is not None and metric_id in resolved_metrics:
+                self._metric_cache.set(metric_cache_key, resolved_metrics[metric_id])
+
         return resolved_metrics
 
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    def _get_value_metric_bundle_entry(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn,
+        metric_provider_kwargs: dict,
+    ) -> Optional[tuple]:
+        """Optionally convert a value metric into an entry of the metric bundle passed to resolve_metric_bundle,
+        for engines that can compute several such metrics in a single trip to the compute engine.
+
+        Returns:
+            None to resolve the metric on its own, or a tuple (metric_to_resolve, metric_fn, compute_domain_kwargs,
+            accessor_domain_kwargs, metric_provider_kwargs) in the form used for aggregate partial functions.
+        """
+        return None
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
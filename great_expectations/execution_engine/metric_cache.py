@@ -0,0 +1,294 @@
+import copy
+import datetime
+import decimal
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRIC_CACHE_MAX_SIZE = 10000
+
+
+class MetricCache:
+    """An LRU cache of resolved metric values, keyed by (batch_key, metric_id).
+
+    The batch_key identifies the data a metric was computed on (for example a pandas data fingerprint, or a batch_id
+    for data whose identity is fully described by its batch definition), so that metrics computed on unchanged data can
+    be reused across validation runs.
+
+    Entries are evicted when the cache grows past max_size entries or max_bytes (an estimate of the memory held by the
+    cached values), least recently used first, or when they are older than ttl seconds. If a persistent_store is provided, entries are also written to it and consulted on in-memory misses, which
+    allows repeated runs in separate processes to skip recomputation.
+
+    Mutable values (such as value counts) are copied when they are cached and when they are returned, so that callers
+    modifying the metric values they get do not modify the cached values; immutable values (numbers, strings, dates and
+    tuples of them), which most metrics resolve to, are neither copied nor need to be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = DEFAULT_METRIC_CACHE_MAX_SIZE,
+        ttl: Optional[float] = None,
+        persistent_store: Optional["SqliteMetricCacheStore"] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size for a MetricCache must be a positive integer.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes for a MetricCache must be a positive integer.")
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._persistent_store = persistent_store
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[dict] = None) -> "MetricCache":
+        """Build a MetricCache from an execution engine's metric_cache config.
+
+        Recognized keys are "max_size", "max_bytes", "ttl", and "sqlite_path"; if "sqlite_path" is provided, a
+        SqliteMetricCacheStore at that path is used as the persistent tier.
+        """
+        config = dict(config or {})
+        sqlite_path = config.pop("sqlite_path", None)
+        if sqlite_path is not None:
+            config["persistent_store"] = SqliteMetricCacheStore(
+                path=sqlite_path, ttl=config.get("ttl")
+            )
+        return cls(**config)
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def persistent_store(self) -> Optional["SqliteMetricCacheStore"]:
+        return self._persistent_store
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self._hits, "misses": self._misses, "size": len(self)}
+
+    @property
+    def nbytes(self) -> int:
+        """The estimated memory held by the cached values; only tracked when max_bytes is set."""
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self._get_entry(key) is not None
+
+    def get(self, key: Tuple[Hashable, Tuple], default: Any = None) -> Any:
+        entry = self._get_entry(key)
+        if entry is None:
+            if self._persistent_store is not None:
+                found, value = self._persistent_store.get(key)
+                if found:
+                    self._hits += 1
+                    self._set_entry(key, value)
+                    return _copy_value(value)
+            self._misses += 1
+            return default
+        self._hits += 1
+        return _copy_value(entry[1])
+
+    def set(self, key: Tuple[Hashable, Tuple], value: Any) -> None:
+        self._set_entry(key, _copy_value(value))
+        if self._persistent_store is not None:
+            self._persistent_store.set(key, value)
+
+    def invalidate(self, batch_key: Optional[Hashable] = None) -> None:
+        """Remove all entries for the given batch_key, or every entry if batch_key is None."""
+        if batch_key is None:
+            self._entries.clear()
+            self._bytes = 0
+        else:
+            for key in [key for key in self._entries if key[0] == batch_key]:
+                self._remove_entry(key)
+        if self._persistent_store is not None:
+            self._persistent_store.invalidate(batch_key)
+
+    def _get_entry(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._ttl is not None and time.time() - entry[0] > self._ttl:
+            self._remove_entry(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set_entry(self, key, value):
+        if key in self._entries:
+            self._remove_entry(key)
+        size = _estimate_size(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            # A value larger than the whole cache is not cached
+            return
+        self._entries[key] = (time.time(), value, size)
+        self._bytes += size
+        while (self._max_size is not None and len(self._entries) > self._max_size) or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            self._remove_entry(next(iter(self._entries)))
+
+    def _remove_entry(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+
+
+# Types of values which are returned from the cache as they are, since they cannot be modified
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    complex,
+    type(None),
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    np.generic,
+)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+def _copy_value(value: Any) -> Any:
+    if _is_immutable(value):
+        return value
+    try:
+        return copy.deepcopy(value)
+    except Exception as e:
+        logger.debug(f"Unable to copy cached metric value: {str(e)}")
+        return value
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory held by a cached value, counting the data of pandas and numpy objects."""
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(getattr(usage, "sum", lambda: usage)())
+        except Exception:
+            pass
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _estimate_size(key) + _estimate_size(item) for key, item in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+class SqliteMetricCacheStore:
+    """A persistent tier for MetricCache, storing pickled metric values in a sqlite database on disk.
+
+    Values that cannot be pickled are skipped (and will simply be recomputed by later runs).
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        self._path = path
+        self._ttl = ttl
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ge_metric_cache ("
+                "batch_key TEXT NOT NULL, "
+                "metric_id TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "value BLOB NOT NULL, "
+                "PRIMARY KEY (batch_key, metric_id))"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self._path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _serialize_key(key):
+        batch_key, metric_id = key
+        return str(batch_key), repr(metric_id)
+
+    def get(self, key) -> Tuple[bool, Any]:
+        batch_key, metric_id = self._serialize_key(key)
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT created_at, value FROM ge_metric_cache WHERE batch_key = ? AND metric_id = ?",
+                (batch_key, metric_id),
+            ).fetchone()
+        if row is None:
+            return False, None
+        created_at, value = row
+        if self._ttl is not None and time.time() - created_at > self._ttl:
+            return False, None
+        try:
+            return True, pickle.loads(value)
+        except Exception as e:
+            logger.debug(f"Unable to load cached metric {metric_id}: {str(e)}")
+            return False, None
+
+    def set(self, key, value) -> None:
+        batch_key, metric_id = self._serialize_key(key)
+        try:
+            serialized_value = pickle.dumps(value)
+        except Exception as e:
+            logger.debug(f"Unable to persist metric {metric_id}: {str(e)}")
+            return
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO ge_metric_cache (batch_key, metric_id, created_at, value) VALUES (?, ?, ?, ?)",
+                (batch_key, metric_id, time.time(), serialized_value),
+            )
+
+    def invalidate(self, batch_key: Optional[Hashable] = None) -> None:
+        with self._connect() as connection:
+            if batch_key is None:
+                connection.execute("DELETE FROM ge_metric_cache")
+            else:
+                connection.execute(
+                    "DELETE FROM ge_metric_cache WHERE batch_key = ?", (str(batch_key),)
+                )
@@ -1,13 +1,110 @@
+from typing import Callable, Iterator, List, Optional
+
+import numpy as np
 import pandas as pd
 
+import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.execution_engine.execution_engine import BatchData
 
+# Number of rows kept to approximate metrics that cannot be combined across the chunks of a PandasChunkedBatchData
+DEFAULT_CHUNK_SAMPLE_SIZE = 100000
+
 
 class PandasBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe: pd.DataFrame):
+    def __init__(
+        self,
+        execution_engine,
+        dataframe: pd.DataFrame,
+        source_schema: Optional[List[dict]] = None,
+    ):
+        """
+        Args:
+            source_schema: for a batch loaded with only some of the columns of its source, the name and type of every
+                column of the source, in order
+        """
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._source_schema = source_schema
+
+    @property
+    def dataframe(self):
+        return self._dataframe
+
+    @property
+    def source_schema(self) -> Optional[List[dict]]:
+        return self._source_schema
+
+
+class PandasChunkedBatchData(PandasBatchData):
+    """Batch data read as a stream of DataFrame chunks, for data that does not fit in memory.
+
+    chunk_loader returns a new iterator over the chunks each time it is called, so that the data can be read once for
+    every round of metrics resolved on it. While metrics are resolved, the execution engine sets dataframe to the chunk
+    being processed; outside of that, the batch has no dataframe.
+
+    Metrics which cannot be combined across chunks are approximated on a uniform random sample of at most sample_size
+    rows of the batch, drawn in a single pass over the chunks the first time it is needed.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_loader: Callable[[], Iterator[pd.DataFrame]],
+        sample_size: int = DEFAULT_CHUNK_SAMPLE_SIZE,
+        random_seed: Optional[int] = None,
+        source_schema: Optional[List[dict]] = None,
+    ):
+        super().__init__(
+            execution_engine=execution_engine,
+            dataframe=None,
+            source_schema=source_schema,
+        )
+        if not isinstance(sample_size, int) or sample_size < 1:
+            raise ValueError(
+                "chunk_sample_size for a chunked batch must be a positive integer."
+            )
+        self._chunk_loader = chunk_loader
+        self._sample_size = sample_size
+        self._random_seed = random_seed
+        self._sample = None
 
     @property
     def dataframe(self):
+        if self._dataframe is None:
+            raise ge_exceptions.ExecutionEngineError(
+                "A chunked batch does not hold a single DataFrame; its chunks are only available while the execution "
+                "engine resolves metrics."
+            )
         return self._dataframe
+
+    @property
+    def sample_size(self) -> int:
+        return self._sample_size
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        return self._chunk_loader()
+
+    def head(self, n_rows=5, *args, **kwargs):
+        for chunk in self.iter_chunks():
+            return chunk.head(n_rows)
+        return pd.DataFrame({})
+
+    def get_sample(self) -> pd.DataFrame:
+        """A uniform random sample of at most sample_size rows of the batch, in the order they appear in the data."""
+        if self._sample is None:
+            random_state = np.random.RandomState(self._random_seed)
+            sample = None
+            sample_keys = None
+            for chunk in self.iter_chunks():
+                # Keeping the rows with the smallest random keys seen so far samples the batch uniformly
+                chunk_keys = random_state.random_sample(len(chunk))
+                if sample is None:
+                    sample, sample_keys = chunk, chunk_keys
+                else:
+                    sample = pd.concat([sample, chunk])
+                    sample_keys = np.concatenate([sample_keys, chunk_keys])
+                if len(sample) > self._sample_size:
+                    kept = np.sort(np.argsort(sample_keys)[: self._sample_size])
+                    sample, sample_keys = sample.iloc[kept], sample_keys[kept]
+            self._sample = sample if sample is not None else pd.DataFrame({})
+        return self._sample
@@ -1,13 +1,17 @@
 import copy
 import datetime
 import hashlib
+import io
 import logging
 import pickle
 import random
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from functools import partial
-from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions.exceptions as ge_exceptions
@@ -17,23 +21,129 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
-from great_expectations.core.util import S3Url, sniff_s3_compression
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.util import (
+    DEFAULT_S3_READ_PART_SIZE,
+    S3ObjectReader,
+    S3Url,
+    sniff_s3_compression,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    DEFAULT_CHUNK_SAMPLE_SIZE,
+    PandasBatchData,
+    PandasChunkedBatchData,
+)
+from great_expectations.expectations.registry import get_metric_provider
 
 try:
     import boto3
 except ImportError:
     boto3 = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 from great_expectations.core.batch import BatchMarkers
 
 from ..exceptions import BatchSpecError, GreatExpectationsError, ValidationError
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from ..validator.validation_graph import MetricConfiguration
+from .execution_engine import (
+    _CACHE_MISS,
+    ExecutionEngine,
+    MetricDomainTypes,
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+# Readers which parse their input sequentially, and can read S3 objects as a stream
+STREAMING_READER_METHODS = {"read_csv", "read_table", "read_json", "read_fwf"}
+
+# Reader options selecting the columns to read, for the readers which can read a projection of the columns of a source
+PROJECTION_READER_OPTIONS = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_excel": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+}
+
+# Number of rows of text and Excel files read to infer the types of the columns that a projection does not load
+SCHEMA_INFERENCE_ROWS = 1000
+
+# Upper bound on the memory used by row_condition domains kept by PandasExecutionEngine.get_compute_domain
+DEFAULT_DOMAIN_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class PandasDomainCache:
+    """An LRU cache of the DataFrames selected by a row_condition, keyed by (batch_id, row_condition, condition_parser).
+
+    Metrics sharing a conditional domain (including the map metric helpers, which request the domain again to collect
+    unexpected values and indices) reuse one filtered DataFrame instead of re-running DataFrame.query. The cache is
+    bounded by the memory used by its DataFrames (including the values of object columns, such as strings): least
+    recently used domains are evicted past max_bytes, and a domain larger than max_bytes is never cached. A max_bytes of
+    0 disables the cache.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_DOMAIN_CACHE_MAX_BYTES):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError(
+                "domain_cache_max_bytes for a PandasExecutionEngine must be a non-negative integer."
+            )
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Tuple, data: pd.DataFrame) -> None:
+        size_bytes = int(data.memory_usage(index=True, deep=True).sum())
+        if size_bytes > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (data, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self._max_bytes:
+                _, (_, evicted_size_bytes) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size_bytes
+
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        """Remove all domains of the given batch_id, or every domain if batch_id is None."""
+        with self._lock:
+            if batch_id is None:
+                self._entries.clear()
+                self._size_bytes = 0
+                return
+            for key in [key for key in self._entries if key[0] == batch_id]:
+                self._size_bytes -= self._entries.pop(key)[1]
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """
@@ -72,6 +182,8 @@ Notes:
     recognized_batch_spec_defaults = {
         "reader_method",
         "reader_options",
+        "chunk_size",
+        "chunk_sample_size",
     }
 
     def __init__(self, *args, **kwargs):
@@ -79,6 +191,15 @@ Notes:
             "discard_subset_failing_expectations", False
         )
         boto3_options: dict = kwargs.get("boto3_options", {})
+        domain_cache_max_bytes: Optional[int] = kwargs.pop(
+            "domain_cache_max_bytes", None
+        )
+        # Created before batches in batch_data_dict are loaded, since loading a batch invalidates its domains
+        self._domain_cache = PandasDomainCache(
+            max_bytes=DEFAULT_DOMAIN_CACHE_MAX_BYTES
+            if domain_cache_max_bytes is None
+            else domain_cache_max_bytes
+        )
 
         # Try initializing boto3 client. If unsuccessful, we'll catch it when/if a S3BatchSpec is passed in.
         try:
@@ -94,12 +215,20 @@ Notes:
                 "boto3_options": boto3_options,
             }
         )
+        if domain_cache_max_bytes is not None:
+            self._config["domain_cache_max_bytes"] = domain_cache_max_bytes
+
+    @property
+    def domain_cache(self) -> PandasDomainCache:
+        return self._domain_cache
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
         elif isinstance(batch_data, PandasBatchData):
@@ -108,7 +237,23 @@ Notes:
             raise GreatExpectationsError(
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        with self._batch_data_lock:
+            self._domain_cache.invalidate(batch_id)
+            super().load_batch_data(
+                batch_id=batch_id, batch_data=batch_data, batch_markers=batch_markers
+            )
+
+    def unload_batch_data(self, batch_id: Optional[str] = None) -> None:
+        with self._batch_data_lock:
+            self._domain_cache.invalidate(batch_id)
+            super().unload_batch_data(batch_id=batch_id)
+
+    def _get_batch_cache_key(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> Optional[str]:
+        if batch_markers is None:
+            return None
+        return batch_markers.get("pandas_data_fingerprint")
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -122,7 +267,13 @@ Notes:
             }
         )
 
+        # Files read with a chunk_size are streamed in chunks of that many rows instead of being loaded in memory
+        chunk_size: Optional[int] = batch_spec.get(
+            "chunk_size", self._batch_spec_defaults.get("chunk_size")
+        )
+
         batch_data: PandasBatchData
+        source_schema: Optional[List[dict]] = None
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             if isinstance(batch_spec.batch_data, pd.DataFrame):
@@ -140,27 +291,50 @@ Notes:
                     f"""PandasExecutionEngine has been passed a S3BatchSpec,
                         but the ExecutionEngine does not have a boto3 client configured. Please check your config."""
                 )
-            s3_engine = self._s3
             s3_url = S3Url(batch_spec.path)
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options or {}
             if "compression" not in reader_options.keys():
                 reader_options["compression"] = sniff_s3_compression(s3_url)
-            s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
-            logger.debug(
-                "Fetching s3 object. Bucket: {} Key: {}".format(
-                    s3_url.bucket, s3_url.key
-                )
-            )
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+
+            def open_source():
+                return self._open_s3_object(s3_url, reader_fn, reader_options)
+
+            reader_options, source_schema = self._get_projected_reader_options(
+                batch_spec, reader_fn, reader_options, open_source
+            )
+            if chunk_size is not None:
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec,
+                        reader_fn,
+                        reader_options,
+                        open_source,
+                        source_schema,
+                    ),
+                    batch_markers,
+                )
+            df = reader_fn(open_source(), **reader_options)
         elif isinstance(batch_spec, PathBatchSpec):
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
+            reader_options, source_schema = self._get_projected_reader_options(
+                batch_spec, reader_fn, reader_options, lambda: path
+            )
+            if chunk_size is not None:
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec,
+                        reader_fn,
+                        reader_options,
+                        lambda: path,
+                        source_schema,
+                    ),
+                    batch_markers,
+                )
             df = reader_fn(path, **reader_options)
         else:
             raise BatchSpecError(
@@ -171,7 +345,9 @@ Notes:
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
 
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        typed_batch_data = PandasBatchData(
+            execution_engine=self, dataframe=df, source_schema=source_schema
+        )
 
         return typed_batch_data, batch_markers
 
@@ -187,6 +363,174 @@ Notes:
             batch_data = sampling_fn(batch_data, **sampling_kwargs)
         return batch_data
 
+    def _open_s3_object(
+        self, s3_url: S3Url, reader_fn: Callable, reader_options: dict
+    ) -> Any:
+        """Open an S3 object for reader_fn without downloading it into memory first.
+
+        Readers that parse their input sequentially read the body of the object as a stream. Other readers get a
+        seekable S3ObjectReader, which fetches only the byte ranges they read (for Parquet, the footer and the column
+        chunks of the requested columns), splitting large reads into ranged GETs issued in parallel.
+        """
+        logger.debug(
+            "Fetching s3 object. Bucket: {} Key: {}".format(s3_url.bucket, s3_url.key)
+        )
+        if (
+            self._get_reader_method_name(reader_fn) in STREAMING_READER_METHODS
+            and reader_options.get("compression") != "zip"
+        ):
+            return self._s3.get_object(Bucket=s3_url.bucket, Key=s3_url.key)["Body"]
+        return io.BufferedReader(
+            S3ObjectReader(self._s3, s3_url), buffer_size=DEFAULT_S3_READ_PART_SIZE
+        )
+
+    def _get_projected_reader_options(
+        self,
+        batch_spec: PathBatchSpec,
+        reader_fn: Callable,
+        reader_options: dict,
+        open_source: Callable[[], Any],
+    ) -> Tuple[dict, Optional[List[dict]]]:
+        """Restrict the columns read from the source of batch_spec to its "projected_columns" (and the columns used by
+        its splitter and sampling methods), if any.
+
+        Returns the reader_options reading only those columns, and the schema of the whole source, which describes the
+        columns that are not loaded to table metrics. Sources whose reader cannot select columns, or whose schema cannot
+        be read without reading their data, are read whole; so are sources with explicitly selected columns.
+        """
+        projected_columns = self._get_projected_columns(batch_spec)
+        reader_method = self._get_reader_method_name(reader_fn)
+        column_option = PROJECTION_READER_OPTIONS.get(reader_method)
+        if (
+            not projected_columns
+            or column_option is None
+            or column_option in reader_options
+        ):
+            return reader_options, None
+
+        source = open_source()
+        try:
+            source_schema = self._read_source_schema(
+                reader_method, reader_fn, reader_options, source
+            )
+        finally:
+            if hasattr(source, "close"):
+                source.close()
+        if source_schema is None:
+            return reader_options, None
+
+        columns = [
+            column["name"]
+            for column in source_schema
+            if column["name"] in projected_columns
+        ]
+        if len(columns) == 0 or len(columns) == len(source_schema):
+            return reader_options, None
+        logger.debug(
+            f"Reading {len(columns)} of the {len(source_schema)} columns of {batch_spec.path}"
+        )
+        return dict(reader_options, **{column_option: columns}), source_schema
+
+    @staticmethod
+    def _read_source_schema(
+        reader_method: str, reader_fn: Callable, reader_options: dict, source: Any
+    ) -> Optional[List[dict]]:
+        """Read the name and type of the columns of a source, or None if it cannot be done without reading its data.
+
+        Parquet and Feather schemas are read from the file metadata. The types of the columns of text and Excel files
+        are inferred from their first rows, as they would be by reading the file.
+        """
+        if reader_method in ["read_parquet", "read_feather"]:
+            if pa is None:
+                return None
+            try:
+                if reader_method == "read_parquet":
+                    schema = pq.read_schema(source)
+                else:
+                    schema = pa.ipc.open_file(source).schema
+                df = schema.empty_table().to_pandas()
+            except Exception as e:
+                logger.debug(f"Unable to read the schema of the source: {str(e)}")
+                return None
+        else:
+            df = reader_fn(source, nrows=SCHEMA_INFERENCE_ROWS, **reader_options)
+        return [{"name": name, "type": dtype} for name, dtype in df.dtypes.items()]
+
+    @staticmethod
+    def _get_reader_method_name(reader_fn: Callable) -> str:
+        return getattr(reader_fn, "func", reader_fn).__name__
+
+    def _get_chunked_batch_data(
+        self,
+        batch_spec: PathBatchSpec,
+        reader_fn: Callable,
+        reader_options: dict,
+        open_source: Callable[[], Any],
+        source_schema: Optional[List[dict]] = None,
+    ) -> PandasChunkedBatchData:
+        """Build a PandasChunkedBatchData streaming the file of batch_spec, which open_source opens anew for each pass.
+
+        CSV and JSON Lines files are read chunk_size rows at a time, and Parquet files one row group at a time;
+        splitting and sampling methods are applied to each chunk.
+        """
+        chunk_size = batch_spec.get(
+            "chunk_size", self._batch_spec_defaults.get("chunk_size")
+        )
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise BatchSpecError("chunk_size must be a positive integer.")
+        reader_method = self._get_reader_method_name(reader_fn)
+
+        if reader_method in ["read_csv", "read_table", "read_json"]:
+            if reader_method == "read_json" and not reader_options.get("lines"):
+                raise BatchSpecError(
+                    'Chunked reads with read_json require JSON Lines data and reader_options {"lines": True}.'
+                )
+
+            def read_chunks():
+                reader = reader_fn(
+                    open_source(), chunksize=chunk_size, **reader_options
+                )
+                try:
+                    yield from reader
+                finally:
+                    reader.close()
+
+        elif reader_method == "read_parquet":
+            if pq is None:
+                raise BatchSpecError(
+                    "Chunked reads of Parquet files require pyarrow to be installed."
+                )
+            columns = reader_options.get("columns")
+
+            def read_chunks():
+                parquet_file = pq.ParquetFile(open_source())
+                for row_group in range(parquet_file.num_row_groups):
+                    yield parquet_file.read_row_group(
+                        row_group, columns=columns
+                    ).to_pandas()
+
+        else:
+            raise BatchSpecError(
+                f'reader_method "{reader_method}" does not support chunked reads; use read_csv, read_table, '
+                f"read_json or read_parquet."
+            )
+
+        def load_chunks():
+            for chunk in read_chunks():
+                yield self._apply_splitting_and_sampling_methods(batch_spec, chunk)
+
+        return PandasChunkedBatchData(
+            execution_engine=self,
+            chunk_loader=load_chunks,
+            sample_size=batch_spec.get(
+                "chunk_sample_size",
+                self._batch_spec_defaults.get(
+                    "chunk_sample_size", DEFAULT_CHUNK_SAMPLE_SIZE
+                ),
+            ),
+            source_schema=source_schema,
+        )
+
     @property
     def dataframe(self):
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -300,6 +644,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ValidationError(
@@ -331,10 +676,15 @@ Notes:
                     " and must be 'python' or 'pandas'"
                 )
             else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
-                )
+                # Querying row condition, once per batch and condition
+                domain_cache_key = (batch_id, row_condition, condition_parser)
+                filtered_data = self._domain_cache.get(domain_cache_key)
+                if filtered_data is None:
+                    filtered_data = data.query(
+                        row_condition, parser=condition_parser
+                    ).reset_index(drop=True)
+                    self._domain_cache.set(domain_cache_key, filtered_data)
+                data = filtered_data
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -427,6 +777,329 @@ Notes:
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _get_metric_cache_key(
+        self, metric: MetricConfiguration
+    ) -> Optional[Tuple[Hashable, Tuple]]:
+        if self._get_chunked_batch(metric)[1] is not None:
+            # Values computed on a single chunk must not be cached; resolve_metrics caches the combined values
+            return None
+        return super()._get_metric_cache_key(metric)
+
+    def _get_chunked_batch(
+        self, metric: MetricConfiguration
+    ) -> Tuple[Optional[str], Optional[PandasChunkedBatchData]]:
+        batch_id = metric.metric_domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+        batch_data = self.loaded_batch_data_dict.get(batch_id)
+        if isinstance(batch_data, PandasChunkedBatchData):
+            return batch_id, batch_data
+        return batch_id, None
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Resolve metrics as ExecutionEngine.resolve_metrics does, except that metrics of batches loaded as
+        PandasChunkedBatchData are computed chunk by chunk and combined (see _resolve_chunked_metrics)."""
+        if metrics is None:
+            metrics = dict()
+
+        unchunked_metrics = []
+        chunked_metrics: Dict[str, Tuple[PandasChunkedBatchData, list]] = dict()
+        for metric_to_resolve in metrics_to_resolve:
+            batch_id, batch_data = self._get_chunked_batch(metric_to_resolve)
+            if batch_data is None:
+                unchunked_metrics.append(metric_to_resolve)
+            else:
+                chunked_metrics.setdefault(batch_id, (batch_data, []))[1].append(
+                    metric_to_resolve
+                )
+
+        resolved_metrics = super().resolve_metrics(
+            unchunked_metrics, metrics, runtime_configuration
+        )
+        for batch_id, (batch_data, batch_metrics) in chunked_metrics.items():
+            resolved_metrics.update(
+                self._resolve_chunked_metrics(
+                    batch_id, batch_data, batch_metrics, metrics, runtime_configuration
+                )
+            )
+        return resolved_metrics
+
+    def _resolve_chunked_metrics(
+        self,
+        batch_id: str,
+        batch_data: PandasChunkedBatchData,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Resolve metrics of a chunked batch, reading its chunks at most once.
+
+        - Partial functions (such as the ".condition" of map metrics) are only meaningful for a single chunk; they
+          resolve to a placeholder and are computed on each chunk by the metrics that depend on them.
+        - Mergeable metrics (counts, sums, min/max, value counts, histograms, distinct values, unexpected values, and
+          means and standard deviations through their moments) are computed on every chunk and combined exactly. The
+          unexpected count of column_values.unique is combined from the value counts of the chunks.
+        - Metrics computed only from other metrics (such as column.unique_proportion) are resolved from the combined
+          values.
+        - Any other metric (such as medians, quantiles, KS tests, or the helpers of map metrics whose condition depends
+          on the whole column, such as the unexpected values of column_values.unique) is approximated on a random
+          sample of the batch, and a warning names the approximated metrics.
+        """
+        resolved_metrics = dict()
+        mergeable_metrics = []
+        derived_metrics = []
+        sampled_metrics = []
+        for metric_to_resolve in metrics_to_resolve:
+            metric_cache_key = super()._get_metric_cache_key(metric_to_resolve)
+            if metric_cache_key is not None:
+                cached_value = self._metric_cache.get(metric_cache_key, _CACHE_MISS)
+                if cached_value is not _CACHE_MISS:
+                    resolved_metrics[metric_to_resolve.id] = cached_value
+                    continue
+            metric_name = metric_to_resolve.metric_name
+            if self._is_chunk_partial_metric(metric_to_resolve):
+                resolved_metrics[metric_to_resolve.id] = _ChunkPartialMetric(
+                    metric_to_resolve
+                )
+            elif metric_name in _CHUNKED_DERIVED_METRICS:
+                derived_metrics.append(metric_to_resolve)
+            elif _get_chunk_combiner(metric_name) is not None:
+                mergeable_metrics.append(metric_to_resolve)
+            else:
+                sampled_metrics.append(metric_to_resolve)
+
+        combined_metrics = dict()
+        if len(mergeable_metrics) > 0:
+            chunk_values = {metric.id: [] for metric in mergeable_metrics}
+            value_metrics = [
+                metric
+                for metric in mergeable_metrics
+                if metric.metric_name not in _CHUNK_MOMENTS
+            ]
+            for chunk in batch_data.iter_chunks():
+                with self._using_chunk(batch_id, batch_data, chunk):
+                    chunk_metrics = self._resolve_chunk_partial_dependencies(
+                        mergeable_metrics, metrics, runtime_configuration
+                    )
+                    values = super().resolve_metrics(
+                        value_metrics, chunk_metrics, runtime_configuration
+                    )
+                    for metric in mergeable_metrics:
+                        if metric.metric_name in _CHUNK_MOMENTS:
+                            values[metric.id] = _CHUNK_MOMENTS[metric.metric_name][0](
+                                self._get_chunk_column(metric)
+                            )
+                        chunk_values[metric.id].append(values[metric.id])
+            for metric in mergeable_metrics:
+                combined_metrics[metric.id] = _get_chunk_combiner(metric.metric_name)(
+                    chunk_values[metric.id], metric
+                )
+
+        if len(derived_metrics) > 0:
+            combined_metrics.update(
+                super().resolve_metrics(derived_metrics, metrics, runtime_configuration)
+            )
+
+        if len(sampled_metrics) > 0:
+            sample = batch_data.get_sample()
+            logger.warning(
+                f"Metrics {sorted(set(metric.metric_name for metric in sampled_metrics))} cannot be combined across "
+                f"the chunks of batch {batch_id}, and are approximated on a sample of {len(sample)} rows."
+            )
+            with self._using_chunk(batch_id, batch_data, sample):
+                sample_metrics = self._resolve_chunk_partial_dependencies(
+                    sampled_metrics, metrics, runtime_configuration
+                )
+                combined_metrics.update(
+                    super().resolve_metrics(
+                        sampled_metrics, sample_metrics, runtime_configuration
+                    )
+                )
+
+        for metric in mergeable_metrics + derived_metrics + sampled_metrics:
+            metric_cache_key = super()._get_metric_cache_key(metric)
+            if metric_cache_key is not None:
+                self._metric_cache.set(metric_cache_key, combined_metrics[metric.id])
+        resolved_metrics.update(combined_metrics)
+        return resolved_metrics
+
+    def _is_chunk_partial_metric(self, metric: MetricConfiguration) -> bool:
+        metric_fn = get_metric_provider(metric.metric_name, execution_engine=self)[1]
+        metric_fn_type = getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+        return metric_fn is None or isinstance(
+            metric_fn_type, MetricPartialFunctionTypes
+        )
+
+    @contextmanager
+    def _using_chunk(
+        self, batch_id: str, batch_data: PandasChunkedBatchData, chunk: pd.DataFrame
+    ):
+        """Make chunk the data of a chunked batch while metrics are resolved on it."""
+        self._domain_cache.invalidate(batch_id)
+        batch_data._dataframe = chunk
+        try:
+            yield
+        finally:
+            batch_data._dataframe = None
+            self._domain_cache.invalidate(batch_id)
+
+    def _resolve_chunk_partial_dependencies(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Return metrics with the partial functions metrics_to_resolve depend on resolved for the current chunk."""
+        chunk_metrics = dict(metrics)
+        pending = list(metrics_to_resolve)
+        while len(pending) > 0:
+            metric = pending[-1]
+            partial_dependencies = [
+                chunk_metrics[dependency.id].metric_configuration
+                for dependency in metric.metric_dependencies.values()
+                if isinstance(chunk_metrics.get(dependency.id), _ChunkPartialMetric)
+            ]
+            if len(partial_dependencies) > 0:
+                pending.extend(partial_dependencies)
+                continue
+            pending.pop()
+            if isinstance(chunk_metrics.get(metric.id), _ChunkPartialMetric):
+                chunk_metrics.update(
+                    super().resolve_metrics(
+                        [metric], chunk_metrics, runtime_configuration
+                    )
+                )
+        return chunk_metrics
+
+    def _get_chunk_column(self, metric: MetricConfiguration) -> pd.Series:
+        df, _, accessor_domain_kwargs = self.get_compute_domain(
+            metric.metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        return df[accessor_domain_kwargs["column"]].dropna()
+
+    def _get_value_metric_bundle_entry(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn,
+        metric_provider_kwargs: dict,
+    ) -> Optional[tuple]:
+        """Column aggregate metrics are bundled by compute domain, so that each domain, and each column on it, is
+        materialized only once for all of the aggregates computed over it."""
+        column_aggregate_fn = getattr(metric_fn, "column_aggregate_fn", None)
+        if column_aggregate_fn is None:
+            return None
+        compute_domain_kwargs = dict(metric_to_resolve.metric_domain_kwargs)
+        if "column" not in compute_domain_kwargs:
+            return None
+
+        metric_class = metric_provider_kwargs["cls"]
+        accessor_domain_kwargs = {
+            "column": compute_domain_kwargs.pop("column"),
+            "filter_column_isnull": metric_fn.column_aggregate_kwargs.get(
+                "filter_column_isnull",
+                getattr(metric_class, "filter_column_isnull", False),
+            ),
+        }
+        bundled_fn = partial(
+            column_aggregate_fn,
+            metric_class,
+            **metric_provider_kwargs["metric_value_kwargs"],
+            _metrics=metric_provider_kwargs["metrics"],
+        )
+        return (
+            metric_to_resolve,
+            bundled_fn,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+            metric_provider_kwargs,
+        )
+
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[Tuple[MetricConfiguration, Callable, dict, dict]],
+    ) -> dict:
+        """Resolve a bundle of column aggregate metrics, grouped by compute domain, so that the rows of each domain
+        are selected once and shared by all of the aggregates computed on it.
+
+            Args:
+                metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict, dict, dict]]): \
+                    For each metric, its MetricConfiguration, a function computing the aggregate from a column Series,
+                    its compute_domain_kwargs, its accessor_domain_kwargs and its metric provider kwargs.
+
+            Returns:
+                A dictionary of metric ids and their corresponding computed values.
+        """
+        resolved_metrics = dict()
+
+        domains: Dict[Tuple, dict] = dict()
+        for (
+            metric_to_resolve,
+            metric_fn,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+            metric_provider_kwargs,
+        ) in metric_fn_bundle:
+            domain_id = IDDict(compute_domain_kwargs).to_id()
+            if domain_id not in domains:
+                domains[domain_id] = {
+                    "domain_kwargs": compute_domain_kwargs,
+                    "metric_fns": [],
+                }
+            domains[domain_id]["metric_fns"].append(
+                (metric_to_resolve.id, metric_fn, accessor_domain_kwargs)
+            )
+
+        executor = (
+            self._get_metric_executor(
+                batch_ids=[
+                    domain["domain_kwargs"].get("batch_id")
+                    for domain in domains.values()
+                ]
+            )
+            if len(domains) > 1
+            else None
+        )
+        if executor is None:
+            for domain in domains.values():
+                resolved_metrics.update(self._resolve_bundle_domain(domain))
+        else:
+            with executor:
+                for future in [
+                    executor.submit(self._resolve_bundle_domain, domain)
+                    for domain in domains.values()
+                ]:
+                    resolved_metrics.update(future.result())
+
+        return resolved_metrics
+
+    def _resolve_bundle_domain(self, domain: dict) -> dict:
+        """Compute all bundled aggregates on one compute domain, returning the resolved metrics."""
+        resolved_metrics = dict()
+        df, _, _ = self.get_compute_domain(
+            domain["domain_kwargs"], domain_type="identity"
+        )
+        columns = dict()
+        for metric_id, metric_fn, accessor_domain_kwargs in domain["metric_fns"]:
+            column_name = accessor_domain_kwargs["column"]
+            filter_column_isnull = accessor_domain_kwargs["filter_column_isnull"]
+            column_key = (column_name, filter_column_isnull)
+            if column_key not in columns:
+                column = df[column_name]
+                if filter_column_isnull:
+                    column = column[column.notnull()]
+                columns[column_key] = column
+            resolved_metrics[metric_id] = metric_fn(column=columns[column_key])
+        logger.debug(
+            f"PandasExecutionEngine computed {len(resolved_metrics)} metrics on {len(columns)} columns of domain_id "
+            f"{IDDict(domain['domain_kwargs']).to_id()}"
+        )
+        return resolved_metrics
+
     ### Splitter methods for partitioning dataframes ###
     @staticmethod
     def _split_on_whole_table(
@@ -589,6 +1262,215 @@ Notes:
         return df[matches]
 
 
+class _ChunkPartialMetric:
+    """Placeholder for a partial function of a chunked batch, which is resolved on each chunk where it is used."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self.metric_configuration = metric_configuration
+
+
+def _combine_sum(values: list, metric: MetricConfiguration):
+    return sum(values)
+
+
+def _combine_first(values: list, metric: MetricConfiguration):
+    return values[0] if len(values) > 0 else None
+
+
+def _combine_min(values: list, metric: MetricConfiguration):
+    values = [value for value in values if not pd.isnull(value)]
+    return min(values) if len(values) > 0 else np.nan
+
+
+def _combine_max(values: list, metric: MetricConfiguration):
+    values = [value for value in values if not pd.isnull(value)]
+    return max(values) if len(values) > 0 else np.nan
+
+
+def _combine_union(values: list, metric: MetricConfiguration):
+    return set().union(*values)
+
+
+def _combine_histogram(values: list, metric: MetricConfiguration):
+    return list(np.sum(values, axis=0))
+
+
+def _combine_head(values: list, metric: MetricConfiguration):
+    head = pd.concat(values)
+    if metric.metric_value_kwargs.get("fetch_all"):
+        return head
+    return head.head(metric.metric_value_kwargs["n_rows"])
+
+
+def _combine_counts(values: list) -> pd.Series:
+    counts = pd.concat(values)
+    return counts.groupby(level=0, sort=False).sum().sort_values(ascending=False)
+
+
+def _combine_value_counts(values: list, metric: MetricConfiguration):
+    counts = _combine_counts(values)
+    if metric.metric_value_kwargs.get("sort", "value") == "value":
+        try:
+            counts.sort_index(inplace=True)
+        except TypeError:
+            counts.index = counts.index.astype(str)
+            counts.sort_index(inplace=True)
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _get_partial_unexpected_count(metric: MetricConfiguration) -> Optional[int]:
+    result_format = metric.metric_value_kwargs.get("result_format") or {}
+    if result_format.get("result_format") == "COMPLETE":
+        return None
+    return result_format.get("partial_unexpected_count")
+
+
+def _combine_unexpected_lists(values: list, metric: MetricConfiguration):
+    limit = _get_partial_unexpected_count(metric)
+    if len(values) > 0 and isinstance(values[0], tuple):
+        # Map series metrics return unexpected values along with their mapped values
+        return tuple(
+            _combine_unexpected_lists(list(chunk_values), metric)
+            for chunk_values in zip(*values)
+        )
+    combined = [value for chunk_values in values for value in chunk_values]
+    return combined if limit is None else combined[:limit]
+
+
+def _combine_unexpected_value_counts(values: list, metric: MetricConfiguration):
+    limit = _get_partial_unexpected_count(metric)
+    counts = _combine_counts(values)
+    return counts if limit is None else counts.head(limit)
+
+
+def _combine_unexpected_rows(values: list, metric: MetricConfiguration):
+    limit = _get_partial_unexpected_count(metric)
+    rows = pd.concat(values)
+    return rows if limit is None else rows.head(limit)
+
+
+def _get_mean_moments(column: pd.Series) -> Tuple[int, float]:
+    return len(column), column.sum()
+
+
+def _combine_mean(values: list, metric: MetricConfiguration):
+    count = sum(chunk_count for chunk_count, _ in values)
+    return sum(chunk_sum for _, chunk_sum in values) / count if count > 0 else np.nan
+
+
+def _get_variance_moments(column: pd.Series) -> Tuple[int, float, float]:
+    if len(column) == 0:
+        return 0, 0.0, 0.0
+    mean = column.mean()
+    return len(column), mean, ((column - mean) ** 2).sum()
+
+
+def _combine_standard_deviation(values: list, metric: MetricConfiguration):
+    # Pairwise combination of (count, mean, sum of squared deviations), as in Chan et al.'s parallel variance
+    count, mean, squared_deviations = 0, 0.0, 0.0
+    for chunk_count, chunk_mean, chunk_squared_deviations in values:
+        if chunk_count == 0:
+            continue
+        delta = chunk_mean - mean
+        total = count + chunk_count
+        mean += delta * chunk_count / total
+        squared_deviations += (
+            chunk_squared_deviations + delta ** 2 * count * chunk_count / total
+        )
+        count = total
+    return np.sqrt(squared_deviations / (count - 1)) if count > 1 else np.nan
+
+
+def _get_distinct_values(column: pd.Series) -> set:
+    return set(column.unique())
+
+
+def _combine_distinct_values_count(values: list, metric: MetricConfiguration):
+    return len(set().union(*values))
+
+
+def _get_value_counts(column: pd.Series) -> pd.Series:
+    return column.value_counts()
+
+
+def _combine_duplicated_values_count(values: list, metric: MetricConfiguration):
+    counts = _combine_counts(values)
+    return int(counts[counts > 1].sum())
+
+
+# Metrics of a chunked batch that are combined from the values computed on each chunk
+_CHUNK_COMBINERS = {
+    "table.row_count": _combine_sum,
+    "table.columns": _combine_first,
+    "table.column_types": _combine_first,
+    "table.column_count": _combine_first,
+    "table.head": _combine_head,
+    "column.min": _combine_min,
+    "column.max": _combine_max,
+    "column.sum": _combine_sum,
+    "column.value_counts": _combine_value_counts,
+    "column.distinct_values": _combine_union,
+    "column.histogram": _combine_histogram,
+    "column_values.between.count": _combine_sum,
+}
+
+# Metrics of a chunked batch combined from moments computed on the column of each chunk, rather than from their values
+_CHUNK_MOMENTS = {
+    "column.mean": (_get_mean_moments, _combine_mean),
+    "column.standard_deviation": (_get_variance_moments, _combine_standard_deviation),
+    "column.distinct_values.count": (
+        _get_distinct_values,
+        _combine_distinct_values_count,
+    ),
+    # Values are unexpected if they are duplicated anywhere in the column, which the combined value counts tell
+    "column_values.unique.unexpected_count": (
+        _get_value_counts,
+        _combine_duplicated_values_count,
+    ),
+}
+
+# Map metric helpers, identified by their suffix, combined from the values computed on each chunk
+_MAP_METRIC_CHUNK_COMBINERS = {
+    ".unexpected_count": _combine_sum,
+    ".unexpected_values": _combine_unexpected_lists,
+    ".unexpected_index_list": _combine_unexpected_lists,
+    ".unexpected_value_counts": _combine_unexpected_value_counts,
+    ".unexpected_rows": _combine_unexpected_rows,
+}
+
+# Map metric conditions which depend on the whole column (such as on values in other chunks, or preceding rows), so
+# that their helpers cannot be combined from the values computed on each chunk
+_WHOLE_COLUMN_MAP_CONDITIONS = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.unique",
+}
+
+# Metrics computed only from the metrics they depend on, which are resolved once from the combined values
+_CHUNKED_DERIVED_METRICS = {
+    "column.unique_proportion",
+    "column.partition",
+    "column_values.nonnull.count",
+    "column_values.null.count",
+}
+
+
+def _get_chunk_combiner(metric_name: str) -> Optional[Callable]:
+    if metric_name in _CHUNK_COMBINERS:
+        return _CHUNK_COMBINERS[metric_name]
+    if metric_name in _CHUNK_MOMENTS:
+        return _CHUNK_MOMENTS[metric_name][1]
+    for suffix, combiner in _MAP_METRIC_CHUNK_COMBINERS.items():
+        if metric_name.endswith(suffix):
+            if metric_name[: -len(suffix)] in _WHOLE_COLUMN_MAP_CONDITIONS:
+                return None
+            return combiner
+    return None
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -2,10 +2,19 @@ from great_expectations.execution_engine.execution_engine import BatchData
 
 
 class SparkDFBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe):
+    def __init__(self, execution_engine, dataframe, source_schema=None):
+        """
+        Args:
+            source_schema: for a batch loaded with only some of the columns of its source, the StructType of the source
+        """
         super().__init__(execution_engine)
         self._dataframe = dataframe
+        self._source_schema = source_schema
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_schema(self):
+        return self._source_schema
@@ -2,7 +2,9 @@ import copy
 import datetime
 import hashlib
 import logging
+import threading
 import uuid
+from collections import OrderedDict
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers
@@ -61,6 +63,92 @@ except ImportError:
     )
 
 
+# Number of row_condition domains kept persisted by a SparkDFExecutionEngine
+DEFAULT_DOMAIN_CACHE_MAX_SIZE = 8
+
+
+class SparkDomainCache:
+    """An LRU cache of the DataFrames selected by a row_condition, keyed by (batch_id, row_condition, condition_parser).
+
+    Cached domains are persisted, so that the metrics sharing a conditional domain filter the batch only once instead
+    of each re-running the filter on its lineage. Least recently used domains are unpersisted and evicted once the cache
+    holds more than max_size domains. A max_size of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_DOMAIN_CACHE_MAX_SIZE,
+        storage_level: Optional["pyspark.StorageLevel"] = None,
+    ):
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError(
+                "domain_cache_max_size for a SparkDFExecutionEngine must be a non-negative integer."
+            )
+        self._max_size = max_size
+        self._storage_level = storage_level
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional["pyspark.sql.DataFrame"]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: Tuple, data: "pyspark.sql.DataFrame") -> None:
+        if self._max_size == 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            _persist(data, self._storage_level)
+            self._entries[key] = data
+            while len(self._entries) > self._max_size:
+                _, evicted_data = self._entries.popitem(last=False)
+                evicted_data.unpersist()
+
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        """Unpersist and remove all domains of the given batch_id, or every domain if batch_id is None."""
+        with self._lock:
+            for key in [
+                key for key in self._entries if batch_id is None or key[0] == batch_id
+            ]:
+                self._entries.pop(key).unpersist()
+
+
+def _persist(data: "pyspark.sql.DataFrame", storage_level=None) -> None:
+    if storage_level is None:
+        data.persist()
+    else:
+        data.persist(storage_level)
+
+
+def _get_storage_level(
+    storage_level: Optional[str],
+) -> Optional["pyspark.StorageLevel"]:
+    if storage_level is None:
+        return None
+    if pyspark is None:
+        raise ExecutionEngineError(
+            "Unable to load pyspark. Pyspark is required for SparkDFExecutionEngine."
+        )
+    level = getattr(pyspark.StorageLevel, str(storage_level).upper(), None)
+    if not isinstance(level, pyspark.StorageLevel):
+        raise ValueError(
+            f"persist_storage_level {storage_level} for a SparkDFExecutionEngine is not a pyspark StorageLevel, such "
+            f"as MEMORY_AND_DISK or MEMORY_ONLY."
+        )
+    return level
+
+
 class SparkDFExecutionEngine(ExecutionEngine):
     """
     This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
@@ -144,7 +232,19 @@ class SparkDFExecutionEngine(ExecutionEngine):
     def __init__(self, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self._persist = kwargs.pop("persist", True)
+        persist_storage_level: Optional[str] = kwargs.pop("persist_storage_level", None)
+        domain_cache_max_size: Optional[int] = kwargs.pop("domain_cache_max_size", None)
         self._spark_config = kwargs.pop("spark_config", {})
+        self._storage_level = _get_storage_level(persist_storage_level)
+        # DataFrames of loaded batches persisted by this engine, which unpersists them when they are unloaded
+        self._persisted_dataframes = {}
+        # Created before batches in batch_data_dict are loaded, since loading a batch invalidates its domains
+        self._domain_cache = SparkDomainCache(
+            max_size=DEFAULT_DOMAIN_CACHE_MAX_SIZE
+            if domain_cache_max_size is None
+            else domain_cache_max_size,
+            storage_level=self._storage_level,
+        )
         try:
             builder = SparkSession.builder
             app_name: Optional[str] = self._spark_config.pop("spark.app.name", None)
@@ -167,6 +267,14 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "spark_config": self._spark_config,
             }
         )
+        if persist_storage_level is not None:
+            self._config["persist_storage_level"] = persist_storage_level
+        if domain_cache_max_size is not None:
+            self._config["domain_cache_max_size"] = domain_cache_max_size
+
+    @property
+    def domain_cache(self) -> SparkDomainCache:
+        return self._domain_cache
 
     @property
     def dataframe(self):
@@ -178,7 +286,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return self.active_batch_data.dataframe
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
         if isinstance(batch_data, DataFrame):
             batch_data = SparkDFBatchData(self, batch_data)
         elif isinstance(batch_data, SparkDFBatchData):
@@ -187,7 +297,34 @@ class SparkDFExecutionEngine(ExecutionEngine):
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        with self._batch_data_lock:
+            loaded_batch_data = self.loaded_batch_data_dict.get(batch_id)
+            if (
+                loaded_batch_data is None
+                or loaded_batch_data.dataframe is not batch_data.dataframe
+            ):
+                self.unload_batch_data(batch_id)
+                # DataFrames persisted by the caller are left for the caller to unpersist
+                if self._persist and not batch_data.dataframe.is_cached:
+                    _persist(batch_data.dataframe, self._storage_level)
+                    self._persisted_dataframes[batch_id] = batch_data.dataframe
+            super().load_batch_data(
+                batch_id=batch_id, batch_data=batch_data, batch_markers=batch_markers
+            )
+
+    def unload_batch_data(self, batch_id: Optional[str] = None) -> None:
+        with self._batch_data_lock:
+            self._domain_cache.invalidate(batch_id)
+            batch_ids = (
+                list(self._persisted_dataframes) if batch_id is None else [batch_id]
+            )
+            for persisted_batch_id in batch_ids:
+                persisted_dataframe = self._persisted_dataframes.pop(
+                    persisted_batch_id, None
+                )
+                if persisted_dataframe is not None:
+                    persisted_dataframe.unpersist()
+            super().unload_batch_data(batch_id=batch_id)
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -232,8 +369,21 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 """
             )
 
+        source_schema = None
+        projected_columns = self._get_projected_columns(batch_spec)
+        if projected_columns and not isinstance(batch_spec, RuntimeDataBatchSpec):
+            # Selecting the columns before any action lets Spark prune the other columns when scanning the source
+            columns = [
+                column for column in batch_data.columns if column in projected_columns
+            ]
+            if 0 < len(columns) < len(batch_data.columns):
+                source_schema = batch_data.schema
+                batch_data = batch_data.select(*columns)
+
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
-        typed_batch_data = SparkDFBatchData(execution_engine=self, dataframe=batch_data)
+        typed_batch_data = SparkDFBatchData(
+            execution_engine=self, dataframe=batch_data, source_schema=source_schema
+        )
 
         return typed_batch_data, batch_markers
 
@@ -335,6 +485,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ValidationError(
@@ -357,15 +508,21 @@ class SparkDFExecutionEngine(ExecutionEngine):
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
+            if condition_parser not in ["spark", "great_expectations__experimental__"]:
                 raise GreatExpectationsError(
                     f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
                 )
+            # Filtering once per batch and condition
+            domain_cache_key = (batch_id, row_condition, condition_parser)
+            filtered_data = self._domain_cache.get(domain_cache_key)
+            if filtered_data is None:
+                if condition_parser == "spark":
+                    filtered_data = data.filter(row_condition)
+                else:
+                    parsed_condition = parse_condition_to_spark(row_condition)
+                    filtered_data = data.filter(parsed_condition)
+                self._domain_cache.set(domain_cache_key, filtered_data)
+            data = filtered_data
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
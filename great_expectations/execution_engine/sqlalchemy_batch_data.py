@@ -36,6 +36,7 @@ class SqlAlchemyBatchData(BatchData):
         use_quoted_name: bool = False,
         source_table_name: str = None,
         source_schema_name: str = None,
+        batch_spec_id: str = None,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -72,6 +73,10 @@ class SqlAlchemyBatchData(BatchData):
                 source_schema_name (str): \
                     For SqlAlchemyBatchData based on selectables, source_schema_name provides the name of the schema on which
                     the selectable is based. This is required for most kinds of table introspection (e.g. looking up column types)
+                batch_spec_id (str): \
+                    For SqlAlchemyBatchData built from a deterministic batch_spec, batch_spec_id identifies the table,
+                    partition, splitting and sampling used to build the selectable, so that computed metrics can be reused
+                    across loads of the same data
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -98,6 +103,8 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._batch_spec_id = batch_spec_id
+        self._is_temporary_table = False
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -155,6 +162,8 @@ class SqlAlchemyBatchData(BatchData):
                 query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            # BigQuery "temporary" tables are regular tables, visible to every connection
+            self._is_temporary_table = engine.dialect.name.lower() != "bigquery"
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -183,10 +192,19 @@ class SqlAlchemyBatchData(BatchData):
     def source_schema_name(self):
         return self._source_schema_name
 
+    @property
+    def batch_spec_id(self):
+        return self._batch_spec_id
+
     @property
     def selectable(self):
         return self._selectable
 
+    @property
+    def is_temporary_table(self) -> bool:
+        """Whether the selectable is a temporary table, which only the connection that created it can query."""
+        return self._is_temporary_table
+
     @property
     def use_quoted_name(self):
         return self._use_quoted_name
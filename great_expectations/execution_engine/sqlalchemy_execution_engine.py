@@ -1,5 +1,6 @@
 import copy
 import datetime
+import hashlib
 import logging
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
@@ -18,6 +19,10 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_metadata_catalog import (
+    DEFAULT_METADATA_CATALOG_TTL,
+    SqlAlchemyMetadataCatalog,
+)
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import filter_properties_dict, import_library_module
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -132,6 +137,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url=None,
         batch_data_dict=None,
         create_temp_table=True,
+        caching=True,
+        metric_cache_config=None,
+        concurrency_config=None,
+        metadata_catalog_ttl=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -158,8 +167,36 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                create_temp_table (bool): \
+                    Whether batches are loaded into a temporary table (the default) rather than queried as a
+                    subselect, unless their batch_spec says otherwise.
+                caching (bool): \
+                    Whether resolved metrics are cached (the default). Only recorded in the config when disabled.
+                concurrency_config (dict): \
+                    If provided (e.g. {"max_workers": 8}), independent metrics and the queries for different
+                    domains of a metric bundle are executed concurrently, each on its own pooled connection. Metrics
+                    are still resolved one at a time on single-connection engines (such as sqlite), and for batches
+                    loaded into a temporary table, which other pooled connections cannot see.
+                metadata_catalog_ttl (float): \
+                    The number of seconds for which reflected table metadata (tables, columns and row count
+                    estimates) is cached and shared with other users of the same database. Defaults to 0, which
+                    disables caching.
+                metric_cache_config (dict): \
+                    The configuration of the metric cache (see MetricCache.from_config). Metrics are only shared
+                    across loads of batches built from the same batch_spec if a metric_cache_config is given: a
+                    batch_spec identifies a table, not its rows, so that this assumes the rows do not change over the
+                    lifetime of the cached metrics (which a "ttl" bounds). Otherwise, metrics are only cached for the
+                    lifetime of a loaded batch.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        # Set before batch_data_dict is loaded by the base class, which computes the cache keys of its batches
+        self._share_metrics_across_loads = metric_cache_config is not None
+        super().__init__(
+            name=name,
+            caching=caching,
+            batch_data_dict=batch_data_dict,
+            metric_cache_config=metric_cache_config,
+            concurrency_config=concurrency_config,
+        )
         self._name = name
 
         self._credentials = credentials
@@ -224,6 +261,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             # sqlite/mssql temp tables only persist within a connection so override the engine
             self.engine = self.engine.connect()
 
+        self._metadata_catalog = SqlAlchemyMetadataCatalog(
+            self.engine,
+            ttl=DEFAULT_METADATA_CATALOG_TTL
+            if metadata_catalog_ttl is None
+            else metadata_catalog_ttl,
+        )
+
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
             data_context, "_usage_statistics_handler", None
@@ -250,11 +294,18 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "caching": caching,
+            "metric_cache_config": metric_cache_config,
+            "concurrency_config": concurrency_config,
+            "metadata_catalog_ttl": metadata_catalog_ttl,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, inplace=True)
+        # Caching is on by default, so that only disabling it needs to be recorded for the engine to be re-created alike
+        if caching is True:
+            self._config.pop("caching", None)
 
     @property
     def credentials(self):
@@ -268,6 +319,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self):
         return self._url
 
+    @property
+    def metadata_catalog(self) -> SqlAlchemyMetadataCatalog:
+        return self._metadata_catalog
+
+    @property
+    def is_replicable(self) -> bool:
+        # Each connection to an in-memory sqlite database opens a database of its own
+        url = self.engine.engine.url
+        return not (
+            self.engine.dialect.name.lower() == "sqlite"
+            and url.database in (None, "", ":memory:")
+        )
+
     def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -348,6 +412,37 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    def _get_metric_executor(self, batch_ids=()):
+        if isinstance(self.engine, sa.engine.Connection):
+            # A single connection (used so that temporary tables remain visible) cannot be shared across threads
+            return None
+        for batch_id in batch_ids:
+            batch_data = self.loaded_batch_data_dict.get(
+                self.active_batch_data_id if batch_id is None else batch_id
+            )
+            if getattr(batch_data, "is_temporary_table", False):
+                # Other pooled connections cannot see a temporary table, so its metrics are resolved one at a time
+                return None
+        return super()._get_metric_executor(batch_ids=batch_ids)
+
+    def _get_batch_cache_key(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> Optional[str]:
+        """If a metric_cache_config was given, batches built from a deterministic batch_spec are identified by the
+        database and that batch_spec (which describes the table, partition, splitting and sampling); otherwise, and for
+        other batches, batches have no stable identity."""
+        if not self._share_metrics_across_loads:
+            return None
+        if not isinstance(batch_data, SqlAlchemyBatchData):
+            return None
+        if batch_data.batch_spec_id is None:
+            return None
+        return hashlib.md5(
+            "|".join([repr(self.engine.engine.url), batch_data.batch_spec_id]).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
     def get_compute_domain(
         self,
         domain_kwargs: Dict,
@@ -596,25 +691,48 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 engine_fn.label(metric_to_resolve.metric_name)
             )
             queries[domain_id]["ids"].append(metric_to_resolve.id)
-        for query in queries.values():
-            selectable, compute_domain_kwargs, _ = self.get_compute_domain(
-                query["domain_kwargs"], domain_type="identity"
+        executor = (
+            self._get_metric_executor(
+                batch_ids=[
+                    query["domain_kwargs"].get("batch_id") for query in queries.values()
+                ]
             )
-            assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
-            logger.debug(
-                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
-            )
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+            if len(queries) > 1
+            else None
+        )
+        if executor is None:
+            for query in queries.values():
+                resolved_metrics.update(self._resolve_bundle_query(query))
+        else:
+            # Engine.execute checks out a separate pooled connection for each domain's query
+            with executor:
+                for future in [
+                    executor.submit(self._resolve_bundle_query, query)
+                    for query in queries.values()
+                ]:
+                    resolved_metrics.update(future.result())
+
+        return resolved_metrics
+
+    def _resolve_bundle_query(self, query: dict) -> dict:
+        """Execute the single query computing all bundled metrics on one domain, returning the resolved metrics."""
+        resolved_metrics = dict()
+        selectable, compute_domain_kwargs, _ = self.get_compute_domain(
+            query["domain_kwargs"], domain_type="identity"
+        )
+        assert len(query["select"]) == len(query["ids"])
+        res = self.engine.execute(
+            sa.select(query["select"]).select_from(selectable)
+        ).fetchall()
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+        )
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(query["ids"]) == len(res[0]), "unexpected number of metrics returned"
+        for idx, id in enumerate(query["ids"]):
+            resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
 
         return resolved_metrics
 
@@ -823,6 +941,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         source_table_name = batch_spec.get("table_name", None)
         source_schema_name = batch_spec.get("schema_name", None)
 
+        batch_spec_id = None
+        if batch_spec.get("sampling_method") != "_sample_using_random":
+            try:
+                batch_spec_id = IDDict(batch_spec).to_id()
+            except TypeError:
+                logger.debug("Unable to build an id for a non-serializable batch_spec.")
+
         batch_data = SqlAlchemyBatchData(
             execution_engine=self,
             selectable=selectable,
@@ -832,6 +957,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             ),
             source_table_name=source_table_name,
             source_schema_name=source_schema_name,
+            batch_spec_id=batch_spec_id,
         )
         batch_markers = BatchMarkers(
             {
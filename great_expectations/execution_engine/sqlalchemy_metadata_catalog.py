@@ -0,0 +1,245 @@
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.engine import reflection
+except ImportError:
+    sa = None
+    reflection = None
+
+# Metadata is only cached when a ttl is given, since tables may be altered or re-created at any time
+DEFAULT_METADATA_CATALOG_TTL = 0
+
+# The maximum number of metadata entries cached for a database; the least recently used entries are evicted first
+DEFAULT_METADATA_CATALOG_MAX_ENTRIES = 1000
+
+# Queries reading the number of rows of a table from the statistics kept by the database, which are estimates
+_ROW_COUNT_ESTIMATE_QUERIES = {
+    "postgresql": """
+SELECT c.reltuples
+FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relname = :table_name AND n.nspname = COALESCE(:schema_name, current_schema())
+""",
+    "mysql": """
+SELECT TABLE_ROWS
+FROM information_schema.TABLES
+WHERE TABLE_NAME = :table_name AND TABLE_SCHEMA = COALESCE(:schema_name, DATABASE())
+""",
+    "snowflake": """
+SELECT ROW_COUNT
+FROM information_schema.TABLES
+WHERE UPPER(TABLE_NAME) = UPPER(:table_name) AND UPPER(TABLE_SCHEMA) = UPPER(COALESCE(:schema_name, CURRENT_SCHEMA()))
+""",
+    "mssql": """
+SELECT SUM(p.rows)
+FROM sys.partitions p
+JOIN sys.tables t ON p.object_id = t.object_id
+JOIN sys.schemas s ON t.schema_id = s.schema_id
+WHERE t.name = :table_name AND s.name = COALESCE(:schema_name, SCHEMA_NAME()) AND p.index_id IN (0, 1)
+""",
+}
+_ROW_COUNT_ESTIMATE_QUERIES["redshift"] = _ROW_COUNT_ESTIMATE_QUERIES["postgresql"]
+
+
+class _MetadataEntries:
+    """Cached metadata of a database, with the time each entry was read, in least recently used order."""
+
+    def __init__(self, max_entries: int = DEFAULT_METADATA_CATALOG_MAX_ENTRIES):
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+        self.entries: Dict[Hashable, Tuple[Any, float]] = OrderedDict()
+
+
+# Metadata is shared by all catalogs of a database: by URL, or by engine for in-memory SQLite databases, which are
+# distinct for each engine
+_metadata_entries_by_url: Dict[str, _MetadataEntries] = {}
+_metadata_entries_by_engine = weakref.WeakKeyDictionary()
+_metadata_entries_lock = threading.Lock()
+
+
+def _get_metadata_entries(engine) -> _MetadataEntries:
+    # A Connection is bound to its engine; an Engine is its own engine
+    engine = engine.engine
+    with _metadata_entries_lock:
+        if engine.dialect.name.lower() == "sqlite" and engine.url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            entries = _metadata_entries_by_engine.get(engine)
+            if entries is None:
+                entries = _metadata_entries_by_engine[engine] = _MetadataEntries()
+            return entries
+        url = str(engine.url)
+        entries = _metadata_entries_by_url.get(url)
+        if entries is None:
+            entries = _metadata_entries_by_url[url] = _MetadataEntries()
+        return entries
+
+
+def clear_metadata_catalogs() -> None:
+    """Discard the cached metadata of all databases."""
+    with _metadata_entries_lock:
+        _metadata_entries_by_url.clear()
+        _metadata_entries_by_engine.clear()
+
+
+class SqlAlchemyMetadataCatalog:
+    """A cache of the schemas, tables, views, columns and row count estimates of a database, read through SQLAlchemy
+    reflection and kept for ttl seconds.
+
+    Catalogs of the same database (by URL) share their cached metadata, so that the execution engine, data connectors
+    and datasets reading the same tables only reflect them once every ttl seconds. Metadata is read with the engine (or
+    connection) of the catalog, so that temporary tables of a connection are visible. A ttl of 0 (the default) disables
+    caching: a positive ttl assumes that tables are not altered or re-created within ttl seconds, or that invalidate is
+    called when they are.
+
+    Expired entries are dropped whenever an entry is written, and at most DEFAULT_METADATA_CATALOG_MAX_ENTRIES entries
+    are kept for a database, so that the metadata of short-lived tables (such as temporary tables) does not accumulate.
+    """
+
+    def __init__(self, engine, ttl: float = DEFAULT_METADATA_CATALOG_TTL):
+        if ttl is None or ttl < 0:
+            raise ValueError(
+                "metadata_catalog_ttl for a SqlAlchemyMetadataCatalog must be a non-negative number of seconds."
+            )
+        self._engine = engine
+        self._ttl = ttl
+        self._entries = _get_metadata_entries(engine)
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def _get(self, key: Hashable, loader: Callable[[], Any]):
+        if self._ttl == 0:
+            return loader()
+        with self._entries.lock:
+            entry = self._entries.entries.get(key)
+            if entry is not None and time.time() - entry[1] < self._ttl:
+                self._entries.entries.move_to_end(key)
+                return entry[0]
+        value = loader()
+        now = time.time()
+        with self._entries.lock:
+            entries = self._entries.entries
+            entries[key] = (value, now)
+            entries.move_to_end(key)
+            for expired_key in [
+                entry_key
+                for entry_key, (_, read_time) in entries.items()
+                if now - read_time >= self._ttl
+            ]:
+                del entries[expired_key]
+            while len(entries) > self._entries.max_entries:
+                entries.popitem(last=False)
+        return value
+
+    def invalidate(
+        self, table_name: Optional[str] = None, schema: Optional[str] = None
+    ):
+        """Discard the cached metadata of a table (and the table names of its schema), or of the whole database if no
+        table_name is given."""
+        with self._entries.lock:
+            if table_name is None:
+                self._entries.entries.clear()
+                return
+            for key in list(self._entries.entries):
+                if key[1] == schema and key[2] in (table_name, None):
+                    del self._entries.entries[key]
+
+    def _get_inspector(self):
+        return reflection.Inspector.from_engine(self._engine)
+
+    # Lists of metadata are copied, so that callers can modify them without modifying the catalog
+
+    def get_schema_names(self) -> List[str]:
+        return list(
+            self._get(
+                ("schema_names", None, None),
+                lambda: self._get_inspector().get_schema_names(),
+            )
+        )
+
+    def get_table_names(self, schema: Optional[str] = None) -> List[str]:
+        return list(
+            self._get(
+                ("table_names", schema, None),
+                lambda: self._get_inspector().get_table_names(schema=schema),
+            )
+        )
+
+    def get_view_names(self, schema: Optional[str] = None) -> List[str]:
+        return list(
+            self._get(
+                ("view_names", schema, None),
+                lambda: self._get_inspector().get_view_names(schema=schema),
+            )
+        )
+
+    def get_columns(
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        fallback: Optional[Callable[[], List[Dict]]] = None,
+        fallback_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
+    ) -> List[Dict]:
+        """The columns of a table, as returned by Inspector.get_columns.
+
+        If fallback is given, it is used to read the columns of tables which reflection does not find (which raise one
+        of fallback_exceptions, such as the KeyError raised for temporary tables) or returns no columns for (such as
+        mssql temporary tables); the columns it returns are cached as well.
+        """
+        if fallback_exceptions is None:
+            fallback_exceptions = (KeyError, AttributeError, sa.exc.NoSuchTableError)
+
+        def load_columns():
+            try:
+                columns = self._get_inspector().get_columns(table_name, schema=schema)
+            except fallback_exceptions:
+                if fallback is None:
+                    raise
+                columns = []
+            if len(columns) == 0 and fallback is not None:
+                columns = fallback()
+            return columns
+
+        return [
+            dict(column)
+            for column in self._get(("columns", schema, table_name), load_columns)
+        ]
+
+    def get_row_count_estimate(
+        self, table_name: str, schema: Optional[str] = None
+    ) -> Optional[int]:
+        """An estimate of the number of rows of a table from the statistics of the database, or None if the dialect
+        keeps no such statistics (or they are unavailable)."""
+
+        def load_row_count_estimate():
+            query = _ROW_COUNT_ESTIMATE_QUERIES.get(self._engine.dialect.name.lower())
+            if query is None:
+                return None
+            try:
+                row_count = self._engine.execute(
+                    sa.text(query), table_name=table_name, schema_name=schema
+                ).scalar()
+            except sa.exc.SQLAlchemyError as e:
+                logger.debug(
+                    f"Unable to read a row count estimate for table {table_name}: {e}"
+                )
+                return None
+            # Tables which were never analyzed have no (or a negative) estimate
+            if row_count is None or row_count < 0:
+                return None
+            return int(row_count)
+
+        return self._get(
+            ("row_count_estimate", schema, table_name), load_row_count_estimate
+        )
@@ -71,6 +71,10 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            # Exposing the aggregate itself allows PandasExecutionEngine to bundle aggregates sharing a compute domain
+            if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+                inner_func.column_aggregate_fn = metric_fn
+                inner_func.column_aggregate_kwargs = kwargs
             return inner_func
 
         return wrapper
@@ -1,4 +1,5 @@
 from .column_distinct_values import ColumnDistinctValues, ColumnDistinctValuesCount
+from .column_distribution_summary import ColumnDistributionSummary
 from .column_histogram import ColumnHistogram
 from .column_max import ColumnMax
 from .column_mean import ColumnMean
@@ -0,0 +1,348 @@
+import logging
+import math
+from numbers import Real
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from sqlalchemy.exc import DatabaseError
+except ImportError:
+    DatabaseError = None
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
+from great_expectations.expectations.metrics.column_aggregate_metric import (
+    ColumnMetricProvider,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+# The summary holds the values at the quantiles 0, 1 / 100, ..., 1 of a column
+DISTRIBUTION_SUMMARY_QUANTILE_COUNT = 100
+
+# Requested quantiles this close to a quantile of the summary (such as those computed with np.linspace) are read at it
+_QUANTILE_TOLERANCE = 1e-9
+
+# Dialects with approximate percentile functions, used when relative error is allowed
+_APPROXIMATE_DIALECTS = (
+    "bigquery",
+    "snowflake",
+    "redshift",
+    "awsathena",
+    "presto",
+    "trino",
+)
+
+
+def get_distribution_summary_quantiles() -> List[float]:
+    return [
+        idx / DISTRIBUTION_SUMMARY_QUANTILE_COUNT
+        for idx in range(DISTRIBUTION_SUMMARY_QUANTILE_COUNT + 1)
+    ]
+
+
+def get_distribution_summary_quantile_indexes(
+    quantiles: Iterable,
+) -> Optional[List[int]]:
+    """Return the indexes of quantiles among the quantiles of the distribution summary, or None if any of them is not
+    one of its quantiles (in which case it must be computed separately)."""
+    indexes = []
+    try:
+        for quantile in quantiles:
+            if isinstance(quantile, bool) or not isinstance(quantile, Real):
+                return None
+            scaled_quantile = float(quantile) * DISTRIBUTION_SUMMARY_QUANTILE_COUNT
+            idx = round(scaled_quantile)
+            if (
+                abs(scaled_quantile - idx) > _QUANTILE_TOLERANCE
+                or not 0 <= idx <= DISTRIBUTION_SUMMARY_QUANTILE_COUNT
+            ):
+                return None
+            indexes.append(idx)
+    except TypeError:
+        return None
+    return indexes
+
+
+def get_distribution_summary_allow_relative_error(
+    execution_engine: SqlAlchemyExecutionEngine, allow_relative_error: Any
+) -> bool:
+    """Return whether the distribution summary is computed approximately for allow_relative_error.
+
+    Dialects without approximate percentile functions always compute exact summaries, so that metrics allowing and not
+    allowing relative error share a single summary."""
+    return bool(allow_relative_error) and (
+        execution_engine.engine.dialect.name.lower() in _APPROXIMATE_DIALECTS
+    )
+
+
+def get_distribution_summary_metric_configuration(
+    metric_domain_kwargs: Dict, allow_relative_error: bool = False
+) -> MetricConfiguration:
+    return MetricConfiguration(
+        "column.distribution_summary",
+        metric_domain_kwargs,
+        {"allow_relative_error": allow_relative_error},
+    )
+
+
+class ColumnDistributionSummary(ColumnMetricProvider):
+    """The values of a SQL column at the quantiles 0, 1 / 100, ..., 1, and its median, computed with a single sort of
+    the column.
+
+    Median, quantile and partition metrics derive their values from the summary, so that a column is only sorted once
+    however many of them are computed. Exact summaries follow the semantics of percentile_disc: the value at quantile q
+    of n values is the value at (0-based) position max(ceil(q * n) - 1, 0) of the sorted values. When relative error is
+    allowed, summaries are computed with the approximate percentile functions of the dialect, if any.
+
+    The summary is a dictionary with keys "nonnull_count", "quantiles", "values", "median" and "is_exact".
+    """
+
+    metric_name = "column.distribution_summary"
+    value_keys = ("allow_relative_error",)
+    default_kwarg_values = {"allow_relative_error": False}
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: "SqlAlchemyExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        sqlalchemy_engine = execution_engine.engine
+        dialect = sqlalchemy_engine.dialect
+        nonnull_count = metrics["column_values.nonnull.count"]
+        quantiles = get_distribution_summary_quantiles()
+        summary = {
+            "nonnull_count": nonnull_count,
+            "quantiles": quantiles,
+            "values": [None] * len(quantiles),
+            "median": None,
+            "is_exact": True,
+        }
+        if not nonnull_count:
+            return summary
+
+        if metric_value_kwargs.get(
+            "allow_relative_error", False
+        ) and get_distribution_summary_allow_relative_error(execution_engine, True):
+            summary["values"] = _get_approximate_quantile_values(
+                column=column,
+                quantiles=quantiles,
+                dialect=dialect,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
+            summary["median"] = summary["values"][
+                DISTRIBUTION_SUMMARY_QUANTILE_COUNT // 2
+            ]
+            summary["is_exact"] = False
+            return summary
+
+        quantile_positions = [
+            max(math.ceil(quantile * nonnull_count) - 1, 0) for quantile in quantiles
+        ]
+        if nonnull_count % 2 == 0:
+            median_positions = [nonnull_count // 2 - 1, nonnull_count // 2]
+        else:
+            median_positions = [nonnull_count // 2]
+        values_at_positions = _get_values_at_positions(
+            column=column,
+            positions=sorted(set(quantile_positions + median_positions)),
+            nonnull_count=nonnull_count,
+            dialect=dialect,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+        summary["values"] = [
+            values_at_positions.get(position) for position in quantile_positions
+        ]
+        if len(median_positions) == 2:
+            # An even number of column values: take the average of the two center values
+            summary["median"] = (
+                float(
+                    values_at_positions[median_positions[0]]
+                    + values_at_positions[median_positions[1]]
+                )
+                / 2.0
+            )
+        else:
+            summary["median"] = values_at_positions[median_positions[0]]
+        return summary
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        dependencies["column_values.nonnull.count"] = MetricConfiguration(
+            "column_values.nonnull.count", metric.metric_domain_kwargs
+        )
+        return dependencies
+
+
+def _get_values_at_positions(
+    column,
+    positions: List[int],
+    nonnull_count: int,
+    dialect,
+    selectable,
+    sqlalchemy_engine,
+) -> Dict[int, Any]:
+    """Return the values at (0-based) positions of the sorted non-null values of column, with a single sort.
+
+    The percentile_disc functions of the dialect are used when it has any, and the values are otherwise read by their
+    row number."""
+    dialect_name = dialect.name.lower()
+    # (position + 0.5) / n is the fraction whose percentile_disc is the value at position
+    fractions = [(position + 0.5) / nonnull_count for position in positions]
+    if dialect_name == "postgresql":
+        # A single ordered-set aggregate with an array of fractions
+        query = sa.select(
+            [
+                sa.func.percentile_disc(
+                    sa.cast(
+                        sa.dialects.postgresql.array(fractions),
+                        sa.dialects.postgresql.ARRAY(
+                            sa.dialects.postgresql.DOUBLE_PRECISION
+                        ),
+                    )
+                ).within_group(column.asc())
+            ]
+        ).select_from(selectable)
+        try:
+            values = sqlalchemy_engine.execute(query).scalar()
+            return dict(zip(positions, values))
+        except DatabaseError:
+            # Redshift, connected to with the postgresql dialect, does not support arrays of fractions
+            logger.debug(
+                "Unable to compute percentile_disc of an array; computing it for each fraction instead."
+            )
+
+    if dialect_name in ("postgresql", "redshift", "snowflake"):
+        # Ordered-set aggregates sharing the same ordering are computed with a single sort
+        query = sa.select(
+            [
+                sa.func.percentile_disc(fraction).within_group(column.asc())
+                for fraction in fractions
+            ]
+        ).select_from(selectable)
+    elif dialect_name == "mssql":
+        # percentile_disc is only an analytic function, with the same value on every row
+        query = (
+            sa.select(
+                [
+                    sa.func.percentile_disc(fraction).within_group(column.asc()).over()
+                    for fraction in fractions
+                ]
+            )
+            .select_from(selectable)
+            .limit(1)
+        )
+    elif dialect_name == "bigquery":
+        # percentile_disc is only an analytic function (ignoring nulls), with the same value on every row
+        query = (
+            sa.select(
+                [
+                    sa.func.percentile_disc(column, fraction).over()
+                    for fraction in fractions
+                ]
+            )
+            .select_from(selectable)
+            .limit(1)
+        )
+    else:
+        query = None
+    if query is not None:
+        try:
+            return dict(zip(positions, sqlalchemy_engine.execute(query).fetchone()))
+        except DatabaseError:
+            logger.debug(
+                "Unable to compute percentile_disc; reading values by their row numbers instead."
+            )
+
+    ranked = (
+        sa.select(
+            [
+                column.label("value"),
+                (sa.func.row_number().over(order_by=column.asc()) - 1).label(
+                    "position"
+                ),
+            ]
+        )
+        .where(column != None)
+        .select_from(selectable)
+        .alias("ranked")
+    )
+    query = sa.select([ranked.c.position, ranked.c.value]).where(
+        ranked.c.position.in_(positions)
+    )
+    return {
+        int(position): value
+        for position, value in sqlalchemy_engine.execute(query).fetchall()
+    }
+
+
+def _get_approximate_quantile_values(
+    column, quantiles: List[float], dialect, selectable, sqlalchemy_engine
+) -> list:
+    dialect_name = dialect.name.lower()
+    if dialect_name == "bigquery":
+        # APPROX_QUANTILES returns the minimum, the n - 1 quantiles and the maximum of the column
+        query = sa.select(
+            [sa.func.APPROX_QUANTILES(column, DISTRIBUTION_SUMMARY_QUANTILE_COUNT)]
+        ).select_from(selectable)
+        return list(sqlalchemy_engine.execute(query).scalar())
+    elif dialect_name in ("awsathena", "presto", "trino"):
+        quantiles_array = sa.text(
+            "ARRAY[" + ", ".join(str(quantile) for quantile in quantiles) + "]"
+        )
+        query = sa.select(
+            [sa.func.approx_percentile(column, quantiles_array)]
+        ).select_from(selectable)
+        return list(sqlalchemy_engine.execute(query).scalar())
+    elif dialect_name == "snowflake":
+        selects = [
+            sa.func.approx_percentile(column, quantile) for quantile in quantiles
+        ]
+    else:
+        # Redshift supports approximate percentile_disc
+        selects = [
+            sa.text(
+                get_approximate_percentile_disc_sql(
+                    selects=[
+                        sa.func.percentile_disc(quantile).within_group(column.asc())
+                    ],
+                    sql_engine_dialect=dialect,
+                )
+            )
+            for quantile in quantiles
+        ]
+    query = sa.select(selects).select_from(selectable)
+    return list(sqlalchemy_engine.execute(query).fetchone())
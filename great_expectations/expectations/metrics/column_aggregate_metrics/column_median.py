@@ -16,7 +16,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
     column_aggregate_value,
 )
-from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distribution_summary import (
+    get_distribution_summary_metric_configuration,
+)
+from great_expectations.expectations.metrics.import_manager import F
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
     metric_value,
@@ -43,49 +46,8 @@ class ColumnMedian(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
-        (
-            selectable,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, MetricDomainTypes.COLUMN
-        )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
         """SqlAlchemy Median Implementation"""
-        if dialect.name.lower() == "awsathena":
-            raise NotImplementedError("AWS Athena does not support OFFSET.")
-        nonnull_count = metrics.get("column_values.nonnull.count")
-        if not nonnull_count:
-            return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
-        )
-
-        column_values = list(element_values.fetchall())
-
-        if len(column_values) == 0:
-            column_median = None
-        elif nonnull_count % 2 == 0:
-            # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
-                )
-                / 2.0
-            )  # Average center values
-        else:
-            # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
+        return metrics["column.distribution_summary"]["median"]
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
@@ -156,8 +118,12 @@ class ColumnMedian(ColumnMetricProvider):
         )
 
         if isinstance(execution_engine, SqlAlchemyExecutionEngine):
-            dependencies["column_values.nonnull.count"] = MetricConfiguration(
-                "column_values.nonnull.count", metric.metric_domain_kwargs
+            # The median is read from the exact distribution summary, which is shared with quantile and partition
+            # metrics of the column
+            dependencies[
+                "column.distribution_summary"
+            ] = get_distribution_summary_metric_configuration(
+                metric.metric_domain_kwargs
             )
 
         return dependencies
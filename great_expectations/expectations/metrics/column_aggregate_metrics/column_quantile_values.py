@@ -1,11 +1,15 @@
 import logging
 import traceback
 from collections import Iterable
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    MetricDomainTypes,
+)
 
 try:
     from sqlalchemy.engine import RowProxy
@@ -35,8 +39,14 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distribution_summary import (
+    get_distribution_summary_allow_relative_error,
+    get_distribution_summary_metric_configuration,
+    get_distribution_summary_quantile_indexes,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +79,15 @@ class ColumnQuantileValues(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        distribution_summary = metrics.get("column.distribution_summary")
+        if distribution_summary is not None:
+            return [
+                distribution_summary["values"][idx]
+                for idx in get_distribution_summary_quantile_indexes(
+                    metric_value_kwargs["quantiles"]
+                )
+            ]
+
         (
             selectable,
             compute_domain_kwargs,
@@ -161,6 +180,40 @@ class ColumnQuantileValues(ColumnMetricProvider):
             )
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        # Quantiles of the distribution summary are read from it, so that the column is sorted once for all of the
+        # median, quantile and partition metrics of the column; other quantiles are computed with their own query
+        if isinstance(
+            execution_engine, SqlAlchemyExecutionEngine
+        ) and get_distribution_summary_quantile_indexes(
+            metric.metric_value_kwargs["quantiles"]
+        ):
+            dependencies[
+                "column.distribution_summary"
+            ] = get_distribution_summary_metric_configuration(
+                metric.metric_domain_kwargs,
+                get_distribution_summary_allow_relative_error(
+                    execution_engine,
+                    metric.metric_value_kwargs.get("allow_relative_error", False),
+                ),
+            )
+
+        return dependencies
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
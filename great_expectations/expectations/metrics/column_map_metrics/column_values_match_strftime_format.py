@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -9,6 +11,7 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_unique_values
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -28,7 +31,26 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        return column.map(is_parseable_by_format)
+        def are_parseable_by_format(values):
+            if not all(isinstance(val, str) for val in values):
+                return [is_parseable_by_format(val) for val in values]
+            try:
+                formatted_values = pd.to_datetime(
+                    values, format=strftime_format, errors="coerce"
+                ).strftime(strftime_format)
+            except (AttributeError, OverflowError, TypeError, ValueError):
+                return [is_parseable_by_format(val) for val in values]
+            # pandas may parse values more leniently than strptime, or fail to parse values strptime accepts (e.g. out
+            # of bounds dates), so only values reproduced exactly by formatting their parsed datetime are accepted
+            # without falling back to strptime.
+            return [
+                formatted_val == val or is_parseable_by_format(val)
+                for val, formatted_val in zip(values, formatted_values)
+            ]
+
+        return map_unique_values(
+            column, is_parseable_by_format, are_parseable_by_format
+        )
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
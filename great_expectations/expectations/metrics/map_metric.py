@@ -754,36 +754,47 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     (selectable, _, _,) = execution_engine.get_compute_domain(
         compute_domain_kwargs, domain_type="identity"
     )
-    temp_table_name: str = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-    if execution_engine.dialect == "mssql":
+
+    count_case_statement: List[sa.sql.elements.Label] = [
+        sa.case(
+            [
+                (
+                    unexpected_condition,
+                    1,
+                )
+            ],
+            else_=0,
+        ).label("condition")
+    ]
+
+    temp_table_obj: Optional[sa.Table] = None
+    if execution_engine.engine.dialect.name.lower() == "mssql":
+        # mssql does not evaluate the window function of the condition in a subquery of the aggregate, so the
+        # condition is materialized into a temporary table, which is dropped once the count has been computed.
         # mssql expects all temporary table names to have a prefix '#'
-        temp_table_name = f"#{temp_table_name}"
-
-    with execution_engine.engine.begin():
-        metadata: sa.MetaData = sa.MetaData(execution_engine.engine)
-        temp_table_obj: sa.Table = sa.Table(
-            temp_table_name,
-            metadata,
-            sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
-        )
-        temp_table_obj.create(execution_engine.engine, checkfirst=True)
+        temp_table_name: str = f"#ge_tmp_{str(uuid.uuid4())[:8]}"
+        with execution_engine.engine.begin():
+            metadata: sa.MetaData = sa.MetaData(execution_engine.engine)
+            temp_table_obj = sa.Table(
+                temp_table_name,
+                metadata,
+                sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
+            )
+            temp_table_obj.create(execution_engine.engine, checkfirst=True)
 
-        count_case_statement: List[sa.sql.elements.Label] = [
-            sa.case(
-                [
-                    (
-                        unexpected_condition,
-                        1,
-                    )
-                ],
-                else_=0,
-            ).label("condition")
-        ]
-        inner_case_query: sa.sql.dml.Insert = temp_table_obj.insert().from_select(
-            count_case_statement,
-            sa.select(count_case_statement).select_from(selectable),
+            inner_case_query: sa.sql.dml.Insert = temp_table_obj.insert().from_select(
+                count_case_statement,
+                sa.select(count_case_statement).select_from(selectable),
+            )
+            execution_engine.engine.execute(inner_case_query)
+        count_selectable = temp_table_obj
+    else:
+        # Elsewhere, the condition is computed in a subquery and summed in a single statement
+        count_selectable = (
+            sa.select(count_case_statement)
+            .select_from(selectable)
+            .alias("UnexpectedConditionSubquery")
         )
-        execution_engine.engine.execute(inner_case_query)
 
     unexpected_count_query: sa.Select = (
         sa.select(
@@ -791,17 +802,21 @@ def _sqlalchemy_map_condition_unexpected_count_value(
                 sa.func.sum(sa.column("condition")).label("unexpected_count"),
             ]
         )
-        .select_from(temp_table_obj)
+        .select_from(count_selectable)
         .alias("UnexpectedCountSubquery")
     )
 
-    unexpected_count = execution_engine.engine.execute(
-        sa.select(
-            [
-                unexpected_count_query.c.unexpected_count,
-            ]
-        )
-    ).scalar()
+    try:
+        unexpected_count = execution_engine.engine.execute(
+            sa.select(
+                [
+                    unexpected_count_query.c.unexpected_count,
+                ]
+            )
+        ).scalar()
+    finally:
+        if temp_table_obj is not None:
+            temp_table_obj.drop(execution_engine.engine, checkfirst=True)
 
     return convert_to_json_serializable(unexpected_count)
 
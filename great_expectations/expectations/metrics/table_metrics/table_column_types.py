@@ -10,11 +10,10 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
-from great_expectations.expectations.metrics.import_manager import (
-    reflection,
-    sa,
-    sparktypes,
+from great_expectations.execution_engine.sqlalchemy_metadata_catalog import (
+    SqlAlchemyMetadataCatalog,
 )
+from great_expectations.expectations.metrics.import_manager import sparktypes
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.table_metric import TableMetricProvider
 from great_expectations.expectations.metrics.util import column_reflection_fallback
@@ -37,10 +36,23 @@ class ColumnTypes(TableMetricProvider):
         df, _, _ = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
-        return [
+        column_types = [
             {"name": name, "type": dtype}
             for (name, dtype) in zip(df.columns, df.dtypes)
         ]
+        source_schema = getattr(
+            _get_batch_data(execution_engine, metric_domain_kwargs),
+            "source_schema",
+            None,
+        )
+        if source_schema is not None:
+            # Columns which were not loaded are described by the schema of the source of the batch
+            loaded_column_types = {column["name"]: column for column in column_types}
+            column_types = [
+                loaded_column_types.get(column["name"], column)
+                for column in source_schema
+            ]
+        return column_types
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
@@ -51,21 +63,10 @@ class ColumnTypes(TableMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
-        batch_id = metric_domain_kwargs.get("batch_id")
-        if batch_id is None:
-            if execution_engine.active_batch_data_id is not None:
-                batch_id = execution_engine.active_batch_data_id
-            else:
-                raise GreatExpectationsError(
-                    "batch_id could not be determined from domain kwargs and no active_batch_data is loaded into the "
-                    "execution engine"
-                )
-        batch_data = execution_engine.loaded_batch_data_dict.get(batch_id)
-        if batch_data is None:
-            raise GreatExpectationsError(
-                "the requested batch is not available; please load the batch into the execution engine."
-            )
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        batch_data = _get_batch_data(execution_engine, metric_domain_kwargs)
+        return _get_sqlalchemy_column_metadata(
+            execution_engine.engine, batch_data, execution_engine.metadata_catalog
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -79,41 +80,53 @@ class ColumnTypes(TableMetricProvider):
         df, _, _ = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
+        schema = getattr(
+            _get_batch_data(execution_engine, metric_domain_kwargs),
+            "source_schema",
+            None,
+        )
+        if schema is None:
+            schema = df.schema
         return _get_spark_column_metadata(
-            df.schema, include_nested=metric_value_kwargs["include_nested"]
+            schema, include_nested=metric_value_kwargs["include_nested"]
         )
 
 
-def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
-    insp = reflection.Inspector.from_engine(engine)
+def _get_batch_data(execution_engine, metric_domain_kwargs: Dict):
+    batch_id = metric_domain_kwargs.get("batch_id")
+    if batch_id is None:
+        if execution_engine.active_batch_data_id is not None:
+            batch_id = execution_engine.active_batch_data_id
+        else:
+            raise GreatExpectationsError(
+                "batch_id could not be determined from domain kwargs and no active_batch_data is loaded into the "
+                "execution engine"
+            )
+    batch_data = execution_engine.loaded_batch_data_dict.get(batch_id)
+    if batch_data is None:
+        raise GreatExpectationsError(
+            "the requested batch is not available; please load the batch into the execution engine."
+        )
+    return batch_data
+
 
+def _get_sqlalchemy_column_metadata(
+    engine, batch_data: SqlAlchemyBatchData, metadata_catalog: SqlAlchemyMetadataCatalog
+):
     table_name = batch_data.source_table_name or batch_data.selectable.name
     schema_name = batch_data.source_schema_name or batch_data.selectable.schema
 
-    try:
-        columns = insp.get_columns(
-            table_name,
-            schema=schema_name,
-        )
-
-    except (KeyError, AttributeError, sa.exc.NoSuchTableError):
-        # we will get a KeyError for temporary tables, since
-        # reflection will not find the temporary schema
-        columns = column_reflection_fallback(
-            selectable=batch_data.selectable,
-            dialect=batch_data.sql_engine_dialect,
-            sqlalchemy_engine=engine,
-        )
-
-    # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
-    if len(columns) == 0:
-        columns = column_reflection_fallback(
+    # we will get a KeyError for temporary tables, since reflection will not find the temporary schema, and for mssql
+    # reflection doesn't throw an error but returns an empty list, so both fall back to querying the columns
+    return metadata_catalog.get_columns(
+        table_name,
+        schema=schema_name,
+        fallback=lambda: column_reflection_fallback(
             selectable=batch_data.selectable,
             dialect=batch_data.sql_engine_dialect,
             sqlalchemy_engine=engine,
-        )
-
-    return columns
+        ),
+    )
 
 
 def _get_spark_column_metadata(field, parent_name="", include_nested=True):
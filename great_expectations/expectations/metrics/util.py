@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 try:
@@ -253,6 +254,42 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def map_unique_values(
+    column: pd.Series,
+    map_fn: Callable,
+    map_unique_values_fn: Optional[Callable] = None,
+) -> pd.Series:
+    """Map the values of a pandas Series by computing map_fn once per distinct value, rather than once per row, and
+    broadcasting the results back to the rows of the Series.
+
+    Args:
+        column: the Series to map
+        map_fn: the function to apply to each value
+        map_unique_values_fn: optionally, a vectorized alternative to map_fn, which is given the distinct values of
+            column as a pandas Index and returns a list of their mapped values
+
+    Returns:
+        A Series with the mapped values, indexed like column. Columns with null values or with unhashable values
+        (which cannot be deduplicated) are mapped row by row with map_fn.
+    """
+    if len(column) == 0:
+        return column.map(map_fn)
+    try:
+        codes, unique_values = pd.factorize(column)
+    except TypeError:
+        return column.map(map_fn)
+    if (codes == -1).any():
+        return column.map(map_fn)
+
+    if map_unique_values_fn is None:
+        mapped_unique_values = [map_fn(value) for value in unique_values]
+    else:
+        mapped_unique_values = map_unique_values_fn(unique_values)
+    return pd.Series(
+        np.asarray(mapped_unique_values)[codes], index=column.index, name=column.name
+    )
+
+
 def filter_pair_metric_nulls(column_A, column_B, ignore_row_if):
     if ignore_row_if == "both_values_are_missing":
         boolean_mapped_null_values = column_A.isnull() & column_B.isnull()
@@ -6,6 +6,7 @@ from great_expectations.profile.base import (
     ProfilerDataType,
     ProfilerTypeMapping,
 )
+from great_expectations.profile.sketches import build_table_sketch
 
 try:
     from sqlalchemy.exc import OperationalError
@@ -71,24 +72,32 @@ class BasicDatasetProfilerBase(DatasetProfiler):
         return type_
 
     @classmethod
-    def _get_column_cardinality(cls, df, column):
+    def _get_column_cardinality(cls, df, column, column_sketch=None):
         num_unique = None
         pct_unique = None
-        df.set_config_value("interactive_evaluation", True)
 
-        try:
-            num_unique = df.expect_column_unique_value_count_to_be_between(
-                column, None, None
-            ).result["observed_value"]
-            pct_unique = df.expect_column_proportion_of_unique_values_to_be_between(
+        if column_sketch is not None:
+            # the expectations are still added to the suite, but their values are read from the sketch of the column
+            df.expect_column_unique_value_count_to_be_between(column, None, None)
+            df.expect_column_proportion_of_unique_values_to_be_between(
                 column, None, None
-            ).result["observed_value"]
-        except KeyError:  # if observed_value value is not set
-            logger.error(
-                "Failed to get cardinality of column {:s} - continuing...".format(
-                    column
-                )
             )
+            num_unique, pct_unique = column_sketch.get_unique_counts()
+        else:
+            df.set_config_value("interactive_evaluation", True)
+            try:
+                num_unique = df.expect_column_unique_value_count_to_be_between(
+                    column, None, None
+                ).result["observed_value"]
+                pct_unique = df.expect_column_proportion_of_unique_values_to_be_between(
+                    column, None, None
+                ).result["observed_value"]
+            except KeyError:  # if observed_value value is not set
+                logger.error(
+                    "Failed to get cardinality of column {:s} - continuing...".format(
+                        column
+                    )
+                )
 
         if num_unique is None or num_unique == 0 or pct_unique is None:
             cardinality = ProfilerCardinality.NONE
@@ -123,6 +132,10 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
     The profiler reports how unique the values in the column are, as well as the percentage of empty values in it.
     Based on the column's type it provides a description of the column by computing a number of statistics,
     such as min, max, mean and median, for numeric columns, and distribution of values, when appropriate.
+
+    With a configuration of {"use_sketches": True}, the cardinality of every column is read from sketches of the
+    dataset built in a single pass over its data, rather than computed column by column. An optional "sketch_config"
+    entry of the configuration is passed to build_table_sketch.
     """
 
     @classmethod
@@ -137,6 +150,12 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
 
         columns = df.get_table_columns()
 
+        table_sketch = None
+        if configuration is not None and configuration.get("use_sketches"):
+            table_sketch = build_table_sketch(
+                df, columns=columns, sketch_config=configuration.get("sketch_config")
+            )
+
         meta_columns = {}
         for column in columns:
             meta_columns[column] = {"description": ""}
@@ -152,7 +171,13 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
             # df.expect_column_to_exist(column)
 
             type_ = cls._get_column_type(df, column)
-            cardinality = cls._get_column_cardinality(df, column)
+            cardinality = cls._get_column_cardinality(
+                df,
+                column,
+                column_sketch=table_sketch.columns[column]
+                if table_sketch is not None
+                else None,
+            )
             df.expect_column_values_to_not_be_null(
                 column, mostly=0.5
             )  # The renderer will show a warning for columns that do not meet this expectation
@@ -0,0 +1,706 @@
+"""Mergeable sketches used to profile every column of a dataset in a single pass over its data.
+
+Each sketch can be updated with chunks of data and merged with a sketch of the same configuration built on other data,
+so that a table can be sketched chunk by chunk (pandas, SQL), or partition by partition (Spark) before merging the
+partial sketches:
+
+- HyperLogLog estimates the number of distinct values of a column.
+- KllSketch estimates the quantiles of a numeric column.
+- SpaceSavingSketch keeps the most frequent values of a column, and all of its distinct values with their exact counts
+  as long as there are no more of them than its capacity.
+
+A ColumnSketch holds these sketches along with the exact counts, extrema and moments of a column, and a TableSketch
+holds a ColumnSketch for each column of a table.
+"""
+
+import logging
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
+from great_expectations.exceptions import ProfilerError
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.pandas_batch_data import PandasChunkedBatchData
+from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+DEFAULT_SKETCH_CHUNK_SIZE = 100000
+DEFAULT_HLL_PRECISION = 14
+DEFAULT_KLL_K = 200
+DEFAULT_TOP_K = 1000
+
+# Bit length of every 16-bit integer, used to count the leading zeros of 64-bit hashes
+_BIT_LENGTH_16 = np.zeros(2**16, dtype=np.int64)
+_BIT_LENGTH_16[1:] = np.floor(np.log2(np.arange(1, 2**16))).astype(np.int64) + 1
+
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    """Hash values to 64-bit integers, such that equal values of a column hash alike across chunks of different dtypes
+    (e.g. integers read as floats in a chunk with missing values)."""
+    if pd.api.types.is_bool_dtype(values) or not pd.api.types.is_numeric_dtype(values):
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return pd.util.hash_array(
+                values.to_numpy(dtype="datetime64[ns]").view("int64")
+            )
+        return pd.util.hash_array(values.astype(str).to_numpy(dtype=object))
+    return pd.util.hash_array(values.to_numpy(dtype="float64"))
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch of the number of distinct values of a column, with 2 ** precision registers.
+
+    The standard error of its estimate is about 1.04 / sqrt(2 ** precision), i.e. 0.8% with the default precision.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise ValueError("hll_precision must be an integer between 4 and 18.")
+        self._precision = precision
+        self._registers = np.zeros(2**precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: pd.Series) -> None:
+        if len(values) == 0:
+            return
+        hashes = _hash_values(values)
+        indexes = (hashes >> np.uint64(64 - self._precision)).astype(np.int64)
+        remaining_bits = hashes << np.uint64(self._precision)
+        leading_zeros = np.full(len(hashes), 64, dtype=np.int64)
+        found = np.zeros(len(hashes), dtype=bool)
+        for position, shift in enumerate([48, 32, 16, 0]):
+            word = ((remaining_bits >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(
+                np.int64
+            )
+            in_word = (word != 0) & ~found
+            leading_zeros[in_word] = position * 16 + 16 - _BIT_LENGTH_16[word[in_word]]
+            found |= in_word
+        ranks = np.minimum(leading_zeros + 1, 64 - self._precision + 1)
+        np.maximum.at(self._registers, indexes, ranks.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self._precision:
+            raise ValueError("Only HyperLogLog sketches of equal precision can merge.")
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(float)))
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / empty_registers)
+        return float(estimate)
+
+
+class KllSketch:
+    """A KLL sketch of the distribution of the values of a numeric column, keeping about 3 * k of them.
+
+    Values are exact until the sketch first compacts its values; after that, the rank of a value returned by
+    get_value_at_rank is within rank_error * count of the requested rank with high probability (about 1.3% with the
+    default k of 200).
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, random_seed: Optional[int] = None):
+        if not isinstance(k, int) or k < 8:
+            raise ValueError("kll_k must be an integer of at least 8.")
+        self._k = k
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._count = 0
+        self._is_exact = True
+        self._random_state = np.random.RandomState(random_seed)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def is_exact(self) -> bool:
+        return self._is_exact
+
+    @property
+    def rank_error(self) -> float:
+        """The normalized rank error of the values returned by the sketch (0 while it is exact)."""
+        if self._is_exact:
+            return 0.0
+        # Empirical bound on the double-sided normalized rank error of KLL sketches, with 99% confidence
+        return 2.296 / self._k**0.9723
+
+    def _get_capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self._k * (2.0 / 3.0) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._count += len(values)
+        self._compress()
+
+    def merge(self, other: "KllSketch") -> "KllSketch":
+        if other.k != self._k:
+            raise ValueError("Only KLL sketches with equal k can merge.")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, values in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], values])
+        self._count += other.count
+        self._is_exact = self._is_exact and other.is_exact
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        while sum(len(values) for values in self._levels) > sum(
+            self._get_capacity(level) for level in range(len(self._levels))
+        ):
+            for level in range(len(self._levels)):
+                if len(self._levels[level]) >= self._get_capacity(level):
+                    self._compact(level)
+                    break
+
+    def _compact(self, level: int) -> None:
+        """Promote every other value of a level to the next level, where each value stands for twice as many."""
+        if level + 1 == len(self._levels):
+            self._levels.append(np.empty(0))
+        values = np.sort(self._levels[level])
+        kept = np.empty(0)
+        if len(values) % 2 == 1:
+            kept, values = values[-1:], values[:-1]
+        offset = self._random_state.randint(2)
+        self._levels[level + 1] = np.concatenate(
+            [self._levels[level + 1], values[offset::2]]
+        )
+        self._levels[level] = kept
+        self._is_exact = False
+
+    def _get_sorted_values_and_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_values), 2**level, dtype=np.int64)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="mergesort")
+        return values[order], weights[order]
+
+    def get_values_at_ranks(self, ranks: List[int]) -> List[float]:
+        """Return the values at the given 0-based ranks, in the order of the sketched values."""
+        values, weights = self._get_sorted_values_and_weights()
+        cumulative_weights = np.cumsum(weights)
+        indexes = np.searchsorted(cumulative_weights, np.asarray(ranks), side="right")
+        return [values[min(index, len(values) - 1)] for index in indexes]
+
+
+class SpaceSavingSketch:
+    """A space-saving sketch of the most frequent values of a column, keeping at most capacity of them.
+
+    While the column has no more distinct values than capacity, the sketch holds all of them with their exact counts.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TOP_K):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("top_k must be a positive integer.")
+        self._capacity = capacity
+        self._counts = pd.Series([], dtype="int64")
+        self._errors = pd.Series([], dtype="int64")
+        self._is_exact = True
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def is_exact(self) -> bool:
+        return self._is_exact
+
+    def __len__(self):
+        return len(self._counts)
+
+    def update(self, value_counts: pd.Series) -> None:
+        """Add the counts of a chunk of the column, given as a Series of counts indexed by value."""
+        self._merge_counts(
+            value_counts.astype("int64"),
+            pd.Series(0, index=value_counts.index, dtype="int64"),
+            is_exact=True,
+        )
+
+    def merge(self, other: "SpaceSavingSketch") -> "SpaceSavingSketch":
+        if other.capacity != self._capacity:
+            raise ValueError("Only space-saving sketches of equal capacity can merge.")
+        self._merge_counts(other._counts, other._errors, is_exact=other.is_exact)
+        return self
+
+    def _get_missing_count(self) -> int:
+        # A value missing from a sketch that has dropped values occurred at most as often as its least frequent value
+        return 0 if self._is_exact or len(self._counts) == 0 else self._counts.min()
+
+    def _merge_counts(self, counts: pd.Series, errors: pd.Series, is_exact: bool):
+        own_missing_count = self._get_missing_count()
+        other_missing_count = 0 if is_exact or len(counts) == 0 else counts.min()
+        index = self._counts.index.union(counts.index, sort=False)
+        merged_counts = self._counts.reindex(
+            index, fill_value=own_missing_count
+        ) + counts.reindex(index, fill_value=other_missing_count)
+        merged_errors = self._errors.reindex(
+            index, fill_value=own_missing_count
+        ) + errors.reindex(index, fill_value=other_missing_count)
+        self._is_exact = self._is_exact and is_exact
+        if len(merged_counts) > self._capacity:
+            merged_counts = merged_counts.nlargest(self._capacity, keep="first")
+            merged_errors = merged_errors.reindex(merged_counts.index)
+            self._is_exact = False
+        self._counts = merged_counts.astype("int64")
+        self._errors = merged_errors.astype("int64")
+
+    def get_top_values(self, n: Optional[int] = None) -> List[Tuple[object, int]]:
+        """The most frequent values with their counts, which are upper bounds on the exact counts unless is_exact."""
+        counts = self._counts.sort_values(ascending=False, kind="mergesort")
+        if n is not None:
+            counts = counts.iloc[:n]
+        return list(counts.items())
+
+    def get_distinct_values(self) -> Optional[list]:
+        """All the distinct values of the column in sorted order, or None if the sketch does not hold all of them."""
+        if not self._is_exact:
+            return None
+        values = list(self._counts.index)
+        try:
+            return sorted(values)
+        except TypeError:
+            return values
+
+
+class ColumnSketch:
+    """Statistics of a column computed in a single pass over its values, updated chunk by chunk.
+
+    Counts, extrema and sums are exact. The distinct count is exact while the column has no more distinct values than
+    top_k, and estimated with a HyperLogLog sketch otherwise; quantiles of numeric columns are estimated with a KLL
+    sketch.
+    """
+
+    def __init__(self, name: str, sketch_config: Optional[dict] = None):
+        sketch_config = sketch_config or {}
+        self._name = name
+        self._count = 0
+        self._nonnull_count = 0
+        self._is_numeric = None
+        self._is_integer = None
+        self._min = None
+        self._max = None
+        self._sum = 0.0
+        self._abs_sum = 0.0
+        self._sum_of_squares = 0.0
+        self._hll = HyperLogLog(
+            precision=sketch_config.get("hll_precision", DEFAULT_HLL_PRECISION)
+        )
+        self._kll = KllSketch(
+            k=sketch_config.get("kll_k", DEFAULT_KLL_K),
+            random_seed=sketch_config.get("random_seed"),
+        )
+        self._top_values = SpaceSavingSketch(
+            capacity=sketch_config.get("top_k", DEFAULT_TOP_K)
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def nonnull_count(self) -> int:
+        return self._nonnull_count
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether the column holds numbers (not booleans), for which numeric statistics are available."""
+        return bool(self._is_numeric) and self._nonnull_count > 0
+
+    @property
+    def min(self):
+        return self._min if self.is_numeric else None
+
+    @property
+    def max(self):
+        return self._max if self.is_numeric else None
+
+    @property
+    def sum(self) -> Optional[float]:
+        return self._sum if self.is_numeric else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum / self._nonnull_count if self.is_numeric else None
+
+    @property
+    def mean_error(self) -> Optional[float]:
+        """A bound on the floating point error of mean, which depends on the order in which values were summed."""
+        if not self.is_numeric:
+            return None
+        return (
+            self._nonnull_count
+            * np.finfo(float).eps
+            * (self._abs_sum / self._nonnull_count)
+        )
+
+    @property
+    def stdev(self) -> Optional[float]:
+        """The sample standard deviation of the column, as computed by pandas."""
+        if not self.is_numeric or self._nonnull_count < 2:
+            return None
+        variance = (
+            self._sum_of_squares - self._sum * self._sum / self._nonnull_count
+        ) / (self._nonnull_count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    @property
+    def top_values(self) -> SpaceSavingSketch:
+        return self._top_values
+
+    @property
+    def distinct_values(self) -> Optional[list]:
+        """The sorted distinct values of the column, or None if there are more of them than top_k."""
+        return self._top_values.get_distinct_values()
+
+    @property
+    def distinct_count(self) -> int:
+        if self._top_values.is_exact:
+            return len(self._top_values)
+        return int(
+            min(
+                max(round(self._hll.estimate()), len(self._top_values)),
+                self._nonnull_count,
+            )
+        )
+
+    def get_distinct_count_bounds(self) -> Tuple[int, int]:
+        """Bounds on the number of distinct values of the column, three standard errors away from its estimate."""
+        if self._top_values.is_exact:
+            return len(self._top_values), len(self._top_values)
+        estimate = self._hll.estimate()
+        error = 3 * self._hll.relative_error * estimate
+        return (
+            int(max(len(self._top_values), math.floor(estimate - error))),
+            int(min(self._nonnull_count, math.ceil(estimate + error))),
+        )
+
+    def get_unique_counts(self) -> Tuple[int, Optional[float]]:
+        """The number and proportion of unique values of the column, as used by profilers to classify its cardinality.
+
+        A column whose distinct count is estimated is reported as unique when its bounds reach its number of values.
+        """
+        if self._nonnull_count == 0:
+            return 0, None
+        if self._top_values.is_exact:
+            distinct_count = len(self._top_values)
+        elif self.get_distinct_count_bounds()[1] >= self._nonnull_count:
+            distinct_count = self._nonnull_count
+        else:
+            distinct_count = self.distinct_count
+        return distinct_count, distinct_count / self._nonnull_count
+
+    def get_quantile_bounds(self, quantiles: List[float]) -> Optional[List[list]]:
+        """Bounds on the values of the column at the given quantiles, or None if the column is not numeric.
+
+        While the sketch is exact, the bounds are the values at the quantiles both with "lower" interpolation (as
+        computed by pandas) and as a discrete percentile (as computed by SQL backends), which are often equal.
+        """
+        if not self.is_numeric:
+            return None
+        count = self._kll.count
+        error = self._kll.rank_error
+        ranks = []
+        for quantile in quantiles:
+            ranks.append(int(math.floor(max(quantile - error, 0.0) * (count - 1))))
+            ranks.append(max(int(math.ceil(min(quantile + error, 1.0) * count)) - 1, 0))
+        values = self._kll.get_values_at_ranks(ranks)
+        if self._is_integer:
+            values = [int(value) for value in values]
+        return [
+            convert_to_json_serializable([values[i], values[i + 1]])
+            for i in range(0, len(values), 2)
+        ]
+
+    def get_median_bounds(self) -> Optional[List]:
+        """Bounds on the median of the column, which is the median itself while the sketch is exact."""
+        if not self.is_numeric:
+            return None
+        count = self._kll.count
+        if self._kll.is_exact:
+            lower, upper = self._kll.get_values_at_ranks([(count - 1) // 2, count // 2])
+            median = convert_to_json_serializable((lower + upper) / 2)
+            return [median, median]
+        return self.get_quantile_bounds([0.5])[0]
+
+    def update(self, values: pd.Series) -> None:
+        self._count += len(values)
+        values = values.dropna()
+        if len(values) == 0:
+            return
+        self._nonnull_count += len(values)
+        value_counts = values.value_counts(sort=False)
+        self._top_values.update(value_counts)
+        self._hll.update(value_counts.index.to_series())
+
+        is_numeric = pd.api.types.is_numeric_dtype(
+            values
+        ) and not pd.api.types.is_bool_dtype(values)
+        if self._is_numeric is None:
+            self._is_numeric = is_numeric
+        elif self._is_numeric and not is_numeric:
+            logger.debug(
+                f"Column {self._name} holds non-numeric values; numeric statistics are not sketched for it."
+            )
+            self._is_numeric = False
+        if not self._is_numeric:
+            return
+        is_integer = pd.api.types.is_integer_dtype(values)
+        self._is_integer = (
+            is_integer if self._is_integer is None else self._is_integer and is_integer
+        )
+        array = values.to_numpy(dtype="float64")
+        self._update_extrema(values.min(), values.max())
+        self._sum += float(array.sum())
+        self._abs_sum += float(np.abs(array).sum())
+        self._sum_of_squares += float(np.square(array).sum())
+        self._kll.update(array)
+
+    def _update_extrema(self, minimum, maximum) -> None:
+        minimum, maximum = (
+            convert_to_json_serializable(minimum),
+            convert_to_json_serializable(maximum),
+        )
+        self._min = minimum if self._min is None else min(self._min, minimum)
+        self._max = maximum if self._max is None else max(self._max, maximum)
+
+    def merge(self, other: "ColumnSketch") -> "ColumnSketch":
+        self._count += other._count
+        if other._nonnull_count == 0:
+            return self
+        self._nonnull_count += other._nonnull_count
+        self._top_values.merge(other._top_values)
+        self._hll.merge(other._hll)
+        if self._is_numeric is None:
+            self._is_numeric = other._is_numeric
+            self._is_integer = other._is_integer
+        else:
+            self._is_numeric = self._is_numeric and other._is_numeric
+            self._is_integer = self._is_integer and other._is_integer
+        if self._is_numeric:
+            self._update_extrema(other._min, other._max)
+            self._sum += other._sum
+            self._abs_sum += other._abs_sum
+            self._sum_of_squares += other._sum_of_squares
+            self._kll.merge(other._kll)
+        return self
+
+
+class TableSketch:
+    """Sketches of the columns of a table, updated with chunks of its rows (as DataFrames) or merged with the sketch of
+    other rows of the table."""
+
+    def __init__(self, columns: List[str], sketch_config: Optional[dict] = None):
+        self._sketch_config = sketch_config or {}
+        self._row_count = 0
+        self._columns = {
+            column: ColumnSketch(column, sketch_config=self._sketch_config)
+            for column in columns
+        }
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def columns(self) -> Dict[str, ColumnSketch]:
+        return self._columns
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self._row_count += len(chunk)
+        for column, column_sketch in self._columns.items():
+            column_sketch.update(chunk[column])
+
+    def merge(self, other: "TableSketch") -> "TableSketch":
+        self._row_count += other.row_count
+        for column, column_sketch in self._columns.items():
+            column_sketch.merge(other.columns[column])
+        return self
+
+
+def build_table_sketch(
+    data_asset, columns: Optional[List[str]] = None, sketch_config: dict = None
+) -> TableSketch:
+    """Sketch the given columns (or all columns) of a Dataset, or of the active batch of a Validator, reading its data
+    once.
+
+    The data of a pandas dataset is sketched in chunks of sketch_config["chunk_size"] rows, a SQL table is read with a
+    single streamed query, and a Spark DataFrame is sketched partition by partition before the sketches of its
+    partitions are merged.
+
+    Args:
+        data_asset: A PandasDataset, SqlAlchemyDataset or SparkDFDataset, or a Validator
+        columns: The columns to sketch, all columns of the data if None
+        sketch_config: Optional parameters of the sketches: "chunk_size", "hll_precision", "kll_k", "top_k" and
+            "random_seed"
+
+    Returns:
+        A TableSketch of the columns
+    """
+    sketch_config = dict(sketch_config or {})
+    chunk_size = sketch_config.pop("chunk_size", DEFAULT_SKETCH_CHUNK_SIZE)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size for sketching data must be a positive integer.")
+
+    if isinstance(data_asset, Validator):
+        execution_engine = data_asset.execution_engine
+        batch_data = execution_engine.active_batch_data
+        if isinstance(execution_engine, PandasExecutionEngine):
+            if isinstance(batch_data, PandasChunkedBatchData):
+                chunks = batch_data.iter_chunks()
+            else:
+                chunks = _iter_dataframe_chunks(batch_data.dataframe, chunk_size)
+            return _build_table_sketch_from_chunks(chunks, columns, sketch_config)
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            if columns is None:
+                columns = data_asset.get_metric(
+                    MetricConfiguration("table.columns", metric_domain_kwargs={})
+                )
+            return _build_sql_table_sketch(
+                execution_engine.engine,
+                batch_data.selectable,
+                columns,
+                chunk_size,
+                sketch_config,
+            )
+        if isinstance(execution_engine, SparkDFExecutionEngine):
+            return _build_spark_table_sketch(
+                batch_data.dataframe, columns, chunk_size, sketch_config
+            )
+    elif isinstance(data_asset, PandasDataset):
+        return _build_table_sketch_from_chunks(
+            _iter_dataframe_chunks(pd.DataFrame(data_asset), chunk_size),
+            columns,
+            sketch_config,
+        )
+    elif isinstance(data_asset, SqlAlchemyDataset):
+        return _build_sql_table_sketch(
+            data_asset.engine,
+            data_asset._table,
+            data_asset.get_table_columns() if columns is None else columns,
+            chunk_size,
+            sketch_config,
+        )
+    elif isinstance(data_asset, SparkDFDataset):
+        return _build_spark_table_sketch(
+            data_asset.spark_df, columns, chunk_size, sketch_config
+        )
+    raise ProfilerError(
+        f"Unable to sketch the data of a {type(data_asset).__name__}; sketches are supported for pandas, SQL and "
+        f"Spark data."
+    )
+
+
+def _iter_dataframe_chunks(
+    dataframe: pd.DataFrame, chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(dataframe), chunk_size):
+        yield dataframe.iloc[start : start + chunk_size]
+
+
+def _build_table_sketch_from_chunks(
+    chunks: Iterator[pd.DataFrame], columns: Optional[List[str]], sketch_config: dict
+) -> TableSketch:
+    table_sketch = None
+    for chunk in chunks:
+        if table_sketch is None:
+            table_sketch = TableSketch(
+                list(chunk.columns) if columns is None else columns, sketch_config
+            )
+        table_sketch.update(chunk)
+    if table_sketch is None:
+        table_sketch = TableSketch(columns or [], sketch_config)
+    return table_sketch
+
+
+def _build_sql_table_sketch(
+    engine,
+    selectable,
+    columns: List[str],
+    chunk_size: int,
+    sketch_config: dict,
+) -> TableSketch:
+    """Sketch the given columns of a SQL selectable, selecting only these columns."""
+    table_sketch = TableSketch(columns, sketch_config)
+    if len(columns) == 0:
+        row_count = engine.execute(
+            sa.select([sa.func.count()]).select_from(selectable)
+        ).scalar()
+        table_sketch.update(pd.DataFrame(index=range(row_count)))
+        return table_sketch
+    query = sa.select([sa.column(column) for column in columns]).select_from(selectable)
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(query)
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            table_sketch.update(pd.DataFrame.from_records(rows, columns=columns))
+    return table_sketch
+
+
+def _build_spark_table_sketch(
+    spark_df, columns: Optional[List[str]], chunk_size: int, sketch_config: dict
+) -> TableSketch:
+    if columns is None:
+        columns = spark_df.columns
+    else:
+        spark_df = spark_df.select(*columns)
+
+    def sketch_partition(rows):
+        partition_sketch = TableSketch(columns, sketch_config)
+        chunk = []
+        for row in rows:
+            chunk.append(tuple(row))
+            if len(chunk) == chunk_size:
+                partition_sketch.update(
+                    pd.DataFrame.from_records(chunk, columns=columns)
+                )
+                chunk = []
+        if chunk:
+            partition_sketch.update(pd.DataFrame.from_records(chunk, columns=columns))
+        yield partition_sketch
+
+    partition_sketches = spark_df.rdd.mapPartitions(sketch_partition)
+    if partition_sketches.getNumPartitions() == 0:
+        return TableSketch(columns, sketch_config)
+    return partition_sketches.reduce(lambda left, right: left.merge(right))
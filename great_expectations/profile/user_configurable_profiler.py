@@ -7,6 +7,7 @@ from dateutil.parser import parse
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.dataset import Dataset, PandasDataset
 from great_expectations.exceptions import ProfilerError
 from great_expectations.execution_engine import (
@@ -21,6 +22,7 @@ from great_expectations.profile.base import (
     profiler_data_types_with_mapping,
     profiler_semantic_types,
 )
+from great_expectations.profile.sketches import build_table_sketch
 from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
@@ -64,6 +66,8 @@ class UserConfigurableProfiler:
         semantic_types_dict: dict = None,
         table_expectations_only: bool = False,
         value_set_threshold: str = "MANY",
+        use_sketches: bool = False,
+        sketch_config: dict = None,
     ):
         """
                 The UserConfigurableProfiler is used to build an expectation suite from a dataset. The profiler may be
@@ -100,6 +104,13 @@ class UserConfigurableProfiler:
                         add a value_set expectation for columns whose cardinality is one of "one", "two", "very_few" or
                         "few". The default value is "many". For the purposes of comparing whether two tables are identical,
                         it might make the most sense to set this to "unique"
+                    use_sketches: Boolean, default False. If True, the profiler reads the data once to build sketches of
+                        all included columns, and builds the suite from them instead of evaluating expectations column
+                        by column. Counts, extrema and means are exact; cardinalities, value sets and quantiles are
+                        exact for columns with few distinct values, and otherwise bounded by the error of their
+                        sketches
+                    sketch_config: A dictionary of optional parameters of the sketches, passed to build_table_sketch
+                        ("chunk_size", "hll_precision", "kll_k", "top_k" and "random_seed")
         """
         self.column_info = {}
         self.profile_dataset = profile_dataset
@@ -164,6 +175,14 @@ class UserConfigurableProfiler:
             if column_name not in self.ignored_columns
         ]
 
+        self.table_sketch = None
+        if use_sketches:
+            self.table_sketch = build_table_sketch(
+                self.profile_dataset,
+                columns=included_columns,
+                sketch_config=sketch_config,
+            )
+
         for column_name in included_columns:
             self._add_column_cardinality_to_column_info(
                 self.profile_dataset, column_name
@@ -482,6 +501,9 @@ class UserConfigurableProfiler:
                 profile_dataset, column_name
             )
             column_info_entry["cardinality"] = column_cardinality
+            if self.table_sketch is not None:
+                # no expectations were evaluated to read the cardinality from the sketch
+                return column_cardinality
             # remove the expectations
             profile_dataset._expectation_suite.remove_expectation(
                 ExpectationConfiguration(
@@ -512,6 +534,13 @@ class UserConfigurableProfiler:
         num_unique = None
         pct_unique = None
 
+        column_sketch = self._get_column_sketch(column)
+        if column_sketch is not None:
+            num_unique, pct_unique = column_sketch.get_unique_counts()
+            return OrderedProfilerCardinality.get_basic_column_cardinality(
+                num_unique, pct_unique
+            ).name
+
         try:
             num_unique = profile_dataset.expect_column_unique_value_count_to_be_between(
                 column, None, None
@@ -682,6 +711,18 @@ class UserConfigurableProfiler:
             The GE Dataset
         """
         if "expect_column_values_to_be_in_set" not in self.excluded_expectations:
+            column_sketch = self._get_column_sketch(column)
+            if column_sketch is not None and column_sketch.distinct_values is not None:
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_column_values_to_be_in_set",
+                    column=column,
+                    value_set=convert_to_json_serializable(
+                        column_sketch.distinct_values
+                    ),
+                )
+                return profile_dataset
+
             value_set = profile_dataset.expect_column_distinct_values_to_be_in_set(
                 column, value_set=None, result_format="SUMMARY"
             ).result["observed_value"]
@@ -710,6 +751,11 @@ class UserConfigurableProfiler:
         Returns:
             The GE Dataset
         """
+        column_sketch = self._get_column_sketch(column)
+        if column_sketch is not None and column_sketch.is_numeric:
+            return self._build_expectations_numeric_from_sketch(
+                profile_dataset, column, column_sketch
+            )
 
         # min
         if "expect_column_min_to_be_between" not in self.excluded_expectations:
@@ -813,24 +859,7 @@ class UserConfigurableProfiler:
             "expect_column_quantile_values_to_be_between"
             not in self.excluded_expectations
         ):
-            if isinstance(profile_dataset, Dataset):
-                if isinstance(profile_dataset, PandasDataset):
-                    allow_relative_error = "lower"
-                else:
-                    allow_relative_error = (
-                        profile_dataset.attempt_allowing_relative_error()
-                    )
-            elif isinstance(profile_dataset, Validator):
-                if isinstance(profile_dataset.execution_engine, PandasExecutionEngine):
-                    allow_relative_error = "lower"
-                if isinstance(profile_dataset.execution_engine, SparkDFExecutionEngine):
-                    allow_relative_error = 0.0
-                if isinstance(
-                    profile_dataset.execution_engine, SqlAlchemyExecutionEngine
-                ):
-                    allow_relative_error = attempt_allowing_relative_error(
-                        profile_dataset.execution_engine.engine.dialect
-                    )
+            allow_relative_error = self._get_allow_relative_error(profile_dataset)
 
             quantile_result = (
                 profile_dataset.expect_column_quantile_values_to_be_between(
@@ -879,6 +908,74 @@ class UserConfigurableProfiler:
                 )
         return profile_dataset
 
+    def _build_expectations_numeric_from_sketch(
+        self, profile_dataset, column, column_sketch
+    ):
+        """
+        Adds the numeric expectations of _build_expectations_numeric for a given column, from the sketch of the column
+        Args:
+            profile_dataset: A GE Dataset
+            column: The column for which to add expectations
+            column_sketch: The ColumnSketch of the column
+
+        Returns:
+            The GE Dataset
+        """
+        if "expect_column_min_to_be_between" not in self.excluded_expectations:
+            self._add_expectation(
+                profile_dataset,
+                "expect_column_min_to_be_between",
+                column=column,
+                min_value=column_sketch.min,
+                max_value=column_sketch.min,
+            )
+
+        if "expect_column_max_to_be_between" not in self.excluded_expectations:
+            self._add_expectation(
+                profile_dataset,
+                "expect_column_max_to_be_between",
+                column=column,
+                min_value=column_sketch.max,
+                max_value=column_sketch.max,
+            )
+
+        if "expect_column_mean_to_be_between" not in self.excluded_expectations:
+            # the mean computed by a backend may differ from the sketched mean by rounding errors in their sums
+            self._add_expectation(
+                profile_dataset,
+                "expect_column_mean_to_be_between",
+                column=column,
+                min_value=column_sketch.mean - column_sketch.mean_error,
+                max_value=column_sketch.mean + column_sketch.mean_error,
+            )
+
+        if "expect_column_median_to_be_between" not in self.excluded_expectations:
+            min_median, max_median = column_sketch.get_median_bounds()
+            self._add_expectation(
+                profile_dataset,
+                "expect_column_median_to_be_between",
+                column=column,
+                min_value=min_median,
+                max_value=max_median,
+            )
+
+        if (
+            "expect_column_quantile_values_to_be_between"
+            not in self.excluded_expectations
+        ):
+            quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+            self._add_expectation(
+                profile_dataset,
+                "expect_column_quantile_values_to_be_between",
+                column=column,
+                quantile_ranges={
+                    "quantiles": quantiles,
+                    "value_ranges": column_sketch.get_quantile_bounds(quantiles),
+                },
+                allow_relative_error=self._get_allow_relative_error(profile_dataset),
+            )
+        return profile_dataset
+
     def _build_expectations_primary_or_compound_key(
         self, profile_dataset, column_list, **kwargs
     ):
@@ -897,7 +994,14 @@ class UserConfigurableProfiler:
             len(column_list) > 1
             and "expect_compound_columns_to_be_unique" not in self.excluded_expectations
         ):
-            profile_dataset.expect_compound_columns_to_be_unique(column_list)
+            if self.table_sketch is not None:
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_compound_columns_to_be_unique",
+                    column_list=column_list,
+                )
+            else:
+                profile_dataset.expect_compound_columns_to_be_unique(column_list)
         elif len(column_list) < 1:
             raise ValueError(
                 "When specifying a primary or compound key, column_list must not be empty"
@@ -905,7 +1009,14 @@ class UserConfigurableProfiler:
         else:
             [column] = column_list
             if "expect_column_values_to_be_unique" not in self.excluded_expectations:
-                profile_dataset.expect_column_values_to_be_unique(column)
+                if self.table_sketch is not None:
+                    self._add_expectation(
+                        profile_dataset,
+                        "expect_column_values_to_be_unique",
+                        column=column,
+                    )
+                else:
+                    profile_dataset.expect_column_values_to_be_unique(column)
         return profile_dataset
 
     def _build_expectations_string(self, profile_dataset, column, **kwargs):
@@ -1010,6 +1121,12 @@ class UserConfigurableProfiler:
         Returns:
             The GE Dataset
         """
+        column_sketch = self._get_column_sketch(column)
+        if column_sketch is not None:
+            return self._build_expectations_for_all_column_types_from_sketch(
+                profile_dataset, column, column_sketch
+            )
+
         if "expect_column_values_to_not_be_null" not in self.excluded_expectations:
             not_null_result = profile_dataset.expect_column_values_to_not_be_null(
                 column
@@ -1078,6 +1195,85 @@ class UserConfigurableProfiler:
                     f"Skipping expect_column_values_to_be_in_type_list for this column."
                 )
 
+    def _build_expectations_for_all_column_types_from_sketch(
+        self, profile_dataset, column, column_sketch
+    ):
+        """
+        Adds the expectations of _build_expectations_for_all_column_types for a given column, from the sketch of the
+        column
+        Args:
+            profile_dataset: A GE Dataset
+            column: The column for which to add the expectations
+            column_sketch: The ColumnSketch of the column
+
+        Returns:
+            The GE Dataset
+        """
+        if "expect_column_values_to_not_be_null" not in self.excluded_expectations:
+            null_count = column_sketch.count - column_sketch.nonnull_count
+            if null_count == 0:
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_column_values_to_not_be_null",
+                    column=column,
+                )
+            else:
+                unexpected_percent = 100.0 * null_count / column_sketch.count
+                if unexpected_percent >= 50 and not self.not_null_only:
+                    if (
+                        "expect_column_values_to_be_null"
+                        not in self.excluded_expectations
+                    ):
+                        self._add_expectation(
+                            profile_dataset,
+                            "expect_column_values_to_be_null",
+                            column=column,
+                            mostly=unexpected_percent / 100.0,
+                        )
+                else:
+                    potential_mostly_value = (100.0 - unexpected_percent) / 100.0
+                    self._add_expectation(
+                        profile_dataset,
+                        "expect_column_values_to_not_be_null",
+                        column=column,
+                        mostly=round(max(0.001, potential_mostly_value), 3),
+                    )
+
+        if (
+            "expect_column_proportion_of_unique_values_to_be_between"
+            not in self.excluded_expectations
+        ):
+            if column_sketch.nonnull_count > 0:
+                min_unique, max_unique = column_sketch.get_distinct_count_bounds()
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_column_proportion_of_unique_values_to_be_between",
+                    column=column,
+                    min_value=min_unique / column_sketch.nonnull_count,
+                    max_value=max_unique / column_sketch.nonnull_count,
+                )
+            else:
+                logger.debug(
+                    f"Skipping expect_column_proportion_of_unique_values_to_be_between because column {column} has "
+                    f"no values"
+                )
+
+        if "expect_column_values_to_be_in_type_list" not in self.excluded_expectations:
+            col_type = self.column_info.get(column).get("type")
+            if col_type != "UNKNOWN":
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_column_values_to_be_in_type_list",
+                    column=column,
+                    type_list=profiler_data_types_with_mapping.get(col_type),
+                )
+            else:
+                logger.info(
+                    f"Column type for column {column} is unknown. "
+                    f"Skipping expect_column_values_to_be_in_type_list for this column."
+                )
+        return profile_dataset
+
     def _build_expectations_table(self, profile_dataset, **kwargs):
         """
         Adds two table level expectations to the dataset
@@ -1097,6 +1293,15 @@ class UserConfigurableProfiler:
             profile_dataset.expect_table_columns_to_match_ordered_list(columns)
 
         if "expect_table_row_count_to_be_between" not in self.excluded_expectations:
+            if self.table_sketch is not None:
+                self._add_expectation(
+                    profile_dataset,
+                    "expect_table_row_count_to_be_between",
+                    min_value=self.table_sketch.row_count,
+                    max_value=self.table_sketch.row_count,
+                )
+                return
+
             row_count = profile_dataset.expect_table_row_count_to_be_between(
                 min_value=0, max_value=None
             ).result["observed_value"]
@@ -1107,6 +1312,44 @@ class UserConfigurableProfiler:
                 min_value=min_value, max_value=max_value
             )
 
+    def _get_column_sketch(self, column):
+        """
+        Returns the sketch of a column if the profiler uses sketches, or None
+        """
+        if self.table_sketch is None:
+            return None
+        return self.table_sketch.columns.get(column)
+
+    def _add_expectation(self, profile_dataset, expectation_type, **kwargs):
+        """
+        Adds an expectation to the suite of the dataset without evaluating it, for values read from sketches
+        """
+        profile_dataset._expectation_suite.add_expectation(
+            ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        )
+
+    def _get_allow_relative_error(self, profile_dataset):
+        """
+        Returns the allow_relative_error argument of quantile expectations for the backend of the dataset
+        Args:
+            profile_dataset: A GE Dataset
+
+        Returns:
+            The allow_relative_error value
+        """
+        if isinstance(profile_dataset, Dataset):
+            if isinstance(profile_dataset, PandasDataset):
+                return "lower"
+            return profile_dataset.attempt_allowing_relative_error()
+        if isinstance(profile_dataset.execution_engine, PandasExecutionEngine):
+            return "lower"
+        if isinstance(profile_dataset.execution_engine, SparkDFExecutionEngine):
+            return 0.0
+        if isinstance(profile_dataset.execution_engine, SqlAlchemyExecutionEngine):
+            return attempt_allowing_relative_error(
+                profile_dataset.execution_engine.engine.dialect
+            )
+
     def _is_nan(self, value):
         """
         If value is an array, test element-wise for NaN and return result as a boolean array.
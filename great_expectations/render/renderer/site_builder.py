@@ -1,10 +1,15 @@
+import hashlib
+import inspect
+import json
 import logging
 import os
+import threading
 import traceback
 from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
@@ -28,6 +33,96 @@ FALSEY_YAML_STRINGS = [
     "NONE",
 ]
 
+# Incremental builds read, update and write the site manifest; builds within a process are serialized by this lock
+_incremental_build_lock = threading.Lock()
+
+
+def _accepts_manifest(build_method) -> bool:
+    """Whether the build method of a site section or index builder takes the manifest of incremental builds."""
+    try:
+        return "manifest" in inspect.signature(build_method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class SiteManifest:
+    """A record of the resources rendered into a data docs site, used by incremental builds.
+
+    For each site section, the manifest records, by resource key, a hash of the content that was rendered, the version
+    of the renderer and view that rendered it, and the information the index page needs to link to the resource, so
+    that unchanged resources are neither fetched nor rendered again, and the index page can be built without listing
+    and reading the source stores.
+    """
+
+    RESOURCE_TYPES = {
+        "ExpectationSuiteIdentifier": ExpectationSuiteIdentifier,
+        "ValidationResultIdentifier": ValidationResultIdentifier,
+    }
+
+    def __init__(self, manifest_dict: Optional[dict] = None):
+        if manifest_dict is None:
+            manifest_dict = {}
+        self.static_assets_version = manifest_dict.get("static_assets_version")
+        self._sections = manifest_dict.get("sections", {})
+
+    @classmethod
+    def from_target_store(cls, target_store: HtmlSiteStore) -> "SiteManifest":
+        manifest = target_store.read_site_manifest()
+        if not manifest:
+            return cls()
+        try:
+            return cls(json.loads(manifest))
+        except ValueError:
+            logger.warning(
+                "Unable to read the data docs site manifest; rebuilding the site."
+            )
+            return cls()
+
+    def save(self, target_store: HtmlSiteStore):
+        target_store.write_site_manifest(json.dumps(self.to_json_dict(), indent=2))
+
+    def to_json_dict(self) -> dict:
+        return {
+            "static_assets_version": self.static_assets_version,
+            "sections": self._sections,
+        }
+
+    @staticmethod
+    def _entry_id(resource_key) -> str:
+        return "/".join(resource_key.to_tuple())
+
+    def get_entry(self, section_name: str, resource_key) -> Optional[dict]:
+        return self._sections.get(section_name, {}).get(self._entry_id(resource_key))
+
+    def set_entry(
+        self,
+        section_name: str,
+        resource_key,
+        content_hash: Optional[str],
+        renderer_version: str,
+        index_info: Optional[dict] = None,
+    ):
+        self._sections.setdefault(section_name, {})[self._entry_id(resource_key)] = {
+            "resource_type": type(resource_key).__name__,
+            "resource_key": list(resource_key.to_tuple()),
+            "content_hash": content_hash,
+            "renderer_version": renderer_version,
+            "index_info": convert_to_json_serializable(index_info or {}),
+        }
+
+    def remove_entry(self, section_name: str, resource_key):
+        self._sections.get(section_name, {}).pop(self._entry_id(resource_key), None)
+
+    def list_entries(self, section_name: str) -> List[Tuple[object, dict]]:
+        """Return the (resource key, entry) pairs of the resources rendered into a site section."""
+        entries = []
+        for entry in self._sections.get(section_name, {}).values():
+            resource_type = self.RESOURCE_TYPES[entry["resource_type"]]
+            entries.append(
+                (resource_type.from_tuple(tuple(entry["resource_key"])), entry)
+            )
+        return entries
+
 
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
@@ -49,6 +144,12 @@ class SiteBuilder:
         (filesystem or S3)
         * where the HTML files should be written (filesystem or S3)
         * which renderer and view class should be used to render each section
+        * whether the site is built incrementally (``incremental: true``), keeping
+        a manifest of rendered resources with the site so that each build only
+        renders new or changed resources. Incremental builds assume a single
+        writer: builds within a process are serialized, but builds of the same
+        site from several processes or machines are not coordinated, and the
+        last one to finish overwrites the manifest of the others
 
     Here is an example of a minimal configuration for a site::
 
@@ -114,12 +215,14 @@ class SiteBuilder:
         show_how_to_buttons=True,
         site_section_builders=None,
         runtime_environment=None,
+        incremental=False,
         **kwargs,
     ):
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental = incremental
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -267,6 +370,7 @@ class SiteBuilder:
             )
 
     def clean_site(self):
+        # The site manifest is kept with the static assets, so it is removed along with the rest of the site
         self.target_store.clean_site()
 
     def build(self, resource_identifiers=None, build_index: bool = True):
@@ -283,8 +387,17 @@ class SiteBuilder:
 
         :param build_index: a flag if False, skips building the index page
 
+        If the site is configured with "incremental: true", a manifest of the rendered resources is kept with the
+        site: only new or changed resources are rendered, and the index page is built from the manifest. Section
+        builders whose build method takes no manifest argument rebuild their section in full, and the index page is
+        then built from the source stores. Incremental builds assume that a single process writes the site at a time.
+
         :return:
         """
+        if self.incremental:
+            return self._build_incremental(
+                resource_identifiers=resource_identifiers, build_index=build_index
+            )
 
         # copy static assets
         self.target_store.copy_static_assets()
@@ -300,6 +413,53 @@ class SiteBuilder:
             index_links_dict,
         )
 
+    def _build_incremental(self, resource_identifiers=None, build_index: bool = True):
+        from great_expectations import __version__ as ge_version
+
+        with _incremental_build_lock:
+            manifest = SiteManifest.from_target_store(self.target_store)
+
+            # Static assets only change with the version of Great Expectations
+            if manifest.static_assets_version != ge_version:
+                self.target_store.copy_static_assets()
+                manifest.static_assets_version = ge_version
+
+            # The index page can only be built from the manifest if every section records its resources in it
+            index_manifest = manifest
+            for (
+                site_section,
+                site_section_builder,
+            ) in self.site_section_builders.items():
+                if _accepts_manifest(site_section_builder.build):
+                    site_section_builder.build(
+                        resource_identifiers=resource_identifiers, manifest=manifest
+                    )
+                else:
+                    logger.warning(
+                        f"The site section builder of {site_section} does not support incremental builds; "
+                        f"rebuilding the section in full."
+                    )
+                    site_section_builder.build(
+                        resource_identifiers=resource_identifiers
+                    )
+                    index_manifest = None
+
+            if index_manifest is not None and _accepts_manifest(
+                self.site_index_builder.build
+            ):
+                index_page_url, index_links_dict = self.site_index_builder.build(
+                    build_index=build_index, manifest=index_manifest
+                )
+            else:
+                index_page_url, index_links_dict = self.site_index_builder.build(
+                    build_index=build_index
+                )
+            manifest.save(self.target_store)
+        return (
+            self.get_resource_url(only_if_exists=False),
+            index_links_dict,
+        )
+
     def get_resource_url(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -384,8 +544,74 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None):
+    @property
+    def renderer_version(self) -> str:
+        """Identify the renderer and view of the section, so that pages are rendered again when they change."""
+        from great_expectations import __version__ as ge_version
+
+        return ":".join(
+            [
+                ge_version,
+                f"{type(self.renderer_class).__module__}.{type(self.renderer_class).__name__}",
+                f"{type(self.view_class).__module__}.{type(self.view_class).__name__}",
+            ]
+        )
+
+    @staticmethod
+    def _get_content_hash(resource) -> Optional[str]:
+        try:
+            serialized_resource = json.dumps(resource.to_json_dict(), sort_keys=True)
+        except (AttributeError, TypeError, ValueError):
+            return None
+        return hashlib.md5(serialized_resource.encode("utf-8")).hexdigest()
+
+    def _get_index_info(self, resource_key, resource) -> dict:
+        """Collect the information the index page shows for a resource, so that it can be kept in the manifest."""
+        if not isinstance(resource_key, ValidationResultIdentifier):
+            return {}
+        meta = getattr(resource, "meta", None) or {}
+        return {
+            "validation_success": getattr(resource, "success", None),
+            "batch_kwargs": meta.get("batch_kwargs", {}),
+            "batch_spec": meta.get("batch_spec", {}),
+        }
+
+    def _get_manifest_source_store_keys(self, resource_identifiers, manifest):
+        if resource_identifiers:
+            # Only the given resources are built, so the source store does not need to be listed
+            return [
+                resource_key
+                for resource_key in resource_identifiers
+                if isinstance(resource_key, self.source_store._key_class)
+            ]
+
         source_store_keys = self.source_store.list_keys()
+        # Forget (and remove the pages of) resources that are no longer in the source store
+        source_store_key_set = set(source_store_keys)
+        for resource_key, _ in manifest.list_entries(self.name):
+            if resource_key not in source_store_key_set:
+                manifest.remove_entry(self.name, resource_key)
+                site_store_backend = self.target_store.store_backends[
+                    type(resource_key)
+                ]
+                if site_store_backend.has_key(resource_key.to_tuple()):
+                    site_store_backend.remove_key(resource_key.to_tuple())
+        return source_store_keys
+
+    def build(self, resource_identifiers=None, manifest: SiteManifest = None):
+        """Render a page for each resource of the source store (or for each of the resource_identifiers, if given).
+
+        If a manifest is given, resources whose content and renderer are unchanged since they were last rendered are
+        skipped. Validation results are not expected to change once stored, so they are skipped without being
+        fetched; expectation suites are fetched and compared to the content hash recorded in the manifest.
+        """
+        if manifest is None:
+            source_store_keys = self.source_store.list_keys()
+        else:
+            source_store_keys = self._get_manifest_source_store_keys(
+                resource_identifiers, manifest
+            )
+            renderer_version = self.renderer_version
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
@@ -405,6 +631,17 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
+
+            manifest_entry = None
+            if manifest is not None:
+                manifest_entry = manifest.get_entry(self.name, resource_key)
+                if (
+                    manifest_entry is not None
+                    and manifest_entry["renderer_version"] == renderer_version
+                    and isinstance(resource_key, ValidationResultIdentifier)
+                ):
+                    continue
+
             try:
                 resource = self.source_store.get(resource_key)
             except exceptions.InvalidKeyError:
@@ -413,6 +650,16 @@ class DefaultSiteSectionBuilder:
                 )
                 continue
 
+            if manifest is not None:
+                content_hash = self._get_content_hash(resource)
+                if (
+                    manifest_entry is not None
+                    and content_hash is not None
+                    and manifest_entry["renderer_version"] == renderer_version
+                    and manifest_entry["content_hash"] == content_hash
+                ):
+                    continue
+
             if isinstance(resource_key, ExpectationSuiteIdentifier):
                 expectation_suite_name = resource_key.expectation_suite_name
                 logger.debug(
@@ -459,6 +706,14 @@ class DefaultSiteSectionBuilder:
                     ),
                     viewable_content,
                 )
+                if manifest is not None:
+                    manifest.set_entry(
+                        self.name,
+                        resource_key,
+                        content_hash=content_hash,
+                        renderer_version=renderer_version,
+                        index_info=self._get_index_info(resource_key, resource),
+                    )
             except Exception as e:
                 exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
@@ -688,12 +943,65 @@ class DefaultSiteIndexBuilder:
 
         return results
 
+    def _add_manifest_resources_to_index_links_dict(
+        self, index_links_dict, manifest: SiteManifest
+    ):
+        """Add links to the resources recorded in a site manifest, without listing or reading the source stores."""
+        for section_name in ["expectations", "profiling", "validations"]:
+            section_config = self.site_section_builders_config.get(section_name, "None")
+            if not section_config or section_config in FALSEY_YAML_STRINGS:
+                continue
+
+            resource_entries = manifest.list_entries(section_name)
+            if section_name == "expectations":
+                for expectation_suite_key, _ in resource_entries:
+                    self.add_resource_info_to_index_links_dict(
+                        index_links_dict=index_links_dict,
+                        expectation_suite_name=expectation_suite_key.expectation_suite_name,
+                        section_name=section_name,
+                    )
+                continue
+
+            resource_entries = sorted(
+                resource_entries, key=lambda x: x[0].run_id.run_time, reverse=True
+            )
+            if section_name == "validations" and self.validation_results_limit:
+                resource_entries = resource_entries[: self.validation_results_limit]
+            for validation_result_key, entry in resource_entries:
+                index_info = entry.get("index_info", {})
+                batch_kwargs = index_info.get("batch_kwargs") or {}
+                batch_spec = index_info.get("batch_spec") or {}
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                    section_name=section_name,
+                    batch_identifier=validation_result_key.batch_identifier,
+                    run_id=validation_result_key.run_id,
+                    validation_success=index_info.get("validation_success")
+                    if section_name == "validations"
+                    else None,
+                    run_time=validation_result_key.run_id.run_time,
+                    run_name=validation_result_key.run_id.run_name,
+                    asset_name=batch_kwargs.get("data_asset_name")
+                    or batch_spec.get("data_asset_name"),
+                    batch_kwargs=batch_kwargs,
+                    batch_spec=batch_spec,
+                )
+
     # TODO: deprecate dual batch api support
-    def build(self, skip_and_clean_missing=True, build_index: bool = True):
+    def build(
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        manifest: SiteManifest = None,
+    ):
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param manifest: if given, the index page links to the resources recorded in this site manifest, and the source
+        stores are neither listed nor read (resources missing from the source stores are cleaned by the section
+        builders of incremental builds)
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -709,6 +1017,10 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
+        if manifest is not None:
+            self._add_manifest_resources_to_index_links_dict(index_links_dict, manifest)
+            return self._write_index_page(index_links_dict), index_links_dict
+
         if (
             # TODO why is this duplicated?
             self.site_section_builders_config.get("expectations", "None")
@@ -892,6 +1204,9 @@ class DefaultSiteIndexBuilder:
                     )
                     logger.warning(error_msg)
 
+        return self._write_index_page(index_links_dict), index_links_dict
+
+    def _write_index_page(self, index_links_dict):
         try:
             rendered_content = self.renderer_class.render(index_links_dict)
             viewable_content = self.view_class.render(
@@ -911,7 +1226,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
             )
             logger.error(exception_message)
 
-        return (self.target_store.write_index_page(viewable_content), index_links_dict)
+        return self.target_store.write_index_page(viewable_content)
 
 
 class CallToActionButton:
@@ -1,10 +1,14 @@
 import logging
 import warnings
 from collections import OrderedDict
+from functools import partial
 
 from dateutil.parser import parse
 
-from great_expectations.checkpoint.util import send_slack_notification
+from great_expectations.checkpoint.util import (
+    run_validations_concurrently,
+    send_slack_notification,
+)
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import parse_result_format
 from great_expectations.data_context.types.resource_identifiers import (
@@ -13,6 +17,9 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import ClassInstantiationError
+from great_expectations.execution_engine.execution_engine import (
+    validate_concurrency_config,
+)
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
@@ -122,6 +129,19 @@ class ActionListValidationOperator(ValidationOperator):
             action:
               class_name: UpdateDataDocsAction
 
+        # optionally, validate the assets concurrently (see below)
+        concurrency_config:
+          max_workers: 8
+
+    **Concurrency**
+
+    By default, assets are validated one after the other. If a ``concurrency_config`` with ``max_workers`` is provided,
+    assets are validated in a thread pool: assets sharing an execution engine are still validated one at a time, while
+    the others are validated concurrently. Actions are run on the validation results in the order of
+    ``assets_to_validate``, while the remaining assets are being validated. Assets are validated one after the other
+    if any of their expectation suites has evaluation parameter dependencies, since these may be resolved from the
+    results of validations earlier in the same run.
+
 
     **Invocation**
 
@@ -190,10 +210,12 @@ class ActionListValidationOperator(ValidationOperator):
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        concurrency_config=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
+        self.concurrency_config = validate_concurrency_config(concurrency_config)
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -243,6 +265,10 @@ class ActionListValidationOperator(ValidationOperator):
                     "result_format": self.result_format,
                 },
             }
+            if self.concurrency_config is not None:
+                self._validation_operator_config["kwargs"][
+                    "concurrency_config"
+                ] = self.concurrency_config
         return self._validation_operator_config
 
     def _build_batch_from_item(self, item):
@@ -281,11 +307,23 @@ class ActionListValidationOperator(ValidationOperator):
         run_name=None,
         run_time=None,
         result_format=None,
+        validation_results=None,
     ):
+        """
+        Validate each asset in assets_to_validate and run the configured actions on its validation result.
 
+        If validation_results are provided (one per asset, in the same order), the assets are not validated again and
+        the actions are run on the given results instead; this allows assets to be validated together beforehand.
+        """
         assert not (run_id and run_name) and not (
             run_id and run_time
         ), "Please provide either a run_id or run_name and/or run_time."
+        if validation_results is not None and len(validation_results) != len(
+            assets_to_validate
+        ):
+            raise ValueError(
+                "validation_results must contain one validation result per asset to validate."
+            )
         if isinstance(run_id, str) and not run_name:
             warnings.warn(
                 "String run_ids will be deprecated in the future. Please provide a run_id of type "
@@ -306,38 +344,60 @@ class ActionListValidationOperator(ValidationOperator):
 
         run_results = {}
 
-        for item in assets_to_validate:
-            run_result_obj = {}
-            batch = self._build_batch_from_item(item)
+        if self.concurrency_config is not None and validation_results is None:
+            batches = [self._build_batch_from_item(item) for item in assets_to_validate]
+            if not any(
+                batch._expectation_suite.get_evaluation_parameter_dependencies()
+                for batch in batches
+            ):
+                for (
+                    validation_result_id,
+                    run_result_obj,
+                ) in run_validations_concurrently(
+                    validations=[
+                        (
+                            id(getattr(batch, "execution_engine", None) or batch),
+                            partial(
+                                batch.validate,
+                                run_id=run_id,
+                                result_format=result_format
+                                if result_format
+                                else self.result_format,
+                                evaluation_parameters=evaluation_parameters,
+                            ),
+                        )
+                        for batch in batches
+                    ],
+                    run_actions=lambda idx, batch_validation_result: self._run_validation_result_actions(
+                        batches[idx], batch_validation_result, run_id
+                    ),
+                    concurrency_config=self.concurrency_config,
+                ):
+                    run_results[validation_result_id] = run_result_obj
+                return ValidationOperatorResult(
+                    run_id=run_id,
+                    run_results=run_results,
+                    validation_operator_config=self.validation_operator_config,
+                    evaluation_parameters=evaluation_parameters,
+                )
+            # Validations may depend on the results stored by the actions of earlier validations
+            assets_to_validate = batches
 
-            if hasattr(batch, "active_batch_id"):
-                batch_identifier = batch.active_batch_id
+        for idx, item in enumerate(assets_to_validate):
+            batch = self._build_batch_from_item(item)
+            if validation_results is not None:
+                batch_validation_result = validation_results[idx]
             else:
-                batch_identifier = batch.batch_id
-
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
-            )
-            validation_result_id = ValidationResultIdentifier(
-                batch_identifier=batch_identifier,
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
-            run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
+                batch_validation_result = batch.validate(
+                    run_id=run_id,
+                    result_format=result_format
+                    if result_format
+                    else self.result_format,
+                    evaluation_parameters=evaluation_parameters,
+                )
+            validation_result_id, run_result_obj = self._run_validation_result_actions(
+                batch, batch_validation_result, run_id
             )
-
-            run_result_obj["actions_results"] = batch_actions_results
             run_results[validation_result_id] = run_result_obj
 
         return ValidationOperatorResult(
@@ -347,6 +407,36 @@ class ActionListValidationOperator(ValidationOperator):
             evaluation_parameters=evaluation_parameters,
         )
 
+    def _run_validation_result_actions(self, batch, batch_validation_result, run_id):
+        """Run all actions on the result of validating one batch, returning its validation result identifier together
+        with the run result recorded for it."""
+        run_result_obj = {}
+
+        if hasattr(batch, "active_batch_id"):
+            batch_identifier = batch.active_batch_id
+        else:
+            batch_identifier = batch.batch_id
+
+        expectation_suite_identifier = ExpectationSuiteIdentifier(
+            expectation_suite_name=batch._expectation_suite.expectation_suite_name
+        )
+        validation_result_id = ValidationResultIdentifier(
+            batch_identifier=batch_identifier,
+            expectation_suite_identifier=expectation_suite_identifier,
+            run_id=run_id,
+        )
+        run_result_obj["validation_result"] = batch_validation_result
+        batch_actions_results = self._run_actions(
+            batch,
+            expectation_suite_identifier,
+            batch._expectation_suite,
+            batch_validation_result,
+            run_id,
+        )
+
+        run_result_obj["actions_results"] = batch_actions_results
+        return validation_result_id, run_result_obj
+
     def _run_actions(
         self,
         batch,
@@ -1,5 +1,5 @@
 import copy
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from great_expectations.core.id_dict import IDDict
 
@@ -75,18 +75,69 @@ class MetricEdge:
 
 
 class ValidationGraph:
+    """A graph of metrics and their dependencies.
+
+    In addition to the list of edges, the graph indexes its nodes by metric id, along with the ids of each node's
+    dependencies and dependents, so that schedulers can track which metrics become ready as others are resolved without
+    rescanning every edge.
+    """
+
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+        self._nodes = {}
+        self._dependency_ids = {}
+        self._dependent_ids = {}
+        self._expanded_ids = set()
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            for edge in edges:
+                self.add(edge)
 
     def add(self, edge: MetricEdge):
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        if edge.id in self._edge_ids:
+            return
+        self._edges.append(edge)
+        self._edge_ids.add(edge.id)
+
+        left_id = self._add_node(edge.left)
+        if edge.right is not None:
+            right_id = self._add_node(edge.right)
+            self._dependency_ids[left_id].add(right_id)
+            self._dependent_ids[right_id].add(left_id)
+
+    def _add_node(self, node: MetricConfiguration) -> Tuple[str, str, str]:
+        node_id = node.id
+        if node_id not in self._nodes:
+            self._nodes[node_id] = node
+            self._dependency_ids[node_id] = set()
+            self._dependent_ids[node_id] = set()
+        return node_id
+
+    def mark_expanded(self, node: MetricConfiguration):
+        """Record that all dependencies of the given node have been added to the graph.
+
+        The given node becomes the graph's representative for its metric id, since its metric_dependencies are the
+        ones reflected in the graph."""
+        self._add_node(node)
+        self._nodes[node.id] = node
+        self._expanded_ids.add(node.id)
+
+    def is_expanded(self, metric_id: Tuple[str, str, str]) -> bool:
+        return metric_id in self._expanded_ids
+
+    def __contains__(self, metric_id):
+        return metric_id in self._nodes
+
+    @property
+    def nodes(self) -> Dict[Tuple[str, str, str], MetricConfiguration]:
+        return self._nodes
+
+    def get_dependency_ids(self, metric_id: Tuple[str, str, str]) -> Set[Tuple]:
+        return self._dependency_ids.get(metric_id, set())
+
+    def get_dependent_ids(self, metric_id: Tuple[str, str, str]) -> Set[Tuple]:
+        return self._dependent_ids.get(metric_id, set())
 
     @property
     def edges(self):
@@ -7,7 +7,7 @@ import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 from dateutil.parser import parse
@@ -90,7 +90,9 @@ class Validator:
             assert isinstance(
                 batch, Batch
             ), "batches provided to Validator must be Great Expectations Batch objects"
-            self._execution_engine.load_batch_data(batch.id, batch.data)
+            self._execution_engine.load_batch_data(
+                batch.id, batch.data, batch_markers=batch.batch_markers
+            )
             self._batches[batch.id] = batch
 
         self.interactive_evaluation = interactive_evaluation
@@ -339,7 +341,21 @@ class Validator:
         runtime_configuration: Optional[dict] = None,
     ) -> None:
         """Obtain domain and value keys for metrics and proceeds to add these metrics to the validation graph
-        until all metrics have been added."""
+        until all metrics have been added. Metrics whose dependencies are already in the graph (such as those shared
+        by several expectations) are linked to their parent without being expanded again."""
+
+        if graph.is_expanded(child_node.id):
+            child_node.metric_dependencies = graph.nodes[
+                child_node.id
+            ].metric_dependencies
+            if parent_node:
+                graph.add(
+                    MetricEdge(
+                        parent_node,
+                        graph.nodes[child_node.id],
+                    )
+                )
+            return
 
         # metric_kwargs = get_metric_kwargs(metric_name)
         metric_impl = get_metric_provider(
@@ -385,6 +401,8 @@ class Validator:
                     runtime_configuration=runtime_configuration,
                 )
 
+        graph.mark_expanded(child_node)
+
     def graph_validate(
         self,
         configurations: List[ExpectationConfiguration],
@@ -409,6 +427,23 @@ class Validator:
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
         """
+        return [
+            evr
+            for _, evr in self._graph_validate_configurations(
+                configurations=configurations,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        ]
+
+    def _graph_validate_configurations(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: dict = None,
+        runtime_configuration: dict = None,
+    ) -> List[Tuple[int, ExpectationValidationResult]]:
+        """Validate configurations as graph_validate does, returning each result together with the index of the
+        configuration it belongs to, so that results of configurations validated together can be told apart."""
         graph = ValidationGraph()
         if runtime_configuration is None:
             runtime_configuration = dict()
@@ -420,7 +455,7 @@ class Validator:
 
         processed_configurations = []
         evrs = []
-        for configuration in configurations:
+        for configuration_index, configuration in enumerate(configurations):
             # Validating
             try:
                 assert (
@@ -443,7 +478,7 @@ class Validator:
                         self._execution_engine,
                         runtime_configuration=runtime_configuration,
                     )
-                processed_configurations.append(configuration)
+                processed_configurations.append((configuration_index, configuration))
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -456,7 +491,7 @@ class Validator:
                             "exception_message": str(err),
                         },
                     )
-                    evrs.append(result)
+                    evrs.append((configuration_index, result))
                 else:
                     raise err
 
@@ -464,14 +499,14 @@ class Validator:
             metrics = dict()
 
         metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
-        for configuration in processed_configurations:
+        for configuration_index, configuration in processed_configurations:
             try:
                 result = configuration.metrics_validate(
                     metrics,
                     execution_engine=self._execution_engine,
                     runtime_configuration=runtime_configuration,
                 )
-                evrs.append(result)
+                evrs.append((configuration_index, result))
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -485,15 +520,34 @@ class Validator:
                             "exception_message": str(err),
                         },
                     )
-                    evrs.append(result)
+                    evrs.append((configuration_index, result))
                 else:
                     raise err
         return evrs
 
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
+        """Resolve every metric in the validation graph that is not already in metrics.
+
+        Metrics are resolved in rounds: each round passes every metric whose dependencies have all been resolved to the
+        execution engine, then decrements the count of pending dependencies of their dependents, so that the metrics
+        made ready by a round are found without rescanning the graph."""
+        pending_dependency_counts = {}
+        ready_metrics = []
+        for metric_id, metric in graph.nodes.items():
+            if metric_id in metrics:
+                continue
+            pending_dependency_count = len(
+                [
+                    dependency_id
+                    for dependency_id in graph.get_dependency_ids(metric_id)
+                    if dependency_id not in metrics
+                ]
+            )
+            pending_dependency_counts[metric_id] = pending_dependency_count
+            if pending_dependency_count == 0:
+                ready_metrics.append(metric)
+
+        while len(ready_metrics) > 0:
             metrics.update(
                 self._resolve_metrics(
                     execution_engine=self._execution_engine,
@@ -502,31 +556,45 @@ class Validator:
                     runtime_configuration=runtime_configuration,
                 )
             )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
+            newly_ready_metrics = []
+            for metric in ready_metrics:
+                del pending_dependency_counts[metric.id]
+                if metric.id not in metrics:
+                    continue
+                for dependent_id in graph.get_dependent_ids(metric.id):
+                    if dependent_id not in pending_dependency_counts:
+                        continue
+                    pending_dependency_counts[dependent_id] -= 1
+                    if pending_dependency_counts[dependent_id] == 0:
+                        newly_ready_metrics.append(graph.nodes[dependent_id])
+            ready_metrics = newly_ready_metrics
+
+        if len(pending_dependency_counts) > 0:
+            raise GreatExpectationsError(
+                "Unable to resolve metrics with unmet or circular dependencies: "
+                f"{[str(metric_id) for metric_id in pending_dependency_counts]}"
+            )
 
         return metrics
 
     def _parse_validation_graph(self, validation_graph, metrics):
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        """Given validation graph, returns the ready and needed metrics necessary for validation, using the graph's
+        index of metric dependencies"""
+        ready_metrics = set()
+        needed_metrics = set()
+
+        for metric_id, metric in validation_graph.nodes.items():
+            if metric_id in metrics:
+                continue
+            if all(
+                dependency_id in metrics
+                for dependency_id in validation_graph.get_dependency_ids(metric_id)
+            ):
+                ready_metrics.add(metric)
+            else:
+                needed_metrics.add(metric)
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+        return ready_metrics, needed_metrics
 
     def _resolve_metrics(
         self,
@@ -680,7 +748,7 @@ class Validator:
     @property
     def active_batch(self):
         """Getter for active batch"""
-        active_batch_id = self.execution_engine.active_batch_data_id
+        active_batch_id = self.active_batch_id
         active_batch = self.batches.get(active_batch_id) if active_batch_id else None
         return active_batch
 
@@ -695,7 +763,11 @@ class Validator:
     @property
     def active_batch_id(self):
         """Getter for active batch id"""
-        return self.execution_engine.active_batch_data_id
+        active_batch_id = self.execution_engine.active_batch_data_id
+        if active_batch_id not in self.batches and len(self.batches) == 1:
+            # The execution engine may have since loaded the batch of another validator sharing it
+            return next(iter(self.batches))
+        return active_batch_id
 
     @property
     def active_batch_markers(self):
@@ -1099,61 +1171,15 @@ class Validator:
                         success=False,
                     )
                 return ExpectationValidationResult(success=False)
-            # Evaluation parameter priority is
-            # 1. from provided parameters
-            # 2. from expectation configuration
-            # 3. from data context
-            # So, we load them in reverse order
-
-            if data_context is not None:
-                runtime_evaluation_parameters = (
-                    data_context.evaluation_parameter_store.get_bind_params(run_id)
-                )
-            else:
-                runtime_evaluation_parameters = {}
-
-            if expectation_suite.evaluation_parameters:
-                runtime_evaluation_parameters.update(
-                    expectation_suite.evaluation_parameters
-                )
-
-            if evaluation_parameters is not None:
-                runtime_evaluation_parameters.update(evaluation_parameters)
-
-            # Convert evaluation parameters to be json-serializable
-            runtime_evaluation_parameters = recursively_convert_to_json_serializable(
-                runtime_evaluation_parameters
+            (
+                expectations_to_evaluate,
+                runtime_evaluation_parameters,
+            ) = self._get_expectations_to_evaluate(
+                expectation_suite=expectation_suite,
+                run_id=run_id,
+                evaluation_parameters=evaluation_parameters,
+                data_context=data_context,
             )
-
-            # Warn if our version is different from the version in the configuration
-            # TODO: Deprecate "great_expectations.__version__"
-            suite_ge_version = expectation_suite.meta.get(
-                "great_expectations_version"
-            ) or expectation_suite.meta.get("great_expectations.__version__")
-
-            # Group expectations by column
-            columns = {}
-
-            for expectation in expectation_suite.expectations:
-                expectation.process_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
-                    interactive_evaluation=self.interactive_evaluation,
-                    data_context=self._data_context,
-                )
-                if "column" in expectation.kwargs and isinstance(
-                    expectation.kwargs["column"], Hashable
-                ):
-                    column = expectation.kwargs["column"]
-                else:
-                    column = "_nocolumn"
-                if column not in columns:
-                    columns[column] = []
-                columns[column].append(expectation)
-
-            expectations_to_evaluate = []
-            for col in columns:
-                expectations_to_evaluate.extend(columns[col])
-
             results = self.graph_validate(
                 expectations_to_evaluate,
                 runtime_configuration={
@@ -1161,36 +1187,13 @@ class Validator:
                     "result_format": result_format,
                 },
             )
-            statistics = _calc_validation_statistics(results)
-
-            if only_return_failures:
-                abbrev_results = []
-                for exp in results:
-                    if not exp.success:
-                        abbrev_results.append(exp)
-                results = abbrev_results
-
-            expectation_suite_name = expectation_suite.expectation_suite_name
-
-            result = ExpectationSuiteValidationResult(
+            result = self._build_expectation_suite_validation_result(
+                expectation_suite=expectation_suite,
                 results=results,
-                success=statistics.success,
-                statistics={
-                    "evaluated_expectations": statistics.evaluated_expectations,
-                    "successful_expectations": statistics.successful_expectations,
-                    "unsuccessful_expectations": statistics.unsuccessful_expectations,
-                    "success_percent": statistics.success_percent,
-                },
-                evaluation_parameters=runtime_evaluation_parameters,
-                meta={
-                    "great_expectations_version": ge_version,
-                    "expectation_suite_name": expectation_suite_name,
-                    "run_id": run_id,
-                    "batch_spec": self.active_batch_spec,
-                    "batch_markers": self.active_batch_markers,
-                    "active_batch_definition": self.active_batch_definition,
-                    "validation_time": validation_time,
-                },
+                runtime_evaluation_parameters=runtime_evaluation_parameters,
+                run_id=run_id,
+                validation_time=validation_time,
+                only_return_failures=only_return_failures,
             )
 
             self._data_context = validate__data_context
@@ -1215,6 +1218,230 @@ class Validator:
             )
         return result
 
+    def validate_expectation_suites(
+        self,
+        expectation_suites: List[ExpectationSuite],
+        evaluation_parameters: Optional[List[Optional[dict]]] = None,
+        run_id=None,
+        catch_exceptions=True,
+        result_format=None,
+    ) -> List[ExpectationSuiteValidationResult]:
+        """Validate several expectation suites against the active batch in a single pass.
+
+        The expectations of all suites are validated with a single graph_validate call, so that metrics needed by more
+        than one suite are resolved only once, and the results are then split back into one validation result per
+        suite.
+
+        Args:
+            expectation_suites (list of ExpectationSuite): The suites to validate.
+            evaluation_parameters (list of dict or None): \
+                Evaluation parameters to use for each suite, in the same order as expectation_suites (see validate).
+            run_id (RunIdentifier): Identifies the validation run that all the validation results belong to.
+            catch_exceptions (boolean): \
+                If True, exceptions raised by tests will not end validation and will be described in the returned \
+                report.
+            result_format (string or None): \
+                If None, uses the default value ('BASIC' or as specified).
+
+        Returns:
+            A list of ExpectationSuiteValidationResult, one per suite, in the order of expectation_suites.
+        """
+        validation_time = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y%m%dT%H%M%S.%fZ"
+        )
+        if isinstance(run_id, dict):
+            run_id = RunIdentifier(**run_id)
+        elif not isinstance(run_id, RunIdentifier):
+            run_id = RunIdentifier(run_name=run_id)
+        if evaluation_parameters is None:
+            evaluation_parameters = [None] * len(expectation_suites)
+        if result_format is None:
+            result_format = {"result_format": "BASIC"}
+
+        try:
+            self._active_validation = True
+            configurations = []
+            suite_configuration_ranges = []
+            suite_runtime_evaluation_parameters = []
+            for expectation_suite, suite_evaluation_parameters in zip(
+                expectation_suites, evaluation_parameters
+            ):
+                (
+                    expectations_to_evaluate,
+                    runtime_evaluation_parameters,
+                ) = self._get_expectations_to_evaluate(
+                    expectation_suite=expectation_suite,
+                    run_id=run_id,
+                    evaluation_parameters=suite_evaluation_parameters,
+                    data_context=self._data_context,
+                )
+                suite_configuration_ranges.append(
+                    range(
+                        len(configurations),
+                        len(configurations) + len(expectations_to_evaluate),
+                    )
+                )
+                suite_runtime_evaluation_parameters.append(
+                    runtime_evaluation_parameters
+                )
+                configurations.extend(expectations_to_evaluate)
+
+            indexed_results = self._graph_validate_configurations(
+                configurations,
+                runtime_configuration={
+                    "catch_exceptions": catch_exceptions,
+                    "result_format": result_format,
+                },
+            )
+
+            suite_validation_results = []
+            for (
+                expectation_suite,
+                configuration_range,
+                runtime_evaluation_parameters,
+            ) in zip(
+                expectation_suites,
+                suite_configuration_ranges,
+                suite_runtime_evaluation_parameters,
+            ):
+                suite_validation_results.append(
+                    self._build_expectation_suite_validation_result(
+                        expectation_suite=expectation_suite,
+                        results=[
+                            evr
+                            for configuration_index, evr in indexed_results
+                            if configuration_index in configuration_range
+                        ],
+                        runtime_evaluation_parameters=runtime_evaluation_parameters,
+                        run_id=run_id,
+                        validation_time=validation_time,
+                    )
+                )
+        except Exception:
+            if getattr(self._data_context, "_usage_statistics_handler", None):
+                handler = self._data_context._usage_statistics_handler
+                handler.send_usage_message(
+                    event="data_asset.validate",
+                    event_payload=handler._batch_anonymizer.anonymize_batch_info(self),
+                    success=False,
+                )
+            raise
+        finally:
+            self._active_validation = False
+
+        if getattr(self._data_context, "_usage_statistics_handler", None):
+            handler = self._data_context._usage_statistics_handler
+            for _ in expectation_suites:
+                handler.send_usage_message(
+                    event="data_asset.validate",
+                    event_payload=handler._batch_anonymizer.anonymize_batch_info(self),
+                    success=True,
+                )
+        return suite_validation_results
+
+    def _get_expectations_to_evaluate(
+        self,
+        expectation_suite: ExpectationSuite,
+        run_id: RunIdentifier,
+        evaluation_parameters: Optional[dict] = None,
+        data_context=None,
+    ) -> Tuple[List[ExpectationConfiguration], dict]:
+        """Process the evaluation parameters of the expectations in expectation_suite, returning the expectations
+        grouped by column together with the runtime evaluation parameters they were processed with."""
+        # Evaluation parameter priority is
+        # 1. from provided parameters
+        # 2. from expectation configuration
+        # 3. from data context
+        # So, we load them in reverse order
+
+        if data_context is not None:
+            runtime_evaluation_parameters = (
+                data_context.evaluation_parameter_store.get_bind_params(run_id)
+            )
+        else:
+            runtime_evaluation_parameters = {}
+
+        if expectation_suite.evaluation_parameters:
+            runtime_evaluation_parameters.update(
+                expectation_suite.evaluation_parameters
+            )
+
+        if evaluation_parameters is not None:
+            runtime_evaluation_parameters.update(evaluation_parameters)
+
+        # Convert evaluation parameters to be json-serializable
+        runtime_evaluation_parameters = recursively_convert_to_json_serializable(
+            runtime_evaluation_parameters
+        )
+
+        # Group expectations by column
+        columns = {}
+
+        for expectation in expectation_suite.expectations:
+            expectation.process_evaluation_parameters(
+                evaluation_parameters=runtime_evaluation_parameters,
+                interactive_evaluation=self.interactive_evaluation,
+                data_context=self._data_context,
+            )
+            if "column" in expectation.kwargs and isinstance(
+                expectation.kwargs["column"], Hashable
+            ):
+                column = expectation.kwargs["column"]
+            else:
+                column = "_nocolumn"
+            if column not in columns:
+                columns[column] = []
+            columns[column].append(expectation)
+
+        expectations_to_evaluate = []
+        for col in columns:
+            expectations_to_evaluate.extend(columns[col])
+
+        return expectations_to_evaluate, runtime_evaluation_parameters
+
+    def _build_expectation_suite_validation_result(
+        self,
+        expectation_suite: ExpectationSuite,
+        results: List[ExpectationValidationResult],
+        runtime_evaluation_parameters: dict,
+        run_id: RunIdentifier,
+        validation_time: str,
+        only_return_failures: bool = False,
+    ) -> ExpectationSuiteValidationResult:
+        statistics = _calc_validation_statistics(results)
+
+        if only_return_failures:
+            abbrev_results = []
+            for exp in results:
+                if not exp.success:
+                    abbrev_results.append(exp)
+            results = abbrev_results
+
+        expectation_suite_name = expectation_suite.expectation_suite_name
+
+        result = ExpectationSuiteValidationResult(
+            results=results,
+            success=statistics.success,
+            statistics={
+                "evaluated_expectations": statistics.evaluated_expectations,
+                "successful_expectations": statistics.successful_expectations,
+                "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                "success_percent": statistics.success_percent,
+            },
+            evaluation_parameters=runtime_evaluation_parameters,
+            meta={
+                "great_expectations_version": ge_version,
+                "expectation_suite_name": expectation_suite_name,
+                "run_id": run_id,
+                "batch_spec": self.active_batch_spec,
+                "batch_markers": self.active_batch_markers,
+                "active_batch_definition": self.active_batch_definition,
+                "validation_time": validation_time,
+            },
+        )
+
+        return result
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """
         Get an evaluation parameter value that has been stored in meta.
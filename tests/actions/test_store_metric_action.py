@@ -185,3 +185,79 @@ def test_StoreMetricsAction_column_metric(
         )
         == 7
     )
+
+
+@freeze_time("09/26/2019 13:42:41")
+def test_StoreMetricsAction_writes_metrics_for_many_columns_in_a_single_call(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    columns = ["column_{}".format(idx) for idx in range(5)]
+    action = StoreMetricsAction(
+        data_context=basic_in_memory_data_context_for_validation_operator,
+        requested_metrics={
+            "*": [
+                {
+                    "column": {
+                        column: [
+                            "expect_column_values_to_be_unique.result.unexpected_count"
+                        ]
+                        for column in columns
+                    }
+                },
+            ]
+        },
+        target_store_name="metrics_store",
+    )
+
+    run_id = RunIdentifier(run_name="bar")
+
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        meta={"expectation_suite_name": "foo", "run_id": run_id},
+        results=[
+            ExpectationValidationResult(
+                result={"unexpected_count": idx},
+                success=True,
+                expectation_config=ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_unique",
+                    kwargs={"column": column},
+                ),
+            )
+            for idx, column in enumerate(columns)
+        ],
+    )
+
+    metrics_store = basic_in_memory_data_context_for_validation_operator.stores[
+        "metrics_store"
+    ]
+    store_backend = metrics_store.store_backend
+    set_many_calls = []
+    original_set_many = store_backend.set_many
+
+    def recording_set_many(key_value_pairs, **kwargs):
+        set_many_calls.append(list(key_value_pairs))
+        return original_set_many(set_many_calls[-1], **kwargs)
+
+    store_backend.set_many = recording_set_many
+
+    action.run(
+        validation_result,
+        ValidationResultIdentifier.from_object(validation_result),
+        data_asset=None,
+    )
+
+    assert len(set_many_calls) == 1
+    assert len(set_many_calls[0]) == len(columns)
+    for idx, column in enumerate(columns):
+        assert (
+            metrics_store.get(
+                ValidationMetricIdentifier(
+                    run_id=run_id,
+                    data_asset_name=None,
+                    expectation_suite_identifier=ExpectationSuiteIdentifier("foo"),
+                    metric_name="expect_column_values_to_be_unique.result.unexpected_count",
+                    metric_kwargs_id="column={}".format(column),
+                )
+            )
+            == idx
+        )
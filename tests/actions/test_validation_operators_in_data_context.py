@@ -5,7 +5,8 @@ import pytest
 from great_expectations.core.expectation_suite import ExpectationSuiteSchema
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.util import file_relative_path
-from great_expectations.exceptions import DataContextError
+from great_expectations.exceptions import DataContextError, InvalidConfigError
+from great_expectations.validation_operators import ActionListValidationOperator
 from tests.test_utils import expectationSuiteSchema
 
 
@@ -250,6 +251,67 @@ def test_action_list_operator(validation_operators_data_context):
     )
 
 
+def test_action_list_operator_with_concurrency_config(
+    validation_operators_data_context,
+):
+    data_context = validation_operators_data_context
+    validator_batch_kwargs = data_context.build_batch_kwargs(
+        "my_datasource", "subdir_reader", "f1"
+    )
+    batch = data_context.get_batch(
+        expectation_suite_name="f1.failure", batch_kwargs=validator_batch_kwargs
+    )
+
+    with pytest.raises(InvalidConfigError):
+        ActionListValidationOperator(
+            data_context=data_context,
+            action_list=[],
+            name="concurrent_operator",
+            concurrency_config={"max_workers": 0},
+        )
+
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                    "target_store_name": "validation_result_store",
+                },
+            },
+        ],
+        name="concurrent_operator",
+        concurrency_config={"max_workers": 2},
+    )
+    assert operator.validation_operator_config["kwargs"]["concurrency_config"] == {
+        "max_workers": 2
+    }
+
+    operator_result = operator.run(
+        assets_to_validate=[batch, (validator_batch_kwargs, "f1.warning")],
+        run_id="test-100",
+    )
+
+    assert len(data_context.stores["validation_result_store"].list_keys()) == 2
+    # Results are reported in the order of the assets to validate
+    assert [
+        validation_result_identifier.expectation_suite_identifier.expectation_suite_name
+        for validation_result_identifier in operator_result.run_results
+    ] == ["f1.failure", "f1.warning"]
+    assert [
+        validation_result.statistics
+        for validation_result in operator_result.list_validation_results()
+    ] == [
+        batch.validate().statistics,
+        data_context.get_batch(
+            expectation_suite_name="f1.warning", batch_kwargs=validator_batch_kwargs
+        )
+        .validate()
+        .statistics,
+    ]
+
+
 def test_warning_and_failure_validation_operator(validation_operators_data_context):
     data_context = validation_operators_data_context
     validator_batch_kwargs = data_context.build_batch_kwargs(
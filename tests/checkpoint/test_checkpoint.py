@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 import unittest.mock as mock
 from typing import List, Union
 
@@ -12,6 +13,8 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core.batch import BatchRequest
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context.data_context import DataContext
 from great_expectations.data_context.types.base import CheckpointConfig
 from great_expectations.data_context.types.resource_identifiers import (
@@ -21,6 +24,7 @@ from great_expectations.util import filter_properties_dict
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
+from great_expectations.validator.validator import Validator
 
 yaml = YAML()
 
@@ -1010,6 +1014,368 @@ def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_when_
     assert len(context.validations_store.list_keys()) == 1
 
 
+def test_newstyle_checkpoint_validates_suites_sharing_a_batch_request_in_a_single_pass(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    batch_request = {
+        "datasource_name": "my_datasource",
+        "data_connector_name": "my_basic_data_connector",
+        "data_asset_name": "Titanic_1911",
+    }
+    table_suite = context.create_expectation_suite("table_suite")
+    table_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1, "max_value": 10},
+        )
+    )
+    context.save_expectation_suite(table_suite)
+    column_suite = context.create_expectation_suite("column_suite")
+    column_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "Name"},
+        )
+    )
+    column_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(column_suite)
+
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {"batch_request": batch_request, "expectation_suite_name": "table_suite"},
+            {"batch_request": batch_request, "expectation_suite_name": "column_suite"},
+        ],
+    )
+
+    with mock.patch.object(
+        context, "get_batch", wraps=context.get_batch
+    ) as mock_get_batch:
+        result: CheckpointResult = checkpoint.run()
+
+    assert mock_get_batch.call_count == 1
+    assert len(context.validations_store.list_keys()) == 2
+    # The batch is unloaded from its execution engine once the actions of its validations are run
+    execution_engine = context.datasources["my_datasource"].execution_engine
+    batch_id: str = (
+        result.list_validation_results()[0].meta["active_batch_definition"].id
+    )
+    assert batch_id not in execution_engine.loaded_batch_data_dict
+
+    validation_results = result.list_validation_results()
+    assert [
+        validation_result.meta["expectation_suite_name"]
+        for validation_result in validation_results
+    ] == ["table_suite", "column_suite"]
+    assert not validation_results[0].success
+    assert validation_results[0].statistics["evaluated_expectations"] == 1
+    assert validation_results[1].success
+    assert validation_results[1].statistics["evaluated_expectations"] == 2
+
+    # The results match those of validating each suite on its own
+    for validation_result in validation_results:
+        validator = context.get_validator(
+            batch_request=BatchRequest(**batch_request),
+            expectation_suite_name=validation_result.meta["expectation_suite_name"],
+        )
+        assert [
+            expectation_validation_result.success
+            for expectation_validation_result in validator.validate().results
+        ] == [
+            expectation_validation_result.success
+            for expectation_validation_result in validation_result.results
+        ]
+
+
+def test_newstyle_checkpoint_validates_suites_with_dependencies_after_earlier_validations_of_other_batches(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    upstream_suite = context.create_expectation_suite("upstream_suite")
+    upstream_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(upstream_suite)
+    table_suite = context.create_expectation_suite("table_suite")
+    table_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_column_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(table_suite)
+    downstream_suite = context.create_expectation_suite("downstream_suite")
+    downstream_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={
+                "value": {
+                    "$PARAMETER": "urn:great_expectations:validations:upstream_suite:expect_table_row_count_to_be_between.result.observed_value"
+                }
+            },
+        )
+    )
+    context.save_expectation_suite(downstream_suite)
+
+    batch_requests = {
+        data_asset_name: {
+            "datasource_name": "my_datasource",
+            "data_connector_name": "my_basic_data_connector",
+            "data_asset_name": data_asset_name,
+        }
+        for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+    }
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+            {
+                "name": "store_evaluation_params",
+                "action": {
+                    "class_name": "StoreEvaluationParametersAction",
+                },
+            },
+        ],
+        # The downstream suite shares the batch of the first validation, but depends on the metrics stored by the
+        # second one, so that it must be validated after it
+        validations=[
+            {
+                "batch_request": batch_requests["Titanic_1911"],
+                "expectation_suite_name": "table_suite",
+            },
+            {
+                "batch_request": batch_requests["Titanic_1912"],
+                "expectation_suite_name": "upstream_suite",
+            },
+            {
+                "batch_request": batch_requests["Titanic_1911"],
+                "expectation_suite_name": "downstream_suite",
+            },
+        ],
+    )
+
+    result: CheckpointResult = checkpoint.run()
+
+    assert result.success
+    validation_results = result.list_validation_results()
+    assert [
+        validation_result.meta["expectation_suite_name"]
+        for validation_result in validation_results
+    ] == ["table_suite", "upstream_suite", "downstream_suite"]
+    assert validation_results[2].results[0].expectation_config.kwargs["value"] == (
+        validation_results[1].results[0].result["observed_value"]
+    )
+
+
+def test_newstyle_checkpoint_runs_validations_concurrently_with_concurrency_config(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    data_path: str = context.get_config().datasources["my_datasource"][
+        "data_connectors"
+    ]["my_basic_data_connector"]["base_directory"]
+    context.test_yaml_config(
+        name="my_other_datasource",
+        yaml_config=f"""
+        class_name: Datasource
+
+        execution_engine:
+            class_name: PandasExecutionEngine
+
+        data_connectors:
+            my_basic_data_connector:
+                class_name: InferredAssetFilesystemDataConnector
+                base_directory: {data_path}
+                default_regex:
+                    pattern: (.*)\\.csv
+                    group_names:
+                        - data_asset_name
+        """,
+    )
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(suite)
+
+    validations = [
+        {
+            "batch_request": {
+                "datasource_name": datasource_name,
+                "data_connector_name": "my_basic_data_connector",
+                "data_asset_name": data_asset_name,
+            }
+        }
+        for datasource_name, data_asset_name in [
+            ("my_datasource", "Titanic_1911"),
+            ("my_other_datasource", "Titanic_1912"),
+            ("my_datasource", "Titanic_1912"),
+            ("my_other_datasource", "Titanic_19120414_1313"),
+        ]
+    ]
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=validations,
+        runtime_configuration={"concurrency_config": {"max_workers": 2}},
+    )
+
+    result: CheckpointResult = checkpoint.run()
+
+    assert result.success
+    assert len(context.validations_store.list_keys()) == 4
+    # Results are reported in the order of the validations, each identified by its own batch
+    validation_results = result.list_validation_results()
+    assert [
+        (
+            validation_result.meta["active_batch_definition"]["datasource_name"],
+            validation_result.meta["active_batch_definition"]["data_asset_name"],
+        )
+        for validation_result in validation_results
+    ] == [
+        (
+            validation["batch_request"]["datasource_name"],
+            validation["batch_request"]["data_asset_name"],
+        )
+        for validation in validations
+    ]
+    assert [
+        validation_result_identifier.batch_identifier
+        for validation_result_identifier in result.run_results
+    ] == [
+        validation_result.meta["active_batch_definition"].id
+        for validation_result in validation_results
+    ]
+
+
+def test_newstyle_checkpoint_validates_batches_of_a_datasource_concurrently_on_replicas(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    context.save_expectation_suite(suite)
+
+    validations = [
+        {
+            "batch_request": {
+                "datasource_name": "my_datasource",
+                "data_connector_name": "my_basic_data_connector",
+                "data_asset_name": data_asset_name,
+            }
+        }
+        for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+    ]
+
+    def run_checkpoint(concurrency_config: dict) -> CheckpointResult:
+        checkpoint = Checkpoint(
+            name="my_checkpoint",
+            data_context=context,
+            config_version=1,
+            run_name_template="%Y-%M-foo-bar-template",
+            expectation_suite_name="my_expectation_suite",
+            action_list=[
+                {
+                    "name": "store_validation_result",
+                    "action": {
+                        "class_name": "StoreValidationResultAction",
+                    },
+                },
+            ],
+            validations=validations,
+            runtime_configuration={"concurrency_config": concurrency_config},
+        )
+        return checkpoint.run()
+
+    # Both batches are only validated once they are both loaded, each on an execution engine of its own
+    execution_engines = []
+    barrier = threading.Barrier(2, timeout=10)
+    validate_expectation_suites = Validator.validate_expectation_suites
+
+    def validate_expectation_suites_together(validator, *args, **kwargs):
+        execution_engines.append(validator.execution_engine)
+        barrier.wait()
+        return validate_expectation_suites(validator, *args, **kwargs)
+
+    with mock.patch.object(
+        Validator,
+        "validate_expectation_suites",
+        validate_expectation_suites_together,
+    ):
+        result: CheckpointResult = run_checkpoint(concurrency_config={"max_workers": 2})
+
+    assert result.success
+    assert len(execution_engines) == 2
+    assert execution_engines[0] is not execution_engines[1]
+    assert context.datasources["my_datasource"].execution_engine in execution_engines
+    assert [
+        validation_result.meta["active_batch_definition"]["data_asset_name"]
+        for validation_result in result.list_validation_results()
+    ] == ["Titanic_1911", "Titanic_1912"]
+
+    # Without replicas, batches of the datasource are validated one at a time
+    with mock.patch.object(
+        context, "_build_datasource_from_config"
+    ) as mock_build_datasource_from_config:
+        result = run_checkpoint(
+            concurrency_config={"max_workers": 2, "max_workers_per_datasource": 1}
+        )
+    assert result.success
+    assert not mock_build_datasource_from_config.called
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        run_checkpoint(
+            concurrency_config={"max_workers": 2, "max_workers_per_datasource": 0}
+        )
+
+
 def test_newstyle_checkpoint_config_substitution_simple(
     titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_templates,
     monkeypatch,
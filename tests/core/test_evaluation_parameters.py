@@ -6,6 +6,7 @@ from great_expectations.core.evaluation_parameters import (
     _deduplicate_evaluation_parameter_dependencies,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
+    parse_evaluation_parameter_expression,
 )
 from great_expectations.exceptions import EvaluationParameterError
 
@@ -112,6 +113,40 @@ def test_parser_timing():
     )
 
 
+def test_parsed_evaluation_parameter_expressions_are_reused():
+    parsed_expression = parse_evaluation_parameter_expression("trunc(foo * 2.5) - bar")
+    assert parse_evaluation_parameter_expression("trunc(foo * 2.5) - bar") is (
+        parsed_expression
+    )
+
+    # Evaluation substitutes values into a copy of the cached stack
+    assert (
+        parse_evaluation_parameter("trunc(foo * 2.5) - bar", {"foo": 3, "bar": 1}) == 6
+    )
+    assert (
+        parse_evaluation_parameter("trunc(foo * 2.5) - bar", {"foo": 4, "bar": 2}) == 8
+    )
+    assert "foo" in parsed_expression.expr_stack
+
+    # Parse failures are reported every time
+    for _ in range(2):
+        with pytest.raises(EvaluationParameterError) as e:
+            parse_evaluation_parameter("foo +", {"foo": 1})
+        assert "Parse Failure" in str(e.value)
+
+
+def test_find_evaluation_parameter_dependencies_returns_new_sets():
+    dependencies = find_evaluation_parameter_dependencies("3 * upstream_value")
+    dependencies["other"].add("another_value")
+
+    assert find_evaluation_parameter_dependencies("3 * upstream_value") == {
+        "urns": set(),
+        "other": {"upstream_value"},
+    }
+    with pytest.raises(EvaluationParameterError):
+        find_evaluation_parameter_dependencies("3 *")
+
+
 def test_find_evaluation_parameter_dependencies():
     parameter_expression = "(-3 * urn:great_expectations:validations:profile:expect_column_stdev_to_be_between.result.observed_value:column=norm) + urn:great_expectations:validations:profile:expect_column_mean_to_be_between.result.observed_value:column=norm"
     dependencies = find_evaluation_parameter_dependencies(parameter_expression)
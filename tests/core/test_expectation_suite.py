@@ -4,6 +4,7 @@ import pytest
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.exceptions import EvaluationParameterError
 
 
 @pytest.fixture
@@ -424,3 +425,71 @@ def test_get_column_expectations(
 ):
     obs = suite_with_table_and_column_expectations.get_column_expectations()
     assert obs == [exp1, exp2, exp3, exp4]
+
+
+def test_get_referenced_columns(suite_with_table_and_column_expectations):
+    assert suite_with_table_and_column_expectations.get_referenced_columns() == {
+        "a",
+        "b",
+        "1",
+    }
+
+    suite = ExpectationSuite(expectation_suite_name="referenced_columns")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_pair_values_to_be_equal",
+            kwargs={"column_A": "x", "column_B": "y"},
+        )
+    )
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_multicolumn_values_to_be_unique",
+            kwargs={"column_list": ["y", "z"]},
+        )
+    )
+    assert suite.get_referenced_columns() == {"x", "y", "z"}
+
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "w", "row_condition": 'x=="1"'},
+        )
+    )
+    assert suite.get_referenced_columns() is None
+
+
+def test_get_evaluation_parameter_dependencies_follows_modified_expectations():
+    urn = "urn:great_expectations:validations:upstream:expect_table_row_count_to_be_between.result.observed_value"
+    expectation = ExpectationConfiguration(
+        expectation_type="expect_table_row_count_to_equal",
+        kwargs={"value": {"$PARAMETER": urn}},
+    )
+    suite = ExpectationSuite(
+        expectation_suite_name="downstream", expectations=[expectation]
+    )
+    expected_dependencies = {
+        "upstream": ["expect_table_row_count_to_be_between.result.observed_value"]
+    }
+
+    assert suite.get_evaluation_parameter_dependencies() == expected_dependencies
+    suite.get_evaluation_parameter_dependencies()["upstream"].clear()
+    assert suite.get_evaluation_parameter_dependencies() == expected_dependencies
+
+    # Modifying the kwargs of an expectation in place modifies the dependencies of its suite
+    expectation.kwargs["value"] = {"$PARAMETER": urn.replace("upstream", "other")}
+    assert suite.get_evaluation_parameter_dependencies() == {
+        "other": ["expect_table_row_count_to_be_between.result.observed_value"]
+    }
+
+    # A suite with an invalid expression loads, and raises when its dependencies are requested
+    invalid_suite = ExpectationSuite(
+        expectation_suite_name="invalid",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_equal",
+                kwargs={"value": {"$PARAMETER": "3 *"}},
+            )
+        ],
+    )
+    with pytest.raises(EvaluationParameterError):
+        invalid_suite.get_evaluation_parameter_dependencies()
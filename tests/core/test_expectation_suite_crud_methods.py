@@ -428,3 +428,94 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def test_find_expectation_indexes_after_modifying_expectations_list(
+    domain_success_runtime_suite, exp1, exp2, exp4
+):
+    # The suite index is kept up to date when the expectations list is modified directly
+    assert domain_success_runtime_suite.find_expectation_indexes(exp4, "domain") == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+    domain_success_runtime_suite.expectations[1] = exp1
+    assert domain_success_runtime_suite.find_expectation_indexes(exp1, "domain") == [
+        0,
+        1,
+    ]
+    assert domain_success_runtime_suite.find_expectation_indexes(exp4, "domain") == [
+        2,
+        3,
+        4,
+    ]
+
+    domain_success_runtime_suite.expectations.pop(0)
+    assert domain_success_runtime_suite.find_expectation_indexes(exp1, "domain") == [0]
+
+    domain_success_runtime_suite.expectations = [exp2]
+    assert domain_success_runtime_suite.find_expectation_indexes(exp1, "domain") == []
+    assert domain_success_runtime_suite.find_expectation_indexes(exp4, "domain") == [0]
+
+    domain_success_runtime_suite.patch_expectation(
+        exp2, op="replace", path="/column", value="a", match_type="domain"
+    )
+    assert domain_success_runtime_suite.find_expectation_indexes(exp1, "domain") == [0]
+    assert domain_success_runtime_suite.find_expectation_indexes(exp4, "domain") == []
+
+
+def test_find_expectation_indexes_after_patching_expectation_kwargs(
+    domain_success_runtime_suite, exp4
+):
+    column_a_expectation = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": [1, 2, 3]},
+    )
+    assert domain_success_runtime_suite.find_expectation_indexes(
+        column_a_expectation, "domain"
+    ) == [0]
+
+    # The suite index is rebuilt when the kwargs of an indexed expectation are patched
+    domain_success_runtime_suite.expectations[1].patch(
+        op="replace", path="/column", value="a"
+    )
+    assert domain_success_runtime_suite.find_expectation_indexes(
+        column_a_expectation, "domain"
+    ) == [0, 1]
+    assert domain_success_runtime_suite.find_expectation_indexes(exp4, "domain") == [
+        2,
+        3,
+        4,
+    ]
+
+    domain_success_runtime_suite.expectations[0].patch(
+        op="replace", path="/column", value="c"
+    )
+    assert domain_success_runtime_suite.find_expectation_indexes(
+        column_a_expectation, "domain"
+    ) == [1]
+
+    # Suites do not share the state of their index
+    assert ExpectationSuite._unindexed_expectation_indexes is None
+
+
+def test_find_expectation_indexes_with_unhashable_domain_kwargs(empty_suite):
+    list_column_expectation = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_not_be_null",
+        kwargs={"column": ["a", "b"], "row_condition": {"c": [1]}},
+    )
+    empty_suite.add_expectation(list_column_expectation)
+    empty_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": ["a", "c"], "row_condition": {"c": [1]}},
+        )
+    )
+
+    assert len(empty_suite.expectations) == 2
+    assert empty_suite.find_expectation_indexes(list_column_expectation) == [0]
+    assert empty_suite.find_expectations(list_column_expectation) == [
+        list_column_expectation
+    ]
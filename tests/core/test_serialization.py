@@ -1,12 +1,28 @@
 import logging
 from decimal import Decimal
 
+import numpy as np
+import pandas as pd
+
 from great_expectations.core.util import (
     convert_to_json_serializable,
     requires_lossy_conversion,
 )
 
 
+def test_convert_to_json_serializable_of_arrays_and_series():
+    assert convert_to_json_serializable(np.array([1, 2])) == [1, 2]
+    assert convert_to_json_serializable(np.array([1.5, np.nan])) == [1.5, None]
+    assert convert_to_json_serializable(np.array([[1.5, np.nan]])) == [[1.5, None]]
+    assert convert_to_json_serializable(pd.Index(["a", None])) == ["a", None]
+    assert convert_to_json_serializable(
+        pd.Series([1.5, np.nan], index=pd.Index(["a", "b"], name="key"), name="count")
+    ) == [{"key": "a", "count": 1.5}, {"key": "b", "count": None}]
+    assert convert_to_json_serializable(
+        {1: (np.int64(2), np.float64("nan"), np.bool_(True))}
+    ) == {"1": [2, None, True]}
+
+
 def test_lossy_serialization_warning(caplog):
     caplog.set_level(logging.WARNING, logger="great_expectations.core")
 
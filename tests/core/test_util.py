@@ -1,7 +1,13 @@
+import io
+import os
+
+import boto3
 import pytest
 from freezegun import freeze_time
+from moto import mock_s3
 
 from great_expectations.core.util import (
+    S3ObjectReader,
     S3Url,
     sniff_s3_compression,
     substitute_all_strftime_format_strings,
@@ -61,3 +67,32 @@ def test_s3_suffix(url, expected):
 )
 def test_sniff_s3_compression(url, expected):
     assert sniff_s3_compression(S3Url(url)) == expected
+
+
+def test_s3_object_reader_fetches_ranges_in_parallel_parts():
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    content = bytes(range(256)) * 40
+    with mock_s3():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test_bucket")
+        s3.put_object(Bucket="test_bucket", Key="data.bin", Body=content)
+
+        reader = S3ObjectReader(
+            s3, S3Url("s3://test_bucket/data.bin"), part_size=1000, max_workers=4
+        )
+        assert reader.size == len(content)
+        assert reader.seekable()
+
+        reader.seek(-10, io.SEEK_END)
+        assert reader.read(100) == content[-10:]
+        assert reader.read(100) == b""
+
+        reader.seek(5)
+        buffer = bytearray(2500)
+        assert reader.readinto(buffer) == 2500
+        assert bytes(buffer) == content[5:2505]
+        assert reader.tell() == 2505
+
+        reader.seek(0)
+        assert reader.readall() == content
@@ -7,7 +7,7 @@ import pytest
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 
 def test_database_store_backend_schema_spec(caplog, sa, test_backends):
@@ -213,3 +213,48 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+def test_database_store_backend_bulk_operations(sa):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_bulk_operations",
+        key_columns=["k1", "k2"],
+    )
+
+    store_backend.set_many([(("a", "1"), "a1"), (("a", "2"), "a2"), (("b", "1"), "b1")])
+    assert store_backend.get_many([("b", "1"), ("a", "1")]) == ["b1", "a1"]
+    assert sorted(store_backend.list_items(("a",))) == [
+        (("a", "1"), "a1"),
+        (("a", "2"), "a2"),
+    ]
+
+    # Updates only touch the row matching every key column
+    store_backend.set(("a", "2"), "a2 updated")
+    store_backend.set_many([(("b", "1"), "b1 updated"), (("b", "2"), "b2")])
+    assert store_backend.get_many([("a", "1"), ("a", "2"), ("b", "1"), ("b", "2")]) == [
+        "a1",
+        "a2 updated",
+        "b1 updated",
+        "b2",
+    ]
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("a", "1"), ("c", "1")])
+
+
+def test_database_store_backend_update_without_native_upsert(sa):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_update_without_native_upsert",
+        key_columns=["k1", "k2"],
+    )
+    # Exercise the generic update-then-insert path used for dialects without an upsert
+    store_backend._build_upsert = lambda: None
+
+    store_backend.set_many([(("a", "1"), "a1"), (("a", "2"), "a2")])
+    store_backend.set(("a", "2"), "a2 updated")
+    assert store_backend.get_many([("a", "1"), ("a", "2")]) == ["a1", "a2 updated"]
+
+    with pytest.raises(StoreBackendError):
+        store_backend.set(("a", "1"), "a1 updated", allow_update=False)
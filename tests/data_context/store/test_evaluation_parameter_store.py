@@ -196,6 +196,40 @@ def test_database_evaluation_parameter_store_store_backend_id(in_memory_param_st
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
 
 
+def test_sqlite_evaluation_parameter_store_get_bind_params(sa):
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "url": "sqlite://",
+            },
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={},
+    )
+    run_id = RunIdentifier(run_name="my_run")
+    other_run_id = RunIdentifier(run_name="my_other_run")
+    for run, metric_value in [(run_id, 512), (other_run_id, 1024)]:
+        param_store.set(
+            ValidationMetricIdentifier(
+                run_id=run,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name="expect_table_row_count_to_be_between.result.observed_value",
+                metric_kwargs_id=None,
+            ),
+            metric_value,
+        )
+
+    assert param_store.get_bind_params(run_id) == {
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_table_row_count_to_be_between.result.observed_value": 512,
+    }
+
+
 @freeze_time("09/26/2019 13:42:41")
 def test_database_evaluation_parameter_store_get_bind_params(param_store):
     # Bind params must be expressed as a string-keyed dictionary.
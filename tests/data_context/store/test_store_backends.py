@@ -503,6 +503,65 @@ def test_TupleS3StoreBackend_with_prefix():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_list_keys_with_prefix():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="{0}/{1}/my_file_{2}",
+        bucket=bucket,
+        prefix=prefix,
+    )
+    for key in [
+        ("AAA", "A1", "1"),
+        ("AAA", "A1", "2"),
+        ("AAA", "A2", "1"),
+        ("AAAB", "B1", "1"),
+        ("BBB", "B1", "1"),
+    ]:
+        my_store.set(key, "value")
+
+    assert my_store._convert_key_prefix_to_filepath_prefix(("AAA",)) == "AAA/"
+    assert (
+        my_store._convert_key_prefix_to_filepath_prefix(("AAA", "A1"))
+        == "AAA/A1/my_file_"
+    )
+
+    assert set(my_store.list_keys(("AAA",))) == {
+        ("AAA", "A1", "1"),
+        ("AAA", "A1", "2"),
+        ("AAA", "A2", "1"),
+    }
+    assert set(my_store.list_keys(("AAA", "A1"))) == {
+        ("AAA", "A1", "1"),
+        ("AAA", "A1", "2"),
+    }
+    assert my_store.list_keys(("CCC",)) == []
+    assert len(my_store.list_keys()) == 6
+
+    assert my_store.has_key(("AAA", "A1", "2"))
+    assert not my_store.has_key(("AAA", "A1", "3"))
+    assert my_store.has_key(my_store.STORE_BACKEND_ID_KEY)
+
+    # Listing can be fanned out over the "subdirectories" of the listed prefix
+    my_concurrent_store = TupleS3StoreBackend(
+        filepath_template="{0}/{1}/my_file_{2}",
+        bucket=bucket,
+        prefix=prefix,
+        list_keys_max_workers=4,
+    )
+    assert my_concurrent_store.config["list_keys_max_workers"] == 4
+    assert sorted(my_concurrent_store.list_keys()) == sorted(my_store.list_keys())
+    assert set(my_concurrent_store.list_keys(("AAA",))) == set(
+        my_store.list_keys(("AAA",))
+    )
+
+
 @mock_s3
 def test_tuple_s3_store_backend_slash_conditions():
     bucket = "my_bucket"
@@ -1,14 +1,17 @@
 import datetime
 
 import boto3
+import numpy as np
 import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
 import tests.test_utils as test_utils
 from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
 )
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
@@ -295,3 +298,74 @@ def test_ValidationsStore_with_DatabaseStoreBackend(sa):
     assert my_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(my_store.store_backend_id)
+
+
+def test_ValidationsStore_with_gzip_compression(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_with_gzip_compression"))
+    store_backend = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    my_store = ValidationsStore(
+        store_backend=store_backend,
+        runtime_environment={"root_directory": path},
+        compression="gzip",
+    )
+    assert my_store.config["compression"] == "gzip"
+
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    expectation_config = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": [1.5]},
+    )
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=expectation_config,
+                result={"unexpected_list": np.array([1.5, np.nan] * 1000)},
+            )
+        ],
+    )
+    my_store.set(ns_1, validation_result)
+    serialized_value = my_store.store_backend.get(my_store.key_to_tuple(ns_1))
+    assert not serialized_value.startswith("{")
+    assert len(serialized_value) < len(
+        ValidationsStore().serialize(ns_1, validation_result)
+    )
+
+    expected_result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=expectation_config,
+                result={"unexpected_list": [1.5, None] * 1000},
+            )
+        ],
+    )
+    assert my_store.get(ns_1) == expected_result
+
+    # Results are read whether or not they were stored compressed
+    uncompressed_store = ValidationsStore(
+        store_backend=store_backend, runtime_environment={"root_directory": path}
+    )
+    assert uncompressed_store.get(ns_1) == expected_result
+    ns_2 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-200",
+        batch_identifier="batch_id",
+    )
+    uncompressed_store.set(ns_2, ExpectationSuiteValidationResult(success=True))
+    assert my_store.get(ns_2) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[]
+    )
+
+    with pytest.raises(ValueError):
+        ValidationsStore(compression="zip")
@@ -33,6 +33,7 @@ from great_expectations.dataset import Dataset
 from great_expectations.datasource import LegacyDatasource
 from great_expectations.datasource.types.batch_kwargs import PathBatchKwargs
 from great_expectations.util import gen_directory_tree_str
+from great_expectations.validator.validation_graph import MetricConfiguration
 from tests.integration.usage_statistics.test_integration_usage_statistics import (
     USAGE_STATISTICS_QA_URL,
 )
@@ -1909,6 +1910,69 @@ data_connectors:
     assert my_validator.expectation_suite_name == "A_expectation_suite"
 
 
+def test_get_validator_with_project_columns(empty_data_context, tmp_path_factory):
+    context = empty_data_context
+
+    base_directory = str(
+        tmp_path_factory.mktemp("test_get_validator_with_project_columns")
+    )
+
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "some_file.csv",
+        ],
+        file_content_fn=lambda: "x,y,z\n1,2,a\n2,3,b",
+    )
+
+    yaml_config = f"""
+class_name: Datasource
+
+execution_engine:
+    class_name: PandasExecutionEngine
+
+data_connectors:
+    my_filesystem_data_connector:
+        class_name: ConfiguredAssetFilesystemDataConnector
+        base_directory: {base_directory}
+        default_regex:
+            pattern: (.+)\\.csv
+            group_names:
+                - alphanumeric
+        assets:
+            A:
+"""
+
+    config = yaml.load(yaml_config)
+    context.add_datasource(
+        "my_directory_datasource",
+        **config,
+    )
+
+    expectation_suite = ExpectationSuite("my_expectation_suite")
+    expectation_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "z"},
+        )
+    )
+    my_validator = context.get_validator(
+        datasource_name="my_directory_datasource",
+        data_connector_name="my_filesystem_data_connector",
+        data_asset_name="A",
+        partition_identifiers={
+            "alphanumeric": "some_file",
+        },
+        expectation_suite=expectation_suite,
+        project_columns=True,
+    )
+    assert list(my_validator.active_batch.data.dataframe.columns) == ["z"]
+    assert my_validator.get_metric(
+        MetricConfiguration("table.columns", dict(), dict())
+    ) == ["x", "y", "z"]
+    assert my_validator.validate().success
+
+
 def test_get_batch_multiple_datasources_do_not_scan_all(
     data_context_with_bad_datasource,
 ):
@@ -2,7 +2,9 @@ from collections import OrderedDict
 
 import pytest
 
-from great_expectations.dataset import PandasDataset
+from great_expectations.dataset import Dataset, PandasDataset
+from great_expectations.dataset.dataset import DEFAULT_SHARED_METRIC_CACHE_MAX_BYTES
+from great_expectations.execution_engine.metric_cache import MetricCache
 from tests.test_utils import get_dataset
 
 data = OrderedDict([["a", [2.0, 5.0]], ["b", [5, 5]], ["c", [0, 10]], ["d", [0, None]]])
@@ -34,6 +36,59 @@ def test_caching(test_backend):
         dataset.get_column_max.cache_info()
 
 
+def test_caching_is_bounded_and_can_be_invalidated():
+    dataset = PandasDataset(data, metric_cache_config={"max_size": 2})
+    dataset.get_column_max("a")
+    dataset.get_column_max("b")
+    dataset.get_column_max("c")
+    assert len(dataset.metric_cache) == 2
+    assert dataset.metric_cache.stats["misses"] == 3
+
+    dataset.get_column_max("c")
+    assert dataset.get_column_max.cache_info().hits == 1
+
+    dataset.invalidate_metric_cache()
+    assert len(dataset.metric_cache) == 0
+    dataset.get_column_max("c")
+    assert dataset.get_column_max.cache_info().misses == 4
+
+
+def test_caching_keyed_on_batch_fingerprint_is_shared_across_datasets():
+    metric_cache = MetricCache()
+    dataset = PandasDataset(
+        data, metric_cache=metric_cache, metric_cache_batch_key="batch_fingerprint"
+    )
+    assert dataset.get_column_max("a") == 5.0
+
+    same_data_dataset = PandasDataset(
+        data, metric_cache=metric_cache, metric_cache_batch_key="batch_fingerprint"
+    )
+    assert same_data_dataset.get_column_max("a") == 5.0
+    assert same_data_dataset.get_column_max.cache_info().hits == 1
+
+    other_data_dataset = PandasDataset(
+        {"a": [1.0, 3.0]},
+        metric_cache=metric_cache,
+        metric_cache_batch_key="batch_fingerprint",
+    )
+    assert other_data_dataset.get_column_max("a") == 3.0
+    assert other_data_dataset.get_column_max.cache_info().misses == 1
+
+    # Datasets keyed on themselves do not share their cached values
+    unshared_dataset = PandasDataset(data, metric_cache=metric_cache)
+    assert unshared_dataset.get_column_max("a") == 5.0
+    assert unshared_dataset.get_column_max.cache_info().misses == 1
+
+
+def test_shared_metric_cache_is_bounded_by_memory():
+    dataset = PandasDataset(data, metric_cache_batch_key="batch_fingerprint")
+    assert dataset.metric_cache is Dataset._shared_metric_cache
+    assert dataset.metric_cache.max_bytes == DEFAULT_SHARED_METRIC_CACHE_MAX_BYTES
+
+    other_dataset = PandasDataset(data, metric_cache_batch_key="batch_id")
+    assert other_dataset.metric_cache is dataset.metric_cache
+
+
 def test_head(test_backend):
     dataset = get_dataset(
         test_backend, data, schemas=schemas.get(test_backend), caching=True
@@ -6,6 +6,9 @@ import pandas as pd
 import pytest
 
 from great_expectations.dataset import MetaSqlAlchemyDataset, SqlAlchemyDataset
+from great_expectations.execution_engine.sqlalchemy_metadata_catalog import (
+    _get_metadata_entries,
+)
 from great_expectations.util import is_library_loadable
 from tests.test_utils import get_dataset
 
@@ -157,6 +160,40 @@ def test_sqlalchemydataset_with_custom_sql(sa):
     assert result.success is False
 
 
+def test_sqlalchemydataset_metadata_catalog_ttl(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2]}).to_sql("test", engine, index=False)
+    assert SqlAlchemyDataset(
+        "test", engine=engine, metadata_catalog_ttl=300
+    ).get_table_columns() == ["a"]
+
+    engine.execute("ALTER TABLE test ADD COLUMN b INTEGER")
+    assert SqlAlchemyDataset(
+        "test", engine=engine, metadata_catalog_ttl=300
+    ).get_table_columns() == ["a"]
+
+    # Columns are not cached by default
+    engine.execute("DROP TABLE test")
+    engine.execute("CREATE TABLE test (a INTEGER, c INTEGER)")
+    dataset = SqlAlchemyDataset("test", engine=engine)
+    assert dataset.get_table_columns() == ["a", "c"]
+    assert dataset.expect_column_to_exist("c").success is True
+
+
+def test_sqlalchemydataset_does_not_cache_columns_of_custom_sql_tables(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2]}).to_sql("test", engine, index=False)
+    dataset = SqlAlchemyDataset(
+        engine=engine, custom_sql="SELECT a FROM test", metadata_catalog_ttl=300
+    )
+    assert dataset.get_table_columns() == ["a"]
+
+    cached_table_names = [
+        key[2] for key in _get_metadata_entries(engine).entries if key[2] is not None
+    ]
+    assert dataset._table.name not in cached_table_names
+
+
 def test_column(sa):
     engine = sa.create_engine("sqlite://")
 
@@ -365,3 +402,48 @@ def test_expect_compound_columns_to_be_unique_with_no_rows(sa):
     dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
 
     assert dataset.expect_compound_columns_to_be_unique(["col1", "col2"]).success
+
+
+def test_validate_with_fused_column_map_queries(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, None],
+            "b": ["cat", "dog", "fish", "tiger", "elephant"],
+        }
+    ).to_sql(name="test_data", con=engine, index=False)
+
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+    dataset.expect_column_values_to_not_be_null("a")
+    dataset.expect_column_values_to_be_between("a", min_value=1, max_value=3)
+    dataset.expect_column_values_to_be_in_set("b", value_set=["cat", "dog"])
+    dataset.expect_column_value_lengths_to_be_between("b", min_value=3, max_value=8)
+    dataset.expect_column_values_to_be_unique("b")
+    dataset.expect_table_row_count_to_equal(5)
+    expectation_suite = dataset.get_expectation_suite(discard_failed_expectations=False)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(dataset.engine, "before_cursor_execute", record_statement)
+    expected_results = dataset.validate(expectation_suite=expectation_suite)
+    unfused_statements = list(statements)
+
+    statements.clear()
+    fused_dataset = SqlAlchemyDataset(
+        "test_data",
+        engine=engine,
+        batch_kwargs={"fuse_column_map_queries": True},
+    )
+    sa.event.listen(fused_dataset.engine, "before_cursor_execute", record_statement)
+    results = fused_dataset.validate(expectation_suite=expectation_suite)
+
+    assert [result.to_json_dict() for result in results.results] == [
+        result.to_json_dict() for result in expected_results.results
+    ]
+    # One fused count query, unexpected values for the three failing column map expectations, and the row count
+    assert len(statements) == 5
+    assert len(statements) < len(unfused_statements)
+    assert fused_dataset._column_map_counts is None
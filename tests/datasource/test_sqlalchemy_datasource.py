@@ -231,6 +231,31 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     )
 
 
+def test_sqlalchemy_datasource_metadata_catalog_ttl(sqlitedb_engine):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy", engine=sqlitedb_engine, metadata_catalog_ttl=0
+    )
+    assert datasource._datasource_config["metadata_catalog_ttl"] == 0
+
+    with mock.patch(
+        "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyBatchReference.__init__",
+        return_value=None,
+    ) as mock_batch:
+        datasource.get_batch({"table": "foo"})
+    mock_batch.assert_called_once_with(
+        engine=sqlitedb_engine,
+        schema=None,
+        table_name="foo",
+        metadata_catalog_ttl=0,
+    )
+
+    pd.DataFrame({"a": [1, 2]}).to_sql("foo", sqlitedb_engine, index=False)
+    batch = datasource.get_batch({"table": "foo"})
+    assert batch.data.get_init_kwargs()["metadata_catalog_ttl"] == 0
+    dataset = SqlAlchemyDataset(**batch.data.get_init_kwargs())
+    assert dataset.get_table_columns() == ["a"]
+
+
 def test_sqlalchemy_datasource_processes_dataset_options(test_db_connection_string):
     datasource = SqlAlchemyDatasource(
         "SqlAlchemy", credentials={"url": test_db_connection_string}
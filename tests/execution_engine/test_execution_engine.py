@@ -1,7 +1,7 @@
 import pandas as pd
 import pytest
 
-from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions import GreatExpectationsError, InvalidConfigError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -167,3 +167,111 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_reuses_cached_metrics_for_fingerprinted_batch():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(
+        "my_id", df, batch_markers={"pandas_data_fingerprint": "abc123"}
+    )
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert metrics[mean.id] == 2
+    assert engine.metric_cache.stats["misses"] == 1
+
+    # Reloading the same data under a new batch_id reuses the cached value instead of recomputing it
+    engine.load_batch_data(
+        "my_other_id",
+        pd.DataFrame({"a": [100]}),
+        batch_markers={"pandas_data_fingerprint": "abc123"},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert metrics[mean.id] == 2
+    assert engine.metric_cache.stats["hits"] == 1
+
+
+def test_resolve_metrics_invalidates_cached_metrics_on_reload_without_fingerprint():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [1, 2, 3]}))
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,))[mean.id] == 2
+
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [4, 5, 6]}))
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,))[mean.id] == 5
+
+
+def test_resolve_metrics_without_caching():
+    engine = PandasExecutionEngine(caching=False)
+    engine.load_batch_data(
+        "my_id",
+        pd.DataFrame({"a": [1, 2, 3]}),
+        batch_markers={"pandas_data_fingerprint": "abc123"},
+    )
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,))[mean.id] == 2
+    assert engine.metric_cache.get(engine._get_metric_cache_key(mean)) is None
+
+
+def test_resolve_metrics_with_concurrency_config():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        concurrency_config={"max_workers": 2, "pool_type": "thread"},
+    )
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.mean", "column.standard_deviation"]
+        for column in ["a", "b"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+    assert [metrics[metric.id] for metric in desired_metrics] == [
+        2,
+        5.5,
+        1,
+        pytest.approx(1.2909944),
+    ]
+    executor = engine._get_metric_executor()
+    assert executor is not None
+    executor.shutdown()
+
+
+def test_invalid_concurrency_config():
+    with pytest.raises(InvalidConfigError):
+        PandasExecutionEngine(concurrency_config={"max_workers": 0})
+    with pytest.raises(InvalidConfigError):
+        PandasExecutionEngine(
+            concurrency_config={"max_workers": 2, "pool_type": "process"}
+        )
+
+
+def test_unload_batch_data_if_loaded():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [1, 2, 3]}))
+    first_batch_data = engine.loaded_batch_data_dict["my_id"]
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [4, 5, 6]}))
+    second_batch_data = engine.loaded_batch_data_dict["my_id"]
+
+    # The batch was loaded again since first_batch_data, so it must be kept
+    assert not engine.unload_batch_data_if_loaded("my_id", first_batch_data)
+    assert engine.loaded_batch_data_dict["my_id"] is second_batch_data
+
+    assert engine.unload_batch_data_if_loaded("my_id", second_batch_data)
+    assert "my_id" not in engine.loaded_batch_data_dict
+    assert not engine.unload_batch_data_if_loaded("my_id", second_batch_data)
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from freezegun import freeze_time
+
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    SqliteMetricCacheStore,
+)
+
+METRIC_ID = ("column.mean", "column=a", tuple())
+
+
+def test_metric_cache_get_and_set():
+    cache = MetricCache()
+    assert cache.get(("batch", METRIC_ID)) is None
+    cache.set(("batch", METRIC_ID), 2.0)
+    assert ("batch", METRIC_ID) in cache
+    assert cache.get(("batch", METRIC_ID)) == 2.0
+    assert cache.get(("other_batch", METRIC_ID), "missing") == "missing"
+    assert cache.stats == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_metric_cache_evicts_least_recently_used():
+    cache = MetricCache(max_size=2)
+    cache.set(("batch", ("a",)), 1)
+    cache.set(("batch", ("b",)), 2)
+    # Touching "a" makes "b" the least recently used entry
+    assert cache.get(("batch", ("a",))) == 1
+    cache.set(("batch", ("c",)), 3)
+    assert len(cache) == 2
+    assert ("batch", ("a",)) in cache
+    assert ("batch", ("b",)) not in cache
+    assert ("batch", ("c",)) in cache
+
+
+def test_metric_cache_rejects_invalid_max_size():
+    with pytest.raises(ValueError):
+        MetricCache(max_size=0)
+
+
+def test_metric_cache_ttl():
+    cache = MetricCache(ttl=60)
+    with freeze_time("2021-01-01 00:00:00"):
+        cache.set(("batch", METRIC_ID), 2.0)
+    with freeze_time("2021-01-01 00:00:59"):
+        assert cache.get(("batch", METRIC_ID)) == 2.0
+    with freeze_time("2021-01-01 00:01:01"):
+        assert cache.get(("batch", METRIC_ID)) is None
+        assert len(cache) == 0
+
+
+def test_metric_cache_invalidate():
+    cache = MetricCache()
+    cache.set(("batch", ("a",)), 1)
+    cache.set(("batch", ("b",)), 2)
+    cache.set(("other_batch", ("a",)), 3)
+    cache.invalidate("batch")
+    assert len(cache) == 1
+    assert cache.get(("other_batch", ("a",))) == 3
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_metric_cache_with_sqlite_persistent_store(tmp_path):
+    sqlite_path = str(tmp_path / "cache" / "metrics.db")
+    cache = MetricCache.from_config({"max_size": 10, "sqlite_path": sqlite_path})
+    assert isinstance(cache.persistent_store, SqliteMetricCacheStore)
+    cache.set(("batch", METRIC_ID), {"observed_value": [1, 2, 3]})
+    # Non-picklable values are kept in memory only
+    cache.set(("batch", ("lambda",)), lambda x: x)
+
+    second_cache = MetricCache.from_config({"sqlite_path": sqlite_path})
+    assert second_cache.get(("batch", METRIC_ID)) == {"observed_value": [1, 2, 3]}
+    assert second_cache.get(("batch", ("lambda",))) is None
+
+    second_cache.invalidate("batch")
+    assert (
+        MetricCache.from_config({"sqlite_path": sqlite_path}).get(("batch", METRIC_ID))
+        is None
+    )
+
+
+def test_metric_cache_evicts_beyond_max_bytes():
+    cache = MetricCache(max_size=None, max_bytes=2000)
+    cache.set(("batch", ("a",)), np.zeros(100))
+    cache.set(("batch", ("b",)), np.zeros(100))
+    assert len(cache) == 2
+    assert cache.nbytes == 1600
+    cache.set(("batch", ("c",)), np.zeros(100))
+    assert len(cache) == 2
+    assert ("batch", ("a",)) not in cache
+    assert cache.nbytes == 1600
+    # Values larger than the whole cache are not cached
+    cache.set(("batch", ("d",)), np.zeros(1000))
+    assert ("batch", ("d",)) not in cache
+    assert len(cache) == 2
+    cache.invalidate()
+    assert cache.nbytes == 0
+
+
+def test_metric_cache_returns_copies_of_mutable_values():
+    cache = MetricCache()
+    value = {"observed_value": [1, 2, 3]}
+    cache.set(("batch", METRIC_ID), value)
+    value["observed_value"].append(4)
+    cached_value = cache.get(("batch", METRIC_ID))
+    cached_value["observed_value"].append(5)
+
+    assert cache.get(("batch", METRIC_ID)) == {"observed_value": [1, 2, 3]}
+
+
+def test_metric_cache_does_not_copy_immutable_values():
+    cache = MetricCache()
+    value = (1, "a", np.float64(2.5))
+    cache.set(("batch", METRIC_ID), value)
+    assert cache.get(("batch", METRIC_ID)) is value
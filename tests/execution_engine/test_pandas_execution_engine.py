@@ -1,6 +1,7 @@
 import datetime
 import os
 import random
+from io import BytesIO
 from pathlib import Path
 from typing import List
 
@@ -17,14 +18,18 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.id_dict import PartitionDefinition
 from great_expectations.datasource.data_connector import ConfiguredAssetS3DataConnector
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import PandasChunkedBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasDomainCache,
     PandasExecutionEngine,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_reader_fn():
@@ -202,6 +207,92 @@ def test_get_compute_domain_with_unmeetable_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_reuses_row_condition_domain():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="identity")
+    column_data, _, accessor_kwargs = engine.get_compute_domain(
+        dict(domain_kwargs, column="a"), domain_type="column"
+    )
+    assert column_data is data
+    assert accessor_kwargs == {"column": "a"}
+    assert len(engine.domain_cache) == 1
+
+    # Reloading the batch invalidates its domains
+    engine.load_batch_data(batch_data=df * 10, batch_id="1234")
+    assert len(engine.domain_cache) == 0
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="identity")
+    assert data["a"].tolist() == [10, 20, 30]
+
+
+def test_get_compute_domain_with_disabled_domain_cache():
+    engine = PandasExecutionEngine(domain_cache_max_bytes=0)
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="identity")
+    assert data["a"].tolist() == [2, 3]
+    assert len(engine.domain_cache) == 0
+
+
+def test_domain_cache_evicts_least_recently_used_domains():
+    df = pd.DataFrame({"a": range(100)})
+    size_bytes = int(df.memory_usage(index=True, deep=True).sum())
+    cache = PandasDomainCache(max_bytes=2 * size_bytes)
+
+    cache.set(("batch_1", "a > 1", "pandas"), df)
+    cache.set(("batch_1", "a > 2", "pandas"), df)
+    assert cache.get(("batch_1", "a > 1", "pandas")) is df
+    cache.set(("batch_2", "a > 1", "pandas"), df)
+
+    assert len(cache) == 2
+    assert cache.size_bytes == 2 * size_bytes
+    assert cache.get(("batch_1", "a > 2", "pandas")) is None
+    assert cache.get(("batch_1", "a > 1", "pandas")) is df
+
+    cache.invalidate("batch_1")
+    assert len(cache) == 1
+    assert cache.size_bytes == size_bytes
+
+    with pytest.raises(ValueError):
+        PandasDomainCache(max_bytes=-1)
+
+
+def test_domain_cache_counts_the_memory_of_object_columns():
+    df = pd.DataFrame({"a": ["x" * 1000] * 100})
+    cache = PandasDomainCache(max_bytes=int(df.memory_usage(index=True).sum()) * 2)
+
+    # The strings of the column take far more memory than the references to them
+    cache.set(("batch_1", "a > 1", "pandas"), df)
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_unload_batch_data():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    engine.load_batch_data(batch_data=df, batch_id="5678")
+    engine.get_compute_domain(
+        {"row_condition": "b > 2", "condition_parser": "pandas"},
+        domain_type="identity",
+    )
+    assert len(engine.domain_cache) == 1
+
+    engine.unload_batch_data("5678")
+    assert list(engine.loaded_batch_data_dict) == ["1234"]
+    assert engine.active_batch_data_id == "1234"
+    assert len(engine.domain_cache) == 0
+
+    engine.unload_batch_data()
+    assert engine.loaded_batch_data_dict == {}
+    assert engine.active_batch_data_id is None
+
+
 # Just checking that the Pandas Execution Engine can perform these in sequence
 def test_resolve_metric_bundle():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -230,6 +321,48 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metric_bundle_computes_each_domain_once():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    compute_domain_calls = []
+    get_compute_domain = engine.get_compute_domain
+
+    def counting_get_compute_domain(domain_kwargs, domain_type, **kwargs):
+        compute_domain_calls.append(domain_kwargs)
+        return get_compute_domain(domain_kwargs, domain_type, **kwargs)
+
+    engine.get_compute_domain = counting_get_compute_domain
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.mean", "column.max", "column.min"]
+        for column in ["a", "b"]
+    ] + [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={
+                "column": "b",
+                "row_condition": "a<3",
+                "condition_parser": "pandas",
+            },
+            metric_value_kwargs=dict(),
+        )
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+
+    assert metrics[("column.mean", "column=a", ())] == 2.0
+    assert metrics[("column.max", "column=a", ())] == 3.0
+    assert metrics[("column.min", "column=b", ())] == 4
+    assert metrics[desired_metrics[-1].id] == 5
+    # one unconditional domain and one row_condition domain
+    assert len(compute_domain_calls) == 2
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -299,6 +432,170 @@ def test_get_batch_with_split_on_whole_table_filesystem(
     assert test_df.dataframe.shape == (5, 2)
 
 
+def test_get_batch_with_chunk_size_streams_file_in_chunks(tmpdir):
+    path = os.path.join(tmpdir, "chunked.csv")
+    pd.DataFrame({"a": range(10), "b": list("xyzxyzxyzq")}).to_csv(path, index=False)
+
+    batch_data, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+        PathBatchSpec(
+            path=path,
+            chunk_size=4,
+            sampling_method="_sample_using_mod",
+            sampling_kwargs={"column_name": "a", "mod": 2, "value": 0},
+        )
+    )
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    assert "pandas_data_fingerprint" not in batch_markers
+    assert [list(chunk["a"]) for chunk in batch_data.iter_chunks()] == [
+        [0, 2],
+        [4, 6],
+        [8],
+    ]
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        batch_data.dataframe
+
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(path=path, reader_method="read_pickle", chunk_size=4)
+        )
+
+
+def test_resolve_metrics_on_chunked_batch_matches_in_memory_batch(tmpdir):
+    path = os.path.join(tmpdir, "chunked.csv")
+    pd.DataFrame(
+        {"a": [1, 2, 3, None, 5, 6, 7, 8, 9, 100], "b": list("xyzxyzxyzq")}
+    ).to_csv(path, index=False)
+    configurations = [
+        ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        for expectation_type, kwargs in [
+            ("expect_table_row_count_to_equal", {"value": 10}),
+            ("expect_column_values_to_not_be_null", {"column": "a"}),
+            (
+                "expect_column_values_to_be_between",
+                {"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_mean_to_be_between",
+                {"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_stdev_to_be_between",
+                {"column": "a", "min_value": 0, "max_value": 100},
+            ),
+            (
+                "expect_column_proportion_of_unique_values_to_be_between",
+                {"column": "b", "min_value": 0, "max_value": 1},
+            ),
+            (
+                "expect_column_values_to_be_in_set",
+                {"column": "b", "value_set": ["x", "y"]},
+            ),
+            (
+                "expect_column_distinct_values_to_be_in_set",
+                {"column": "b", "value_set": ["x", "y"]},
+            ),
+            # Medians are not mergeable, and are computed on a sample holding every row of this small batch
+            (
+                "expect_column_median_to_be_between",
+                {"column": "a", "min_value": 0, "max_value": 10},
+            ),
+        ]
+    ]
+
+    results = []
+    for batch_spec in [
+        PathBatchSpec(path=path),
+        PathBatchSpec(path=path, chunk_size=3),
+    ]:
+        engine = PandasExecutionEngine()
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        engine.load_batch_data("batch_id", batch_data, batch_markers)
+        results.append(
+            [
+                result.to_json_dict()
+                for result in Validator(execution_engine=engine).graph_validate(
+                    configurations=configurations,
+                    runtime_configuration={"result_format": "SUMMARY"},
+                )
+            ]
+        )
+
+    in_memory_results, chunked_results = results
+    assert chunked_results == in_memory_results
+    assert [result["success"] for result in chunked_results] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert chunked_results[6]["result"]["partial_unexpected_list"] == [
+        "z",
+        "z",
+        "z",
+        "q",
+    ]
+
+
+def test_get_batch_with_projected_columns_keeps_source_schema(tmpdir):
+    path = os.path.join(tmpdir, "projected.csv")
+    pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.5, 2.5, 3.5], "d": [0, 1, 0]}
+    ).to_csv(path, index=False)
+
+    engine = PandasExecutionEngine()
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        PathBatchSpec(
+            path=path,
+            projected_columns=["c"],
+            sampling_method="_sample_using_mod",
+            sampling_kwargs={"column_name": "a", "mod": 2, "value": 1},
+        )
+    )
+    # Columns used to sample or split the batch are loaded along with the projected ones
+    assert list(batch_data.dataframe.columns) == ["a", "c"]
+    assert [column["name"] for column in batch_data.source_schema] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+    engine.load_batch_data("batch_id", batch_data, batch_markers)
+    validator = Validator(execution_engine=engine)
+    assert validator.get_metric(
+        MetricConfiguration("table.columns", dict(), dict())
+    ) == ["a", "b", "c", "d"]
+    column_types = validator.get_metric(
+        MetricConfiguration("table.column_types", dict(), dict())
+    )
+    assert [str(column["type"]) for column in column_types] == [
+        "int64",
+        "object",
+        "float64",
+        "int64",
+    ]
+
+    # A projection of every column, or of a user-specified usecols, leaves the read as is
+    batch_data = engine.get_batch_data(
+        PathBatchSpec(path=path, projected_columns=["a", "b", "c", "d"])
+    )
+    assert batch_data.source_schema is None
+    batch_data = engine.get_batch_data(
+        PathBatchSpec(
+            path=path,
+            projected_columns=["c"],
+            reader_options={"usecols": ["a", "b"]},
+        )
+    )
+    assert list(batch_data.dataframe.columns) == ["a", "b"]
+    assert batch_data.source_schema is None
+
+
 @pytest.fixture(scope="function")
 def aws_credentials():
     """Mocked AWS Credentials for moto."""
@@ -467,6 +764,33 @@ def test_get_batch_s3_compressed_files(test_s3_files_compressed, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+def test_get_batch_s3_with_seekable_reader(s3, s3_bucket, test_df_small):
+    buffer = BytesIO()
+    test_df_small.to_pickle(buffer)
+    s3.put_object(Bucket=s3_bucket, Key="data.pkl", Body=buffer.getvalue())
+
+    batch_spec = S3BatchSpec(
+        path=f"s3a://{s3_bucket}/data.pkl",
+        reader_method="read_pickle",
+        reader_options={"compression": None},
+    )
+    df = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+    assert df.dataframe.equals(test_df_small)
+
+
+def test_get_batch_s3_with_chunk_size(test_s3_files, test_df_small):
+    bucket, keys = test_s3_files
+    batch_spec = S3BatchSpec(
+        path=f"s3a://{os.path.join(bucket, keys[0])}",
+        reader_method="read_csv",
+        chunk_size=2,
+    )
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks).equals(test_df_small)
+
+
 def test_get_batch_with_split_on_column_value(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -702,3 +1026,40 @@ def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     assert split_df.dataframe.shape == (2, 10)
     assert split_df.dataframe.id.min() == 54
     assert split_df.dataframe.id.max() == 59
+
+
+def test_unique_values_on_chunked_batch_with_duplicates_across_chunks(tmpdir):
+    path = os.path.join(tmpdir, "chunked.csv")
+    pd.DataFrame({"a": [1, 2, 3, 1, 2, 3], "b": [1, 2, 3, 4, 5, 6]}).to_csv(
+        path, index=False
+    )
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_unique",
+            kwargs={"column": column},
+        )
+        for column in ["a", "b"]
+    ]
+
+    results = []
+    for batch_spec in [
+        PathBatchSpec(path=path),
+        PathBatchSpec(path=path, chunk_size=3),
+    ]:
+        engine = PandasExecutionEngine()
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        engine.load_batch_data("batch_id", batch_data, batch_markers)
+        results.append(
+            [
+                result.to_json_dict()
+                for result in Validator(execution_engine=engine).graph_validate(
+                    configurations=configurations,
+                    runtime_configuration={"result_format": "SUMMARY"},
+                )
+            ]
+        )
+
+    in_memory_results, chunked_results = results
+    assert chunked_results == in_memory_results
+    assert [result["success"] for result in chunked_results] == [False, True]
+    assert chunked_results[0]["result"]["unexpected_count"] == 6
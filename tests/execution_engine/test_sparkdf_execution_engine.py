@@ -1100,3 +1100,67 @@ def test_dataframe_property_given_loaded_batch(spark_session):
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def test_load_batch_data_persists_batch(spark_session):
+    engine = SparkDFExecutionEngine(persist_storage_level="MEMORY_ONLY")
+    assert engine.config["persist_storage_level"] == "MEMORY_ONLY"
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]}))
+
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert df.is_cached
+    assert df.storageLevel == pyspark.StorageLevel.MEMORY_ONLY
+
+    # Loading other data for the batch unpersists the data it replaces
+    other_df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2]}))
+    engine.load_batch_data(batch_data=other_df, batch_id="1234")
+    assert not df.is_cached
+    assert other_df.is_cached
+
+    engine.unload_batch_data("1234")
+    assert not other_df.is_cached
+    assert engine.loaded_batch_data_dict == {}
+
+    # Data persisted by the caller is left persisted
+    df.persist()
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    engine.unload_batch_data()
+    assert df.is_cached
+    df.unpersist()
+
+    engine = SparkDFExecutionEngine(persist=False)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert not df.is_cached
+
+    with pytest.raises(ValueError):
+        SparkDFExecutionEngine(persist_storage_level="NOT_A_STORAGE_LEVEL")
+
+
+def test_get_compute_domain_reuses_persisted_row_condition_domain(spark_session):
+    df = spark_session.createDataFrame(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, 5]})
+    )
+    engine = SparkDFExecutionEngine(domain_cache_max_size=1)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "spark"}
+
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="identity")
+    column_data, _, _ = engine.get_compute_domain(
+        dict(domain_kwargs, column="a"), domain_type="column"
+    )
+    assert column_data is data
+    assert data.is_cached
+    assert len(engine.domain_cache) == 1
+
+    # Least recently used domains are unpersisted past domain_cache_max_size
+    other_data, _, _ = engine.get_compute_domain(
+        {"row_condition": "b > 3", "condition_parser": "spark"},
+        domain_type="identity",
+    )
+    assert not data.is_cached
+    assert other_data.is_cached
+    assert len(engine.domain_cache) == 1
+
+    engine.unload_batch_data("1234")
+    assert not other_data.is_cached
+    assert len(engine.domain_cache) == 0
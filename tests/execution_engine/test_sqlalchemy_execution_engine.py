@@ -1,10 +1,12 @@
 import logging
 import os
+import unittest.mock as mock
 
 import pandas as pd
 import pytest
 
 from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.exceptions import InvalidConfigError
@@ -20,6 +22,7 @@ from great_expectations.expectations.metrics import (
     ColumnValuesZScore,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 # Function to test for spark dataframe equality
 from tests.test_utils import _build_sa_engine
@@ -193,6 +196,93 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def test_sa_metric_executor_is_disabled_for_single_connection_engines(sa):
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", concurrency_config={"max_workers": 4}
+    )
+    # sqlite engines are pinned to a single connection so that temporary tables remain visible
+    assert isinstance(engine.engine, sa.engine.Connection)
+    assert engine._get_metric_executor() is None
+
+
+def test_sa_metric_executor_is_disabled_for_temporary_table_batches(sa):
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", concurrency_config={"max_workers": 4}
+    )
+    engine.engine.execute("CREATE TABLE test (a INTEGER)")
+    for batch_id, create_temp_table in [
+        ("subselect_batch", False),
+        ("temp_table_batch", True),
+    ]:
+        batch_data, _ = engine.get_batch_data_and_markers(
+            SqlAlchemyDatasourceBatchSpec(
+                table_name="test", create_temp_table=create_temp_table
+            )
+        )
+        assert batch_data.is_temporary_table is create_temp_table
+        engine.load_batch_data(batch_id, batch_data)
+
+    # With a pooled engine, queries may run on different connections
+    with mock.patch.object(engine, "engine", sa.create_engine("sqlite://")):
+        executor = engine._get_metric_executor(batch_ids=["subselect_batch"])
+        assert executor is not None
+        executor.shutdown()
+        assert engine._get_metric_executor(batch_ids=["temp_table_batch"]) is None
+        # Metrics without a batch_id are resolved on the active batch
+        assert engine.active_batch_data_id == "temp_table_batch"
+        assert engine._get_metric_executor(batch_ids=[None]) is None
+
+
+def test_sa_config_records_disabled_caching(sa):
+    assert (
+        "caching" not in SqlAlchemyExecutionEngine(connection_string="sqlite://").config
+    )
+
+    config = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", caching=False
+    ).config
+    assert config["caching"] is False
+    engine = SqlAlchemyExecutionEngine(
+        **{
+            key: value
+            for key, value in config.items()
+            if key not in ("module_name", "class_name")
+        }
+    )
+    assert engine.config == config
+    assert engine._caching is False
+
+
+def test_sa_metrics_are_only_shared_across_loads_with_a_metric_cache_config(sa):
+    row_count = MetricConfiguration("table.row_count", {}, {})
+
+    def resolve_row_count(engine):
+        batch_data, _ = engine.get_batch_data_and_markers(
+            SqlAlchemyDatasourceBatchSpec(table_name="test")
+        )
+        engine.load_batch_data("1234", batch_data)
+        return Validator(execution_engine=engine).get_metric(row_count)
+
+    engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    engine.engine.execute("CREATE TABLE test (a INTEGER)")
+    engine.engine.execute("INSERT INTO test VALUES (1)")
+    assert resolve_row_count(engine) == 1
+    engine.engine.execute("INSERT INTO test VALUES (2)")
+    assert resolve_row_count(engine) == 2
+    assert "metric_cache_config" not in engine.config
+
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", metric_cache_config={"ttl": 60}
+    )
+    engine.engine.execute("CREATE TABLE test (a INTEGER)")
+    engine.engine.execute("INSERT INTO test VALUES (1)")
+    assert resolve_row_count(engine) == 1
+    engine.engine.execute("INSERT INTO test VALUES (2)")
+    assert resolve_row_count(engine) == 1
+    assert engine.metric_cache.ttl == 60
+    assert engine.config["metric_cache_config"] == {"ttl": 60}
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs(sa):
     engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]}))
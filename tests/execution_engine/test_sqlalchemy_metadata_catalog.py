@@ -0,0 +1,124 @@
+import pandas as pd
+import pytest
+from freezegun import freeze_time
+
+from great_expectations.execution_engine.sqlalchemy_metadata_catalog import (
+    SqlAlchemyMetadataCatalog,
+)
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_sql("test", engine, index=False)
+    return engine
+
+
+def test_metadata_catalog_is_shared_by_engines_of_a_database(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300)
+    with freeze_time("2021-01-01 00:00:00"):
+        assert [column["name"] for column in catalog.get_columns("test")] == [
+            "a",
+            "b",
+        ]
+        assert catalog.get_table_names() == ["test"]
+
+    sqlite_engine.execute("ALTER TABLE test ADD COLUMN c INTEGER")
+    other_catalog = SqlAlchemyMetadataCatalog(
+        sa.create_engine(sqlite_engine.url), ttl=300
+    )
+    with freeze_time("2021-01-01 00:04:59"):
+        assert len(other_catalog.get_columns("test")) == 2
+    with freeze_time("2021-01-01 00:05:01"):
+        assert len(other_catalog.get_columns("test")) == 3
+
+
+def test_metadata_catalog_invalidate(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300)
+    assert catalog.get_table_names() == ["test"]
+
+    pd.DataFrame({"a": [1]}).to_sql("other", sqlite_engine, index=False)
+    assert catalog.get_table_names() == ["test"]
+    catalog.invalidate("other")
+    assert catalog.get_table_names() == ["other", "test"]
+
+    # The catalog returns copies of its metadata
+    catalog.get_table_names().append("modified")
+    assert catalog.get_table_names() == ["other", "test"]
+
+
+def test_metadata_catalog_without_ttl_does_not_cache(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine)
+    assert len(catalog.get_columns("test")) == 2
+    sqlite_engine.execute("ALTER TABLE test ADD COLUMN c INTEGER")
+    assert len(catalog.get_columns("test")) == 3
+
+    with pytest.raises(ValueError):
+        SqlAlchemyMetadataCatalog(sqlite_engine, ttl=-1)
+
+
+def test_metadata_catalog_of_in_memory_databases_is_not_shared():
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1]}).to_sql("test", engine, index=False)
+    other_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"b": [1], "c": [2]}).to_sql("test", other_engine, index=False)
+
+    assert len(SqlAlchemyMetadataCatalog(engine, ttl=300).get_columns("test")) == 1
+    assert (
+        len(SqlAlchemyMetadataCatalog(other_engine, ttl=300).get_columns("test")) == 2
+    )
+
+
+def test_metadata_catalog_caches_fallback_columns(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300)
+    fallback_calls = []
+
+    def fallback():
+        fallback_calls.append(1)
+        return [{"name": "a"}]
+
+    for _ in range(2):
+        assert catalog.get_columns("missing", fallback=fallback) == [{"name": "a"}]
+    assert len(fallback_calls) == 1
+
+    # sqlite reflection returns no columns for tables it does not find
+    assert catalog.get_columns("other_missing") == []
+
+
+def test_metadata_catalog_row_count_estimate_without_statistics(sqlite_engine):
+    assert (
+        SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300).get_row_count_estimate("test")
+        is None
+    )
+
+
+def test_metadata_catalog_drops_expired_entries_on_write(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300)
+    entries = catalog._entries.entries
+    with freeze_time("2021-01-01 00:00:00"):
+        catalog.get_columns("test")
+    with freeze_time("2021-01-01 00:06:00"):
+        catalog.get_table_names()
+    assert list(entries) == [("table_names", None, None)]
+
+    # A catalog without ttl does not cache
+    SqlAlchemyMetadataCatalog(sqlite_engine, ttl=0).get_columns("test")
+    assert list(entries) == [("table_names", None, None)]
+
+
+def test_metadata_catalog_evicts_least_recently_used_entries(sqlite_engine):
+    catalog = SqlAlchemyMetadataCatalog(sqlite_engine, ttl=300)
+    catalog._entries.max_entries = 2
+    catalog.get_columns("test")
+    catalog.get_table_names()
+    catalog.get_columns("test")
+    catalog.get_view_names()
+    assert list(catalog._entries.entries) == [
+        ("columns", None, "test"),
+        ("view_names", None, None),
+    ]
@@ -1,4 +1,5 @@
 import logging
+import unittest.mock as mock
 
 import numpy as np
 import pandas as pd
@@ -13,8 +14,12 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distribution_summary import (
+    _get_values_at_positions,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def _build_spark_engine(df, spark_session):
@@ -294,6 +299,59 @@ def test_map_unique_pd():
     assert list(results[desired_metric.id][0]) == [False, False, True, True]
 
 
+def test_map_match_strftime_format_pd():
+    engine = _build_pandas_engine(
+        pd.DataFrame(
+            {
+                "a": [
+                    "2021-01-05",
+                    "2021-1-5",
+                    "2021-01-05",
+                    "2021-01-05 10:00:00",
+                    "1021-01-05",
+                    "not a date",
+                    None,
+                ]
+            }
+        )
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.match_strftime_format.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"strftime_format": "%Y-%m-%d"},
+    )
+
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert list(results[desired_metric.id][0]) == [
+        False,
+        False,
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_map_match_json_schema_pd():
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": ['{"a": 1}', '{"a": "1"}', '{"a": 1}', "{}", None]})
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.match_json_schema.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "json_schema": {
+                "type": "object",
+                "properties": {"a": {"type": "integer"}},
+                "required": ["a"],
+            }
+        },
+    )
+
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert list(results[desired_metric.id][0]) == [False, True, False, True]
+
+
 def test_map_unique_spark(spark_session):
     engine = _build_spark_engine(
         pd.DataFrame(
@@ -443,6 +501,28 @@ def test_map_unique_sa(sa):
     assert results[desired_metric.id] == [(3, "baz"), (3, "qux")]
 
 
+def test_map_unique_sa_unexpected_count_does_not_create_temp_tables(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 3, 3, None]}), sa)
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.unique.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"unexpected_condition": condition_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+
+    assert results[desired_metric.id] == 3
+    assert sa.inspect(engine.engine).get_table_names() == ["test"]
+
+
 def test_z_score_under_threshold_pd():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
     engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
@@ -955,3 +1035,82 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
         ):
             found_message = True
     assert found_message
+
+
+def test_median_and_quantile_metrics_share_distribution_summary_sa(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 5, 2, 4, 3, 6, None]}), sa)
+    median = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    quantiles = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": (0.0, 0.25, 0.5, 0.75, 1.0),
+            "allow_relative_error": True,
+        },
+    )
+    off_grid_quantiles = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": (0.333,), "allow_relative_error": False},
+    )
+
+    dependencies = [
+        get_metric_provider(metric.metric_name, engine)[0]._get_evaluation_dependencies(
+            metric, execution_engine=engine
+        )
+        for metric in (median, quantiles, off_grid_quantiles)
+    ]
+    # sqlite has no approximate percentile functions, so that all metrics share the exact summary
+    assert (
+        dependencies[0]["column.distribution_summary"].id
+        == dependencies[1]["column.distribution_summary"].id
+    )
+    assert "column.distribution_summary" not in dependencies[2]
+
+    results = Validator(execution_engine=engine).get_metrics(
+        {"median": median, "quantiles": quantiles}
+    )
+    assert results == {"median": 3.5, "quantiles": [1, 2, 3, 5, 6]}
+
+
+def test_distribution_summary_values_use_native_percentile_disc(sa):
+    dialect = sa.dialects.mssql.dialect()
+    sqlalchemy_engine = mock.Mock()
+    sqlalchemy_engine.execute.return_value.fetchone.return_value = (1, 3)
+    values_at_positions = _get_values_at_positions(
+        column=sa.column("a"),
+        positions=[0, 2],
+        nonnull_count=4,
+        dialect=dialect,
+        selectable=sa.table("test"),
+        sqlalchemy_engine=sqlalchemy_engine,
+    )
+
+    assert values_at_positions == {0: 1, 2: 3}
+    query = str(sqlalchemy_engine.execute.call_args[0][0].compile(dialect=dialect))
+    assert "percentile_disc" in query
+    assert "row_number" not in query
+    assert "TOP" in query
+
+    # Values are read by their row numbers if percentile_disc fails
+    sqlalchemy_engine = mock.Mock()
+    sqlalchemy_engine.execute.side_effect = [
+        sa.exc.ProgrammingError("SELECT", {}, Exception("unsupported")),
+        mock.Mock(fetchall=mock.Mock(return_value=[(0, 1), (2, 3)])),
+    ]
+    values_at_positions = _get_values_at_positions(
+        column=sa.column("a"),
+        positions=[0, 2],
+        nonnull_count=4,
+        dialect=dialect,
+        selectable=sa.table("test"),
+        sqlalchemy_engine=sqlalchemy_engine,
+    )
+
+    assert values_at_positions == {0: 1, 2: 3}
+    query = str(sqlalchemy_engine.execute.call_args[0][0].compile(dialect=dialect))
+    assert "row_number" in query
@@ -1,5 +1,6 @@
 import os
 
+import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
@@ -83,6 +84,19 @@ def test_BasicDatasetProfiler():
     assert expected_expectations.issubset(added_expectations)
 
 
+def test_BasicDatasetProfiler_with_sketches():
+    df = pd.DataFrame({"x": [1, 2, 3, 3, None], "y": ["a", "b", "a", "b", "c"]})
+
+    expectations_config, evr_config = BasicDatasetProfiler.profile(PandasDataset(df))
+    sketch_expectations_config, sketch_evr_config = BasicDatasetProfiler.profile(
+        PandasDataset(df), profiler_configuration={"use_sketches": True}
+    )
+
+    assert [
+        (e.expectation_type, e.kwargs) for e in sketch_expectations_config.expectations
+    ] == [(e.expectation_type, e.kwargs) for e in expectations_config.expectations]
+
+
 def test_BasicDatasetProfiler_null_column():
     """
     The profiler should determine that null columns are of null cardinality and of null type and
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import PandasDataset, SqlAlchemyDataset
+from great_expectations.profile.sketches import (
+    ColumnSketch,
+    HyperLogLog,
+    KllSketch,
+    SpaceSavingSketch,
+    TableSketch,
+    build_table_sketch,
+)
+
+
+@pytest.fixture
+def random_integers():
+    return pd.Series(np.random.RandomState(0).randint(0, 50000, 200000))
+
+
+def test_hyperloglog_estimate_is_within_its_error(random_integers):
+    hll = HyperLogLog()
+    hll.update(random_integers)
+
+    exact = random_integers.nunique()
+    assert abs(hll.estimate() - exact) <= 3 * hll.relative_error * exact
+
+
+def test_hyperloglog_counts_equal_values_of_different_dtypes_alike():
+    hll = HyperLogLog()
+    hll.update(pd.Series([1, 2, 3]))
+    hll.update(pd.Series([1.0, 2.0, 3.0]))
+
+    assert round(hll.estimate()) == 3
+
+
+def test_hyperloglog_merge_equals_single_pass(random_integers):
+    hll = HyperLogLog()
+    hll.update(random_integers)
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(random_integers.iloc[:100000])
+    right.update(random_integers.iloc[100000:])
+
+    assert left.merge(right).estimate() == hll.estimate()
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(precision=10))
+
+
+def test_kll_sketch_is_exact_until_it_compacts():
+    kll = KllSketch(k=200)
+    kll.update(np.arange(100, dtype=float))
+
+    assert kll.is_exact
+    assert kll.rank_error == 0
+    assert kll.get_values_at_ranks([0, 49, 99]) == [0, 49, 99]
+
+
+def test_kll_sketch_ranks_are_within_its_error(random_integers):
+    kll = KllSketch(random_seed=0)
+    for start in range(0, len(random_integers), 10000):
+        kll.update(random_integers.iloc[start : start + 10000].to_numpy(dtype=float))
+
+    assert not kll.is_exact
+    assert kll.count == len(random_integers)
+    sorted_values = np.sort(random_integers.to_numpy())
+    for rank in [0, 10000, 100000, 190000]:
+        [value] = kll.get_values_at_ranks([rank])
+        value_rank = np.searchsorted(sorted_values, value)
+        assert abs(value_rank - rank) <= kll.rank_error * len(random_integers)
+
+
+def test_space_saving_sketch_is_exact_within_capacity():
+    sketch = SpaceSavingSketch(capacity=3)
+    sketch.update(pd.Series(["a", "b", "a"]).value_counts())
+    other = SpaceSavingSketch(capacity=3)
+    other.update(pd.Series(["c", "a"]).value_counts())
+    sketch.merge(other)
+
+    assert sketch.is_exact
+    assert sketch.get_distinct_values() == ["a", "b", "c"]
+    assert sketch.get_top_values(1) == [("a", 3)]
+
+    sketch.update(pd.Series(["d"]).value_counts())
+
+    assert not sketch.is_exact
+    assert sketch.get_distinct_values() is None
+    assert sketch.get_top_values(1) == [("a", 3)]
+
+
+def test_column_sketch_statistics_match_pandas():
+    values = pd.Series([4.0, None, 1.0, 3.0, 2.0, 2.0, None, 7.5])
+    sketch = ColumnSketch("x")
+    sketch.update(values.iloc[:3])
+    sketch.update(values.iloc[3:])
+
+    assert sketch.count == 8
+    assert sketch.nonnull_count == 6
+    assert sketch.is_numeric
+    assert sketch.min == 1.0
+    assert sketch.max == 7.5
+    assert abs(sketch.mean - values.mean()) <= sketch.mean_error
+    assert sketch.stdev == pytest.approx(values.std())
+    assert sketch.distinct_values == [1.0, 2.0, 3.0, 4.0, 7.5]
+    assert sketch.get_unique_counts() == (5, 5 / 6)
+    assert sketch.get_median_bounds() == [values.median(), values.median()]
+    for quantile, (lower, upper) in zip(
+        [0.25, 0.5, 0.75], sketch.get_quantile_bounds([0.25, 0.5, 0.75])
+    ):
+        assert lower <= values.quantile(quantile, interpolation="lower") <= upper
+
+
+def test_column_sketch_of_non_numeric_values():
+    sketch = ColumnSketch("x")
+    sketch.update(pd.Series(["a", "b", None]))
+
+    assert not sketch.is_numeric
+    assert sketch.min is None
+    assert sketch.get_quantile_bounds([0.5]) is None
+    assert sketch.distinct_values == ["a", "b"]
+
+
+def test_column_sketch_distinct_count_bounds_beyond_top_k(random_integers):
+    sketch = ColumnSketch("x", sketch_config={"top_k": 100})
+    sketch.update(random_integers)
+
+    exact = random_integers.nunique()
+    lower, upper = sketch.get_distinct_count_bounds()
+    assert sketch.distinct_values is None
+    assert lower <= exact <= upper
+
+
+def test_table_sketch_merge_equals_single_pass():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", None]})
+    sketch = TableSketch(["a", "b"])
+    sketch.update(df)
+    left, right = TableSketch(["a", "b"]), TableSketch(["a", "b"])
+    left.update(df.iloc[:2])
+    right.update(df.iloc[2:])
+    left.merge(right)
+
+    assert left.row_count == sketch.row_count == 4
+    assert left.columns["a"].min == 1
+    assert left.columns["a"].max == 4
+    assert left.columns["b"].nonnull_count == 3
+    assert left.columns["b"].distinct_values == sketch.columns["b"].distinct_values
+
+
+def test_build_table_sketch_from_pandas_dataset():
+    dataset = PandasDataset({"a": [1, 2, 3, 4, 5], "b": ["x", "y", "x", "y", "z"]})
+    sketch = build_table_sketch(dataset, columns=["b"], sketch_config={"chunk_size": 2})
+
+    assert sketch.row_count == 5
+    assert list(sketch.columns) == ["b"]
+    assert sketch.columns["b"].distinct_values == ["x", "y", "z"]
+
+    with pytest.raises(ValueError):
+        build_table_sketch(dataset, sketch_config={"chunk_size": 0})
+
+
+def test_build_table_sketch_from_sqlalchemy_dataset_selects_only_sketched_columns(
+    sa,
+):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]}).to_sql(
+        "test", engine, index=False
+    )
+    dataset = SqlAlchemyDataset("test", engine=engine)
+    statements = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    sketch = build_table_sketch(dataset, columns=["b"])
+    assert sketch.row_count == 3
+    assert list(sketch.columns) == ["b"]
+    assert sketch.columns["b"].distinct_values == ["x", "y"]
+
+    sketch = build_table_sketch(dataset)
+    assert list(sketch.columns) == ["a", "b"]
+    assert sketch.columns["a"].max == 3
+
+    assert not any("*" in statement for statement in statements)
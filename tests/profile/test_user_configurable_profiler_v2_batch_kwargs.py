@@ -542,3 +542,34 @@ def test_column_cardinality_functions(cardinality_dataset):
         OrderedProfilerCardinality.get_basic_column_cardinality(pct_unique=0.5)
     )
     assert cardinality_with_large_pct_and_no_num.name == "NONE"
+
+
+def test_profiler_with_sketches_matches_profiler_without_sketches(cardinality_dataset):
+    """
+    What does this test do and why?
+    Confirms that a suite built from sketches has the same expectations as a suite built by evaluating expectations,
+    and passes when validated against the dataset it was built from
+    """
+    profiler = UserConfigurableProfiler(
+        cardinality_dataset,
+        ignored_columns=["col_none"],
+        primary_or_compound_key=["col_unique"],
+        value_set_threshold="unique",
+    )
+    suite = profiler.build_suite()
+
+    sketch_profiler = UserConfigurableProfiler(
+        cardinality_dataset,
+        ignored_columns=["col_none"],
+        primary_or_compound_key=["col_unique"],
+        value_set_threshold="unique",
+        use_sketches=True,
+        sketch_config={"chunk_size": 300},
+    )
+    sketch_suite = sketch_profiler.build_suite()
+
+    assert sketch_profiler.column_info == profiler.column_info
+    assert {
+        (e.expectation_type, e.kwargs.get("column")) for e in sketch_suite.expectations
+    } == {(e.expectation_type, e.kwargs.get("column")) for e in suite.expectations}
+    assert cardinality_dataset.validate(expectation_suite=sketch_suite).success
@@ -16,7 +16,10 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
-from great_expectations.render.renderer.site_builder import SiteBuilder
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    SiteBuilder,
+)
 
 
 def assert_how_to_buttons(
@@ -494,6 +497,128 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+def test_configuration_driven_site_builder_incremental_build(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, full_index_links_dict = site_builder.build()
+
+    incremental_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        **local_site_config
+    )
+    rendered_resources = []
+    for site_section_builder in incremental_site_builder.site_section_builders.values():
+        renderer = site_section_builder.renderer_class
+        renderer.render = (
+            lambda render: lambda resource, *args, **kwargs: rendered_resources.append(
+                resource
+            )
+            or render(resource, *args, **kwargs)
+        )(renderer.render)
+
+    _, index_links_dict = incremental_site_builder.build()
+    assert incremental_site_builder.target_store.read_site_manifest() is not None
+    for section_links in ["expectations_links", "profiling_links"]:
+        assert sorted(
+            link["filepath"] for link in index_links_dict[section_links]
+        ) == sorted(link["filepath"] for link in full_index_links_dict[section_links])
+    assert [
+        link["validation_success"] for link in index_links_dict["profiling_links"]
+    ] == [None] * len(index_links_dict["profiling_links"])
+    number_of_resources = len(rendered_resources)
+    assert number_of_resources == len(index_links_dict["expectations_links"]) + len(
+        index_links_dict["profiling_links"]
+    )
+
+    # Nothing changed: nothing is rendered again, and the index still links to every resource
+    _, index_links_dict = incremental_site_builder.build()
+    assert len(rendered_resources) == number_of_resources
+    assert len(index_links_dict["expectations_links"]) == len(
+        full_index_links_dict["expectations_links"]
+    )
+
+    # Only the changed suite is rendered again
+    expectation_suite_keys = sorted(
+        context.stores["expectations_store"].list_keys(), key=lambda key: key.to_tuple()
+    )
+    suite = context.get_expectation_suite(
+        expectation_suite_keys[0].expectation_suite_name
+    )
+    suite.meta["notes"] = "changed"
+    context.save_expectation_suite(suite)
+    incremental_site_builder.build()
+    assert len(rendered_resources) == number_of_resources + 1
+
+    # Removed suites are removed from the site and the index
+    context.stores["expectations_store"].remove_key(expectation_suite_keys[1])
+    _, index_links_dict = incremental_site_builder.build()
+    assert len(rendered_resources) == number_of_resources + 1
+    assert (
+        len(index_links_dict["expectations_links"]) == len(expectation_suite_keys) - 1
+    )
+    assert expectation_suite_keys[1] not in {
+        ExpectationSuiteIdentifier.from_tuple(suite_tuple)
+        for suite_tuple in incremental_site_builder.target_store.store_backends[
+            ExpectationSuiteIdentifier
+        ].list_keys()
+    }
+
+
+class SiteSectionBuilderWithoutManifest(DefaultSiteSectionBuilder):
+    def build(self, resource_identifiers=None):
+        super().build(resource_identifiers=resource_identifiers)
+
+
+def test_configuration_driven_site_builder_incremental_build_with_section_builder_without_manifest(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, full_index_links_dict = site_builder.build()
+
+    # Section builders whose build method takes no manifest rebuild their section in full
+    incremental_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        **{
+            **local_site_config,
+            "site_section_builders": {
+                "expectations": {
+                    "module_name": "tests.render.test_data_documentation_site_builder",
+                    "class_name": "SiteSectionBuilderWithoutManifest",
+                }
+            },
+        }
+    )
+    for _ in range(2):
+        _, index_links_dict = incremental_site_builder.build()
+        for section_links in ["expectations_links", "profiling_links"]:
+            assert sorted(
+                link["filepath"] for link in index_links_dict[section_links]
+            ) == sorted(
+                link["filepath"] for link in full_index_links_dict[section_links]
+            )
+
+
 @pytest.mark.rendered_output
 def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder_data_context_with_html_store_titanic_random,
@@ -8,7 +8,10 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
-from great_expectations.exceptions import InvalidDataContextKeyError
+from great_expectations.exceptions import (
+    GreatExpectationsError,
+    InvalidDataContextKeyError,
+)
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core import ExpectColumnMaxToBeBetween
@@ -18,6 +21,7 @@ from great_expectations.expectations.core.expect_column_value_z_scores_to_be_les
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
+    MetricEdge,
     ValidationGraph,
 )
 from great_expectations.validator.validator import Validator
@@ -126,6 +130,53 @@ def test_populate_dependencies():
     assert len(graph.edges) == 10
 
 
+def test_populate_dependencies_shares_metrics_across_expectations():
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine)
+    graph = ValidationGraph()
+    for threshold in [2, 4]:
+        configuration = ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": "a",
+                "mostly": 0.9,
+                "threshold": threshold,
+                "double_sided": True,
+            },
+        )
+        validation_dependencies = get_expectation_impl(
+            "expect_column_value_z_scores_to_be_less_than"
+        )(configuration).get_validation_dependencies(configuration, engine)
+        for metric_configuration in validation_dependencies["metrics"].values():
+            validator.build_metric_dependency_graph(
+                graph, metric_configuration, configuration, execution_engine=engine
+            )
+
+    # The z-score map is shared by both expectations, so it is a single node depended on by both thresholds' metrics
+    z_score_map_ids = [
+        metric_id
+        for metric_id in graph.nodes
+        if metric_id[0] == "column_values.z_score.map"
+    ]
+    assert len(z_score_map_ids) == 1
+    assert len(graph.get_dependent_ids(z_score_map_ids[0])) == 2
+    assert len(graph.edges) == len({edge.id for edge in graph.edges})
+
+
+def test_resolve_validation_graph_with_circular_dependency():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [1, 2, 3]}))
+    validator = Validator(execution_engine=engine)
+    mean = MetricConfiguration("column.mean", {"column": "a"})
+    max = MetricConfiguration("column.max", {"column": "a"})
+    graph = ValidationGraph()
+    graph.add(MetricEdge(mean, max))
+    graph.add(MetricEdge(max, mean))
+
+    with pytest.raises(GreatExpectationsError):
+        validator.resolve_validation_graph(graph, metrics=dict())
+
+
 def test_populate_dependencies_with_incorrect_metric_name():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectationConfiguration = ExpectationConfiguration(